@@ -1,9 +1,9 @@
 import click
 
-from create_github_project.commands import build
+from create_github_project.commands import build, LazyGroup
 
 
-@click.group(help='Command line tool to create templated Git project.')
+@click.group(cls=LazyGroup, help='Command line tool to create templated Git project.')
 def cli() -> None:
     """CLI のエントリーポイント。
     """
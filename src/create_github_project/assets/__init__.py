@@ -1,5 +1,7 @@
 from .asset_manager import AssetManager
+from .engines import GitEngine
 
 __all__ = [
-    'AssetManager'
+    'AssetManager',
+    'GitEngine'
 ]
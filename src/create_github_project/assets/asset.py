@@ -7,13 +7,16 @@ class Asset:
     Args:
         src (Path): 元となるテンプレートを格納するディレクトリ
         destination (Path): Git のルートディレクトリから見たリソースの配置先
+        normalize_newline (bool): テンプレート以外のファイルについても、末尾の空白文字を改行 1 つに置き換えるかどうか
     """
 
     def __init__(self,
                  src: Path,
-                 destination: str):
+                 destination: str,
+                 normalize_newline: bool = False):
         self._src = src
         self._destination = destination
+        self._normalize_newline = normalize_newline
 
     @property
     def source(self) -> Path:
@@ -24,3 +27,8 @@ class Asset:
     def destination(self) -> str:
         """str: Git リポジトリへのリソース格納先"""
         return self._destination
+
+    @property
+    def normalize_newline(self) -> bool:
+        """bool: テンプレート以外のファイルについても、末尾の空白文字を改行 1 つに置き換えるかどうか"""
+        return self._normalize_newline
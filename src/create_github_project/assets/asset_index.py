@@ -0,0 +1,216 @@
+import hashlib
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from typing import Dict, List, Tuple, Union
+
+from create_github_project import __version__ as VERSION
+from create_github_project.const import CACHE_DIR
+
+from . import plumbing
+
+#: テンプレートの拡張子
+TEMPLATE_SUFFIX = '.jinja'
+#: リポジトリへの配置対象外とするファイル名の接頭辞
+EXCLUDE_PREFIX = 'EXCLUDE'
+
+
+class IndexEntry:
+    """テンプレート格納先に含まれる、配置対象のファイル 1 つ分の情報。
+
+    Args:
+        path (str): テンプレート格納先からの相対パス
+        size (int): ファイルサイズ
+        mtime_ns (int): 最終更新日時 (ナノ秒)
+        digest (str): ファイルの内容を blob とした場合の SHA-1
+    """
+
+    def __init__(self, path: str, size: int, mtime_ns: int, digest: str) -> None:
+        self._path = path
+        self._size = size
+        self._mtime_ns = mtime_ns
+        self._digest = digest
+
+    @property
+    def path(self) -> str:
+        """str: テンプレート格納先からの相対パス"""
+        return self._path
+
+    @property
+    def template(self) -> bool:
+        """bool: テンプレートかどうか"""
+        return self._path.endswith(TEMPLATE_SUFFIX)
+
+    @property
+    def size(self) -> int:
+        """int: ファイルサイズ"""
+        return self._size
+
+    @property
+    def mtime_ns(self) -> int:
+        """int: 最終更新日時 (ナノ秒)"""
+        return self._mtime_ns
+
+    @property
+    def digest(self) -> str:
+        """str: ファイルの内容を blob とした場合の SHA-1"""
+        return self._digest
+
+
+class AssetIndex:
+    """テンプレート格納先ごとの、配置対象のファイルの索引を管理するクラス。
+
+    索引はテンプレート格納先を初めて利用した際に作成し、ディスクにキャッシュする。
+    キャッシュの利用時はディレクトリとファイルの stat 情報のみを比較するため、
+    ディレクトリの走査やファイルの読み込みを行わない。また、同一プロセス内では検証も 1 度のみとする。
+    """
+
+    #: キャッシュ格納先
+    DIRECTORY = CACHE_DIR.joinpath('indexes')
+
+    _indexes: Dict[str, List[IndexEntry]] = {}
+    _fingerprints: Dict[str, str] = {}
+
+    @classmethod
+    def get(cls, src_root: Path) -> List[IndexEntry]:
+        """テンプレート格納先の索引を返す。
+
+        Args:
+            src_root (Path): テンプレート格納先
+
+        Returns:
+            List[IndexEntry]: 配置対象のファイルの一覧。相対パスの昇順に並ぶ。
+        """
+        root = src_root.resolve().as_posix()
+        if root in cls._indexes:
+            return cls._indexes[root]
+
+        cache = cls.DIRECTORY.joinpath(hashlib.sha256(f'{VERSION}\0{root}'.encode()).hexdigest() + '.pickle')
+        dirs, entries = cls._load(cache) or ({}, [])
+        if not cls._validate(Path(root), dirs, entries):
+            dirs, entries = cls._build(Path(root), entries)
+            cls._dump(cache, (dirs, entries))
+
+        cls._indexes[root] = entries
+        return entries
+
+    @classmethod
+    def fingerprint(cls, src_root: Path) -> str:
+        """テンプレート格納先に含まれるテンプレート全体のハッシュ値を返す。
+
+        テンプレートは同じ格納先の他のテンプレートを include できるため、
+        置換結果が変わり得るかどうかはテンプレート全体で判断する。
+
+        Args:
+            src_root (Path): テンプレート格納先
+
+        Returns:
+            str: ハッシュ値
+        """
+        root = src_root.resolve().as_posix()
+        if root not in cls._fingerprints:
+            sha = hashlib.sha1()
+            for e in cls.get(src_root):
+                if e.template:
+                    sha.update(f'{e.path}\0{e.digest}\0'.encode())
+            cls._fingerprints[root] = sha.hexdigest()
+        return cls._fingerprints[root]
+
+    @classmethod
+    def clear(cls) -> None:
+        """メモリ上の索引を破棄する。
+        """
+        cls._indexes = {}
+        cls._fingerprints = {}
+
+    @staticmethod
+    def _build(root: Path, previous: List[IndexEntry]) -> Tuple[Dict[str, int], List[IndexEntry]]:
+        """索引を作成する。
+
+        stat 情報が変わっていないファイルは、以前の索引のハッシュ値を再利用する。
+
+        Args:
+            root (Path): テンプレート格納先
+            previous (List[IndexEntry]): 以前の索引
+
+        Returns:
+            Tuple[Dict[str, int], List[IndexEntry]]: ディレクトリの最終更新日時と、配置対象のファイルの一覧
+        """
+        known = {(e.path, e.size, e.mtime_ns): e.digest for e in previous}
+
+        dirs = {}
+        entries = []
+        for d, _, names in os.walk(root):
+            rel_dir = Path(d).relative_to(root).as_posix()
+            dirs[rel_dir] = os.stat(d).st_mtime_ns
+            for name in names:
+                if name.startswith(EXCLUDE_PREFIX):
+                    continue
+                path = name if rel_dir == '.' else f'{rel_dir}/{name}'
+                st = os.stat(root.joinpath(path))
+                digest = known.get((path, st.st_size, st.st_mtime_ns)) or plumbing.hash_blob(root.joinpath(path)).hex()
+                entries.append(IndexEntry(path, st.st_size, st.st_mtime_ns, digest))
+
+        entries.sort(key=lambda e: e.path)
+        return dirs, entries
+
+    @staticmethod
+    def _validate(root: Path, dirs: Dict[str, int], entries: List[IndexEntry]) -> bool:
+        """索引がテンプレート格納先の現在の状態と一致するかを検証する。
+
+        ファイルの追加、削除はディレクトリの最終更新日時、ファイルの変更はファイルの stat 情報から検出する。
+
+        Args:
+            root (Path): テンプレート格納先
+            dirs (Dict[str, int]): ディレクトリの最終更新日時
+            entries (List[IndexEntry]): 配置対象のファイルの一覧
+
+        Returns:
+            bool: 一致する場合は True
+        """
+        if not dirs:
+            return False
+        try:
+            for d, mtime_ns in dirs.items():
+                if os.stat(root.joinpath(d)).st_mtime_ns != mtime_ns:
+                    return False
+            for e in entries:
+                st = os.stat(root.joinpath(e.path))
+                if st.st_size != e.size or st.st_mtime_ns != e.mtime_ns:
+                    return False
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _load(path: Path) -> Union[Tuple[Dict[str, int], List[IndexEntry]], None]:
+        """キャッシュを読み込む。
+
+        Args:
+            path (Path): キャッシュのパス
+
+        Returns:
+            Union[Tuple[Dict[str, int], List[IndexEntry]], None]: キャッシュした索引。読み込めない場合は None。
+        """
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    @classmethod
+    def _dump(cls, path: Path, index: Tuple[Dict[str, int], List[IndexEntry]]) -> None:
+        """キャッシュを保存する。保存に失敗した場合でも、処理は継続する。
+
+        Args:
+            path (Path): キャッシュのパス
+            index (Tuple[Dict[str, int], List[IndexEntry]]): 索引
+        """
+        try:
+            os.makedirs(cls.DIRECTORY, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cls.DIRECTORY, suffix='.tmp', delete=False) as f:
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, path)
+        except OSError:
+            pass
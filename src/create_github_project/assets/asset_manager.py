@@ -1,11 +1,17 @@
 import os
 from pathlib import Path
-from typing import Dict, List
-
-import git
-from jinja2 import Environment, FileSystemLoader
+import shutil
+from typing import Dict, Iterator, List, Tuple, Union
 
+from . import plumbing
 from .asset import Asset
+from .asset_index import AssetIndex, IndexEntry
+from .engines import GitEngine
+from .repo_state import RepoState
+from .sinks import BaseSink, DirectorySink
+from .stream import copy_file, read_chunks, write_chunks
+from .template_cache import TemplateCache
+from create_github_project.const import DEFAULT_THEME
 
 
 class AssetManager:
@@ -19,12 +25,16 @@ class AssetManager:
         commit_types (List[str]): CHANGELOG に含める commit type
         reviewers (Dict[str, Dict[str, str]]): リリース時のレビュアー
         parameters (Dict[str, object]): その他 template 用パラメータ
+        engine (GitEngine): リポジトリ作成に利用する処理
+        theme (str): 配置するテーマ
     """
 
     #: 開発用ブランチ
     DEVELOP = 'develop'
     #: リポジトリ初期化時のコミットメッセージ
     COMMIT_MESSAGE = 'chore: initialize repository'
+    #: テーマとの再同期時のコミットメッセージ
+    SYNC_COMMIT_MESSAGE = 'chore: sync repository with theme'
 
     def __init__(self,
                  repo_dir: Path,
@@ -33,10 +43,14 @@ class AssetManager:
                  production: str,
                  commit_types: List[str],
                  reviewers: Dict[str, Dict[str, str]],
-                 parameters: Dict[str, object]) -> None:
+                 parameters: Dict[str, object],
+                 engine: GitEngine = GitEngine.GITPYTHON,
+                 theme: str = DEFAULT_THEME) -> None:
         # リポジトリ情報
         self._repo_dir = repo_dir
         self._production = production
+        self._engine = engine
+        self._theme = theme
         # テンプレートのパラメータ
         self._template_parameter = {
             'repo_name': repo_name,
@@ -46,6 +60,44 @@ class AssetManager:
             'reviewers': reviewers,
             'inputs': parameters
         }
+        # 配置したファイルの、Git のルートディレクトリからの相対パスと blob の SHA-1 の対応
+        self._digests = {}
+        # 配置したファイルの、Git のルートディレクトリからの相対パスと配置元の識別子の対応
+        self._sources = {}
+        # ファイルの書き込み先
+        self._sink: BaseSink = DirectorySink(repo_dir)
+
+    @property
+    def template_parameter(self) -> Dict[str, object]:
+        """Dict[str, object]: テンプレートのパラメータ"""
+        return dict(self._template_parameter)
+
+    @classmethod
+    def from_parameters(cls,
+                        repo_dir: Path,
+                        template_parameter: Dict[str, object],
+                        engine: GitEngine = GitEngine.GITPYTHON,
+                        theme: str = DEFAULT_THEME) -> 'AssetManager':
+        """確定済みのテンプレートのパラメータから、インスタンスを作成する。
+
+        Args:
+            repo_dir (Path): リポジトリ作成先のパス
+            template_parameter (Dict[str, object]): テンプレートのパラメータ
+            engine (GitEngine): リポジトリ作成に利用する処理
+            theme (str): 配置するテーマ
+
+        Returns:
+            AssetManager: インスタンス
+        """
+        return cls(repo_dir,
+                   template_parameter['changelog_urls'],
+                   template_parameter['repo_name'],
+                   template_parameter['production_branch'],
+                   template_parameter['commit_types'],
+                   template_parameter['reviewers'],
+                   template_parameter['inputs'],
+                   engine,
+                   theme)
 
     def initialize(self, assets: List[Asset]) -> None:
         """Git リポジトリを初期化する。
@@ -54,61 +106,263 @@ class AssetManager:
             assets (List[Asset]): 配置対象のリソース
         """
         # checkout
-        repo = git.Repo.init(self._repo_dir)
-        repo.git.checkout(b=self._production)
+        engine = self._engine.value(self._repo_dir, self._production, self.DEVELOP)
+        engine.init()
+
+        paths = self.render(assets, DirectorySink(self._repo_dir))
+
+        # commit to production branch and create develop branch
+        # テンプレートの置換結果のハッシュ値は、書き込み時に計算したものを利用する
+        engine.commit(paths, self.COMMIT_MESSAGE, self._digests)
 
+    def render(self, assets: List[Asset], sink: BaseSink) -> List[str]:
+        """Git リポジトリを作成せずに、配置対象のファイルを書き込み先に書き込む。
+
+        再同期のため、配置したファイルの状態 (RepoState) も合わせて書き込む。
+        書き込み先の close は呼び出し元で行う。
+
+        Args:
+            assets (List[Asset]): 配置対象のリソース
+            sink (BaseSink): ファイルの書き込み先
+
+        Returns:
+            List[str]: 書き込んだファイルの、Git のルートディレクトリからの相対パス
+        """
+        paths = []
+        self._sink = sink
+        self._digests = {}
+        self._sources = {}
         for a in assets:
             src_root = a.source
             dest = Path(self._repo_dir.as_posix() + '/' + a.destination)
 
-            self.deploy_files(repo, src_root, dest)
+            paths.extend(self.deploy_files(src_root, dest, a.normalize_newline))
+
+        # 再同期のため、配置したファイルの状態を保存する
+        state = RepoState(self._template_parameter, {
+            path: (source, self._digests[path].hex()) for path, source in self._sources.items()
+        }, theme=self._theme)
+        self._digests[RepoState.FILE_NAME] = sink.write(RepoState.FILE_NAME, [state.dumps()])
+        paths.append(RepoState.FILE_NAME)
 
-        # commit to production branch
-        repo.index.commit(self.COMMIT_MESSAGE)
-        # create develop branch
-        repo.git.checkout(self._production, b=self.DEVELOP)
+        return paths
 
-    def deploy_files(self, repo: git.Repo, src_root: Path, dest: Path):
-        """Git リポジトリにファイルを配置し index に登録する。
+    def deploy_files(self, src_root: Path, dest: Path, normalize_newline: bool = False) -> List[str]:
+        """Git リポジトリにファイルを配置する。
 
-        このメソッドでは、src_root 以下のファイルを再帰的に探索し、Git リポジトリに配置していく。
+        このメソッドでは、src_root 以下のファイルを索引 (AssetIndex) から取得し、Git リポジトリに配置していく。
         なお、ファイル名に応じて、下記の処理を行う。
 
         1. 拡張子が .jinja である場合       : テンプレートの置換処理
         1. ファイル名が EXCLUDE で始まる場合 : リポジトリへの配置を skip
 
+        ファイルは書き込み先 (BaseSink) に書き込む。render から呼び出された場合以外は、リポジトリ作成先のディレクトリに書き込む。
+        テンプレートの置換結果は、末尾の空白文字を改行 1 つに置き換えて配置する。
+        テンプレート以外のファイルは、normalize_newline が真の場合のみ同様に置き換え、
+        それ以外の場合はバイナリファイルも扱えるよう内容を変更せずにコピーする。
+
+        index への登録は、ファイル毎に index を書き換えないよう呼び出し元でまとめて行う。
+
         Args:
-            repo (git.Repo): git repository
-            src_root (Path):
+            src_root (Path): テンプレートを格納するディレクトリ
             dest (Path): ファイル配置先
+            normalize_newline (bool): テンプレート以外のファイルについても、末尾の空白文字を改行 1 つに置き換えるかどうか
+
+        Returns:
+            List[str]: 配置したファイルの、Git のルートディレクトリからの相対パス
         """
-        env = Environment(loader=FileSystemLoader(src_root.as_posix()))
+        paths = []
+
+        for entry in AssetIndex.get(src_root):
+            # output file path
+            output = self._output_path(dest, entry)
+            path = output.relative_to(self._repo_dir).as_posix()
+
+            # write file
+            chunks = self._chunks(src_root, entry, normalize_newline)
+            if chunks is None:
+                self._sink.copy(path, src_root.joinpath(entry.path))
+                self._digests[path] = bytes.fromhex(entry.digest)
+            else:
+                self._digests[path] = self._sink.write(path, chunks)
+            self._sources[path] = self._source_key(src_root, entry, normalize_newline)
+
+            paths.append(path)
+
+        return paths
+
+    def sync(self, assets: List[Asset], force: bool = False) -> Tuple[List[str], List[str], List[str]]:
+        """既存の Git リポジトリを、現在のテーマと再同期する。
+
+        リポジトリに保存された状態 (RepoState) と比較し、配置元またはパラメータが変わったファイルのみを再度置換する。
+        置換結果が現在のファイルと異なる場合のみ書き込み、変更をまとめて 1 つの commit にする。
+        前回の配置以降にユーザーが編集したファイルは、force が真でない限り上書きせずに競合として返す。
+        テーマから削除されたファイルは、編集されていない場合のみリポジトリから削除する。
+        commit はインスタンスの作成時に指定した処理 (GitEngine) で行う。
+
+        Args:
+            assets (List[Asset]): 配置対象のリソース
+            force (bool): ユーザーが編集したファイルも上書き、削除するかどうか
+
+        Returns:
+            Tuple[List[str], List[str], List[str]]: 更新したファイル、削除したファイル、競合したファイルの、
+            Git のルートディレクトリからの相対パス
+
+        Raises:
+            FileNotFoundError: リポジトリに状態が保存されていない場合
+            ValueError: 保存された状態の形式が不正な場合、リポジトリの状態が commit する処理に対応していない場合
+        """
+        state = RepoState.load(self._repo_dir)
+        parameters = RepoState.parameters_digest(self._template_parameter)
+
+        # ファイルを変更する前に、リポジトリが commit する処理に対応しているかどうかを確認する
+        engine = self._engine.value(self._repo_dir, self._production, self.DEVELOP)
+        engine.open()
+
+        # 配置対象のファイル。同じパスに複数のファイルを配置する場合は、後の asset を優先する。
+        targets = {}
+        for a in assets:
+            dest = Path(self._repo_dir.as_posix() + '/' + a.destination)
+            for entry in AssetIndex.get(a.source):
+                output = self._output_path(dest, entry)
+                targets[output.relative_to(self._repo_dir).as_posix()] = (a.source, entry, a.normalize_newline)
 
-        for src in src_root.glob('**/*'):
-            if src.is_dir():
+        files = {}
+        updated, removed, conflicts = [], [], []
+        for path, (src_root, entry, normalize_newline) in targets.items():
+            source = self._source_key(src_root, entry, normalize_newline)
+            stored = state.files.get(path)
+            # 配置元とパラメータが変わっていなければ、置換結果も変わらない
+            if stored is not None and stored[0] == source and (not entry.template or state.digest == parameters):
+                files[path] = stored
                 continue
-            if src.name.startswith('EXCLUDE'):
+
+            output = self._repo_dir.joinpath(path)
+            current = plumbing.hash_blob(output).hex() if output.is_file() else None
+
+            # 一時ファイルに置換した上で、現在のファイルと比較する
+            tmp = output.parent.joinpath(f'.{output.name}.sync')
+            os.makedirs(output.parent, exist_ok=True)
+            if self._write_file(src_root, entry, tmp, normalize_newline):
+                digest = entry.digest
+            else:
+                digest = plumbing.hash_blob(tmp).hex()
+
+            if current == digest:
+                os.remove(tmp)
+                files[path] = (source, digest)
+                continue
+            if current is not None and not force and (stored is None or current != stored[1]):
+                os.remove(tmp)
+                conflicts.append(path)
+                if stored is not None:
+                    files[path] = stored
                 continue
 
-            # output file path
-            output = dest.joinpath(src.relative_to(src_root))
+            if current is not None:
+                shutil.copymode(output, tmp)
+            os.replace(tmp, output)
+            files[path] = (source, digest)
+            updated.append(path)
 
-            # read data with rendering if necessary
-            data = None
-            if src.suffix != '.jinja':
-                with open(src, 'r') as f:
-                    data = f.read()
+        # テーマから削除されたファイル
+        for path, (_, digest) in state.files.items():
+            output = self._repo_dir.joinpath(path)
+            if path in targets or not output.is_file():
+                continue
+            if force or plumbing.hash_blob(output).hex() == digest:
+                os.remove(output)
+                removed.append(path)
             else:
-                template_path = src.relative_to(src_root).as_posix()
-                template = env.get_template(template_path)
-                data = template.render(**self._template_parameter)
-                # drop extension .jinja
-                output = output.parent.joinpath(output.stem)
+                conflicts.append(path)
 
-            # write file and add to index
-            os.makedirs(output.parent, exist_ok=True)
-            with open(output, 'w') as f:
-                f.write(data.rstrip() + '\n')
+        new_state = RepoState(self._template_parameter, files, theme=self._theme)
+        changed = new_state.files != state.files or new_state.digest != state.digest or new_state.theme != state.theme
+        if updated or removed or changed:
+            new_state.dump(self._repo_dir)
+
+            # 置換結果のハッシュ値は、比較時に計算したものを利用する
+            engine.update(updated + [RepoState.FILE_NAME],
+                          removed,
+                          self.SYNC_COMMIT_MESSAGE,
+                          {path: bytes.fromhex(files[path][1]) for path in updated})
+
+        return sorted(updated), sorted(removed), sorted(conflicts)
+
+    def _write_file(self, src_root: Path, entry: IndexEntry, output: Path, normalize_newline: bool) -> bool:
+        """ファイルを 1 つ配置する。
+
+        Args:
+            src_root (Path): テンプレートを格納するディレクトリ
+            entry (IndexEntry): 配置するファイル
+            output (Path): 配置先のパス
+            normalize_newline (bool): テンプレート以外のファイルについても、末尾の空白文字を改行 1 つに置き換えるかどうか
+
+        Returns:
+            bool: 内容を変更せずにコピーした場合は True
+        """
+        chunks = self._chunks(src_root, entry, normalize_newline)
 
-            # add to index
-            repo.index.add([output.relative_to(self._repo_dir).as_posix()])
+        # write file
+        os.makedirs(output.parent, exist_ok=True)
+        if chunks is None:
+            copy_file(src_root.joinpath(entry.path), output)
+            return True
+        write_chunks(output, chunks)
+        return False
+
+    def _chunks(self, src_root: Path, entry: IndexEntry, normalize_newline: bool) -> Union[Iterator[str], None]:
+        """配置するファイルの内容を返す。
+
+        大きなファイルでもメモリ使用量が増えないよう、内容は一定の大きさごとに読み込む。
+
+        Args:
+            src_root (Path): テンプレートを格納するディレクトリ
+            entry (IndexEntry): 配置するファイル
+            normalize_newline (bool): テンプレート以外のファイルについても、末尾の空白文字を改行 1 つに置き換えるかどうか
+
+        Returns:
+            Union[Iterator[str], None]: ファイルの内容。内容を変更せずにコピーする場合は None。
+        """
+        # read data with rendering if necessary
+        if entry.template:
+            template = TemplateCache.get_template(src_root, entry.path)
+            return template.generate(**self._template_parameter)
+        if normalize_newline:
+            return read_chunks(src_root.joinpath(entry.path))
+        return None
+
+    @staticmethod
+    def _output_path(dest: Path, entry: IndexEntry) -> Path:
+        """ファイルの配置先のパスを返す。
+
+        Args:
+            dest (Path): ファイル配置先のディレクトリ
+            entry (IndexEntry): 配置するファイル
+
+        Returns:
+            Path: 配置先のパス
+        """
+        output = dest.joinpath(entry.path)
+        if entry.template:
+            # drop extension .jinja
+            output = output.parent.joinpath(output.stem)
+        return output
+
+    @staticmethod
+    def _source_key(src_root: Path, entry: IndexEntry, normalize_newline: bool) -> str:
+        """ファイルの配置元の識別子を返す。
+
+        識別子が変わらない限り、同じパラメータに対する配置結果は変わらない。
+
+        Args:
+            src_root (Path): テンプレートを格納するディレクトリ
+            entry (IndexEntry): 配置するファイル
+            normalize_newline (bool): テンプレート以外のファイルについても、末尾の空白文字を改行 1 つに置き換えるかどうか
+
+        Returns:
+            str: 配置元の識別子
+        """
+        if entry.template:
+            return f'template:{AssetIndex.fingerprint(src_root)}'
+        return f'{"normalized" if normalize_newline else "static"}:{entry.digest}'
@@ -0,0 +1,135 @@
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Union
+
+from create_github_project.const import CACHE_DIR
+
+from . import plumbing
+
+#: objects ディレクトリ以下のディレクトリ名 (SHA-1 の先頭 2 文字) に利用される文字
+HEXDIGITS = frozenset('0123456789abcdef')
+
+
+class BlobStore:
+    """複数のリポジトリで共有する、blob の loose object のキャッシュ。
+
+    blob は内容の SHA-1 をキーとして、圧縮済みの loose object の形式でキャッシュし、
+    各リポジトリの objects ディレクトリにはハードリンク (作成できない場合はコピー) で配置する。
+    これにより、同じテーマから作成する複数のリポジトリで同一のファイルを配置する場合に、圧縮処理を 1 度に抑える。
+    テンプレートの置換結果も、置換結果が同一であれば同様に圧縮処理を省略する。
+
+    また、SHA-1 が既知のファイル (テンプレート格納先の索引に含まれる、内容を変更せずにコピーしたファイル) は、
+    リポジトリ毎のハッシュ値の計算も省略する。
+    """
+
+    #: キャッシュ格納先。.git ディレクトリと同じ構成で、objects ディレクトリ以下に loose object を格納する。
+    #: 圧縮中の一時ファイルは、objects ディレクトリではなく tmp ディレクトリに作成する。
+    DIRECTORY = CACHE_DIR.joinpath('blobs')
+    #: キャッシュの合計サイズの上限 (byte)
+    MAX_SIZE = 256 * 1024 * 1024
+
+    @classmethod
+    def write_blob(cls, git_dir: Path, path: Path, digest: Union[bytes, None] = None) -> bytes:
+        """ファイルの内容を blob としてリポジトリに書き込む。
+
+        キャッシュへの書き込みに失敗した場合は、リポジトリに直接書き込む。
+
+        Args:
+            git_dir (Path): .git ディレクトリのパス
+            path (Path): 対象ファイル
+            digest (Union[bytes, None]): 既知の場合、blob の SHA-1 (バイナリ)
+
+        Returns:
+            bytes: blob の SHA-1 (バイナリ)
+        """
+        binsha = digest or plumbing.hash_blob(path)
+        try:
+            os.makedirs(cls.DIRECTORY.joinpath('objects'), exist_ok=True)
+            os.makedirs(cls.DIRECTORY.joinpath('tmp'), exist_ok=True)
+            # 圧縮はキャッシュに存在しない場合のみ行う
+            if not cls._path(cls.DIRECTORY, binsha).exists():
+                plumbing.write_blob(cls.DIRECTORY, path, cls.DIRECTORY.joinpath('tmp'))
+            cls._link(git_dir, binsha)
+        except OSError:
+            return plumbing.write_blob(git_dir, path)
+
+        return binsha
+
+    @classmethod
+    def evict(cls) -> None:
+        """キャッシュの合計サイズが上限以下になるまで、最後に利用された日時が古いものから削除する。
+
+        リポジトリに配置済みのオブジェクトは、ハードリンクのため削除されない。
+        全てのオブジェクトの stat を取得するため、リポジトリ毎ではなく、一括作成の完了時などにまとめて 1 度呼び出す。
+        """
+        entries = []
+        objects = cls.DIRECTORY.joinpath('objects')
+        try:
+            fanouts = [d for d in os.listdir(objects) if len(d) == 2 and all(c in HEXDIGITS for c in d)]
+        except OSError:
+            fanouts = []
+        for d in fanouts:
+            try:
+                names = os.listdir(objects.joinpath(d))
+            except OSError:
+                # 他のプロセスによる作成途中などで、ディレクトリでない場合
+                continue
+            for name in names:
+                try:
+                    st = os.stat(objects.joinpath(d, name))
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, objects.joinpath(d, name)))
+
+        total = sum(e[1] for e in entries)
+        for _, size, path in sorted(entries):
+            if total <= cls.MAX_SIZE:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    @staticmethod
+    def _path(git_dir: Path, binsha: bytes) -> Path:
+        """loose object のパスを返す。
+
+        Args:
+            git_dir (Path): .git ディレクトリのパス
+            binsha (bytes): オブジェクトの SHA-1 (バイナリ)
+
+        Returns:
+            Path: loose object のパス
+        """
+        hexsha = binsha.hex()
+        return git_dir.joinpath('objects', hexsha[:2], hexsha[2:])
+
+    @classmethod
+    def _link(cls, git_dir: Path, binsha: bytes) -> None:
+        """キャッシュ済みの loose object をリポジトリに配置する。
+
+        Args:
+            git_dir (Path): .git ディレクトリのパス
+            binsha (bytes): オブジェクトの SHA-1 (バイナリ)
+        """
+        src = cls._path(cls.DIRECTORY, binsha)
+        dest = cls._path(git_dir, binsha)
+        if dest.exists():
+            return
+        os.makedirs(dest.parent, exist_ok=True)
+
+        # LRU のため、利用日時を更新する
+        os.utime(src)
+        try:
+            os.link(src, dest)
+        except OSError:
+            # ファイルシステムが異なる場合などはコピーする
+            with tempfile.NamedTemporaryFile(dir=git_dir.joinpath('objects'), delete=False) as tmp:
+                with open(src, 'rb') as f:
+                    shutil.copyfileobj(f, tmp)
+            os.chmod(tmp.name, 0o444)
+            os.replace(tmp.name, dest)
+
@@ -0,0 +1,193 @@
+from abc import ABCMeta, abstractmethod
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Union
+
+from . import plumbing
+from .blob_store import BlobStore
+
+
+class BaseEngine(metaclass=ABCMeta):
+    """Git リポジトリの作成と初回 commit、再同期時の commit を行う処理の基底クラス。
+
+    Args:
+        repo_dir (Path): リポジトリ作成先のパス
+        production (str): 本番用ブランチの名前
+        develop (str): 開発用ブランチの名前
+    """
+
+    def __init__(self, repo_dir: Path, production: str, develop: str) -> None:
+        self._repo_dir = repo_dir
+        self._production = production
+        self._develop = develop
+
+    @abstractmethod
+    def init(self) -> None:
+        """空のリポジトリを作成し、本番用ブランチを checkout する。
+        """
+        pass
+
+    @abstractmethod
+    def commit(self, paths: List[str], message: str, digests: Union[Dict[str, bytes], None] = None) -> None:
+        """配置済みのファイルを本番用ブランチに commit し、開発用ブランチを作成して checkout する。
+
+        Args:
+            paths (List[str]): Git のルートディレクトリからの相対パス
+            message (str): コミットメッセージ
+            digests (Union[Dict[str, bytes], None]): blob の SHA-1 (バイナリ) が既知のファイルの、相対パスと SHA-1 の対応
+        """
+        pass
+
+    @abstractmethod
+    def open(self) -> None:
+        """既存のリポジトリを開く。
+
+        作業ツリーのファイルを変更する前に呼び出し、リポジトリの状態が処理に対応しているかどうかを確認する。
+
+        Raises:
+            ValueError: リポジトリの状態が処理に対応していない場合
+        """
+        pass
+
+    @abstractmethod
+    def update(self,
+               paths: List[str],
+               removed: List[str],
+               message: str,
+               digests: Union[Dict[str, bytes], None] = None) -> None:
+        """open で開いたリポジトリで、更新したファイルと削除したファイルを現在のブランチに commit する。
+
+        Args:
+            paths (List[str]): 更新したファイルの、Git のルートディレクトリからの相対パス
+            removed (List[str]): 削除したファイルの、Git のルートディレクトリからの相対パス
+            message (str): コミットメッセージ
+            digests (Union[Dict[str, bytes], None]): blob の SHA-1 (バイナリ) が既知のファイルの、相対パスと SHA-1 の対応
+        """
+        pass
+
+
+class GitPythonEngine(BaseEngine):
+    """GitPython (git コマンド) を利用する処理。
+    """
+
+    def init(self) -> None:
+        # plumbing を利用する場合に GitPython の import を省略するため、利用時に import する
+        import git
+
+        self._repo = git.Repo.init(self._repo_dir)
+        self._repo.git.checkout(b=self._production)
+
+    def commit(self, paths: List[str], message: str, digests: Union[Dict[str, bytes], None] = None) -> None:
+        # add to index at once
+        self._repo.index.add(paths)
+
+        # commit to production branch
+        self._repo.index.commit(message)
+        # create develop branch
+        self._repo.git.checkout(self._production, b=self._develop)
+
+    def open(self) -> None:
+        # plumbing を利用する場合に GitPython の import を省略するため、利用時に import する
+        import git
+
+        self._repo = git.Repo(self._repo_dir)
+
+    def update(self,
+               paths: List[str],
+               removed: List[str],
+               message: str,
+               digests: Union[Dict[str, bytes], None] = None) -> None:
+        self._repo.index.add(paths)
+        if removed:
+            self._repo.index.remove(removed)
+        self._repo.index.commit(message)
+
+
+class PlumbingEngine(BaseEngine):
+    """git コマンドを利用せず、オブジェクトと参照を直接書き込む処理。
+
+    blob、tree、commit と本番用/開発用ブランチの参照、index を Python から直接書き込むため、
+    リポジトリ作成時にサブプロセスを起動しない。
+    blob は BlobStore を経由して書き込み、複数のリポジトリで同一のファイルの圧縮処理を省略する。
+    BlobStore のキャッシュの削除は、呼び出し元で全てのリポジトリの作成後に 1 度行う。
+    """
+
+    def init(self) -> None:
+        self._git_dir = plumbing.init_repository(self._repo_dir, self._production)
+
+    def commit(self, paths: List[str], message: str, digests: Union[Dict[str, bytes], None] = None) -> None:
+        digests = digests or {}
+        entries = {}
+        for path in paths:
+            src = self._repo_dir.joinpath(path)
+            entries[path] = (plumbing.file_mode(src), BlobStore.write_blob(self._git_dir, src, digests.get(path)))
+
+        tree = plumbing.write_tree(self._git_dir, entries)
+        commit = plumbing.write_commit(self._git_dir, tree, message)
+
+        # 本番用ブランチと開発用ブランチは同じ commit を指す
+        plumbing.write_ref(self._git_dir, self._production, commit)
+        plumbing.write_ref(self._git_dir, self._develop, commit)
+        plumbing.set_head(self._git_dir, self._develop)
+        plumbing.write_index(self._git_dir, self._repo_dir, entries)
+
+    def open(self) -> None:
+        self._git_dir = self._repo_dir.joinpath('.git')
+        if not self._git_dir.is_dir():
+            raise ValueError(f'{self._git_dir.as_posix()} is not a directory.')
+        self._branch, self._parent = plumbing.read_head(self._git_dir)
+        self._entries = plumbing.read_index(self._git_dir)
+
+    def update(self,
+               paths: List[str],
+               removed: List[str],
+               message: str,
+               digests: Union[Dict[str, bytes], None] = None) -> None:
+        # 開いた時点の index を元に、更新したファイルと削除したファイルのみを書き換える
+        digests = digests or {}
+        entries = dict(self._entries)
+        for path in removed:
+            entries.pop(path, None)
+        for path in paths:
+            src = self._repo_dir.joinpath(path)
+            entries[path] = (plumbing.file_mode(src), BlobStore.write_blob(self._git_dir, src, digests.get(path)))
+
+        tree = plumbing.write_tree(self._git_dir, entries)
+        parents = [self._parent] if self._parent is not None else []
+        commit = plumbing.write_commit(self._git_dir, tree, message, parents)
+        plumbing.write_ref(self._git_dir, self._branch, commit)
+        plumbing.write_index(self._git_dir, self._repo_dir, entries)
+
+
+class GitEngine(Enum):
+    """リポジトリ作成に利用する処理を管理する列挙体。
+    """
+
+    #: GitPython (git コマンド) を利用する
+    GITPYTHON = GitPythonEngine
+    #: オブジェクトを直接書き込む
+    PLUMBING = PlumbingEngine
+
+    @classmethod
+    def find(cls, name: str) -> 'GitEngine':
+        """name に合致する列挙子を返す。
+
+        Returns:
+            GitEngine: 列挙子
+
+        Raises:
+            ValueError: 不正な名前が指定された場合
+        """
+        for e in cls:
+            if e.name.lower() == name:
+                return e
+        raise ValueError(f'Git engine `{name}` is not supported.')
+
+    @classmethod
+    def names(cls) -> List[str]:
+        """列挙子の名前の一覧を返す。
+
+        Returns:
+            List[str]: 名前の一覧
+        """
+        return [e.name.lower() for e in cls]
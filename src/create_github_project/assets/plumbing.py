@@ -0,0 +1,431 @@
+import configparser
+from functools import lru_cache
+import getpass
+import hashlib
+import os
+from pathlib import Path
+import socket
+import struct
+import tempfile
+import time
+from typing import Dict, List, Tuple, Union
+import zlib
+
+#: ファイル読み込み時のチャンクサイズ
+CHUNK_SIZE = 1024 * 1024
+
+#: 通常ファイルのモード
+MODE_FILE = 0o100644
+#: 実行可能ファイルのモード
+MODE_EXECUTABLE = 0o100755
+#: ディレクトリのモード
+MODE_TREE = 0o40000
+
+#: index の各フィールドに格納可能な最大値
+_UINT32 = 0xFFFFFFFF
+
+
+def init_repository(repo_dir: Path, head: str) -> Path:
+    """git コマンドを利用せずに、空の Git リポジトリを作成する。
+
+    Args:
+        repo_dir (Path): リポジトリ作成先
+        head (str): HEAD が指すブランチ名
+
+    Returns:
+        Path: .git ディレクトリのパス
+    """
+    git_dir = repo_dir.joinpath('.git')
+    for d in ['objects/info', 'objects/pack', 'refs/heads', 'refs/tags', 'info']:
+        os.makedirs(git_dir.joinpath(d), exist_ok=True)
+
+    with open(git_dir.joinpath('config'), 'w') as f:
+        f.write('\n'.join([
+            '[core]',
+            '\trepositoryformatversion = 0',
+            '\tfilemode = true',
+            '\tbare = false',
+            '\tlogallrefupdates = true',
+            ''
+        ]))
+    with open(git_dir.joinpath('description'), 'w') as f:
+        f.write("Unnamed repository; edit this file 'description' to name the repository.\n")
+    set_head(git_dir, head)
+
+    return git_dir
+
+
+def write_object(git_dir: Path, type_: str, data: bytes) -> bytes:
+    """オブジェクトを loose object として書き込む。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+        type_ (str): オブジェクトの種別 (blob, tree, commit)
+        data (bytes): オブジェクトの内容
+
+    Returns:
+        bytes: オブジェクトの SHA-1 (バイナリ)
+    """
+    raw = f'{type_} {len(data)}'.encode() + b'\0' + data
+    binsha = hashlib.sha1(raw).digest()
+    _store(git_dir, binsha, [zlib.compress(raw)])
+    return binsha
+
+
+def write_blob(git_dir: Path, path: Path, tmp_dir: Union[Path, None] = None) -> bytes:
+    """ファイルの内容を blob として書き込む。
+
+    ファイルはチャンク単位で読み込むため、ファイルサイズに依らずメモリ使用量は一定となる。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+        path (Path): 対象ファイル
+        tmp_dir (Union[Path, None]): 一時ファイルの作成先。None の場合は objects ディレクトリに作成する。
+
+    Returns:
+        bytes: blob の SHA-1 (バイナリ)
+    """
+    size = os.stat(path).st_size
+    header = f'blob {size}'.encode() + b'\0'
+    sha = hashlib.sha1(header)
+    compressor = zlib.compressobj()
+
+    tmp_dir = tmp_dir or git_dir.joinpath('objects')
+    with open(path, 'rb') as src, tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False) as tmp:
+        tmp.write(compressor.compress(header))
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+            sha.update(chunk)
+            tmp.write(compressor.compress(chunk))
+        tmp.write(compressor.flush())
+
+    binsha = sha.digest()
+    _install(git_dir, binsha, Path(tmp.name))
+    return binsha
+
+
+def hash_blob(path: Path) -> bytes:
+    """ファイルの内容を blob とした場合の SHA-1 を、書き込みを行わずに計算する。
+
+    Args:
+        path (Path): 対象ファイル
+
+    Returns:
+        bytes: blob の SHA-1 (バイナリ)
+    """
+    size = os.stat(path).st_size
+    sha = hashlib.sha1(f'blob {size}'.encode() + b'\0')
+    with open(path, 'rb') as src:
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+            sha.update(chunk)
+    return sha.digest()
+
+
+def write_tree(git_dir: Path, entries: Dict[str, Tuple[int, bytes]]) -> bytes:
+    """ファイルの一覧から tree を再帰的に書き込む。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+        entries (Dict[str, Tuple[int, bytes]]): Git のルートディレクトリからの相対パスと、モードと blob の SHA-1
+
+    Returns:
+        bytes: ルートの tree の SHA-1 (バイナリ)
+    """
+    root = {}
+    for path, entry in entries.items():
+        *dirs, name = path.split('/')
+        node = root
+        for d in dirs:
+            node = node.setdefault(d, {})
+        node[name] = entry
+    return _write_tree_node(git_dir, root)
+
+
+def _write_tree_node(git_dir: Path, node: Dict[str, object]) -> bytes:
+    """ディレクトリ 1 つ分の tree を書き込む。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+        node (Dict[str, object]): ディレクトリ内のファイル、またはサブディレクトリ
+
+    Returns:
+        bytes: tree の SHA-1 (バイナリ)
+    """
+    items = []
+    for name, value in node.items():
+        if isinstance(value, dict):
+            # tree の並び順では、ディレクトリ名は末尾に '/' を付与して比較する
+            items.append(((name + '/').encode(), name, MODE_TREE, _write_tree_node(git_dir, value)))
+        else:
+            items.append((name.encode(), name, value[0], value[1]))
+    items.sort(key=lambda x: x[0])
+
+    data = b''.join(f'{mode:o} {name}'.encode() + b'\0' + binsha for _, name, mode, binsha in items)
+    return write_object(git_dir, 'tree', data)
+
+
+def write_commit(git_dir: Path, tree: bytes, message: str, parents: Union[List[bytes], None] = None) -> bytes:
+    """commit を書き込む。
+
+    author と committer は git コマンドと同様に、環境変数、Git の設定ファイルの順に参照する。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+        tree (bytes): ルートの tree の SHA-1 (バイナリ)
+        message (str): コミットメッセージ
+        parents (Union[List[bytes], None]): 親 commit の SHA-1 (バイナリ)
+
+    Returns:
+        bytes: commit の SHA-1 (バイナリ)
+    """
+    now = int(time.time())
+    offset = -(time.altzone if time.localtime(now).tm_isdst > 0 else time.timezone)
+    tz = '{}{:02d}{:02d}'.format('+' if offset >= 0 else '-', abs(offset) // 3600, abs(offset) // 60 % 60)
+
+    lines = [f'tree {tree.hex()}']
+    lines += [f'parent {p.hex()}' for p in parents or []]
+    for role in ['author', 'committer']:
+        name, email = get_identity(role)
+        lines.append(f'{role} {name} <{email}> {now} {tz}')
+
+    data = '\n'.join(lines) + '\n\n' + message.rstrip('\n') + '\n'
+    return write_object(git_dir, 'commit', data.encode())
+
+
+def write_ref(git_dir: Path, branch: str, commit: bytes) -> None:
+    """ブランチが commit を指すように更新する。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+        branch (str): ブランチ名
+        commit (bytes): commit の SHA-1 (バイナリ)
+    """
+    path = git_dir.joinpath('refs/heads').joinpath(branch)
+    os.makedirs(path.parent, exist_ok=True)
+    _write_atomic(path, (commit.hex() + '\n').encode())
+
+
+def set_head(git_dir: Path, branch: str) -> None:
+    """HEAD がブランチを指すように更新する。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+        branch (str): ブランチ名
+    """
+    _write_atomic(git_dir.joinpath('HEAD'), f'ref: refs/heads/{branch}\n'.encode())
+
+
+def write_index(git_dir: Path, repo_dir: Path, entries: Dict[str, Tuple[int, bytes]]) -> None:
+    """作業ツリーのファイルを登録した index (version 2) を書き込む。
+
+    stat 情報には作業ツリーのファイルの値を利用するため、書き込み後のリポジトリは clean な状態となる。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+        repo_dir (Path): 作業ツリーのルートディレクトリ
+        entries (Dict[str, Tuple[int, bytes]]): Git のルートディレクトリからの相対パスと、モードと blob の SHA-1
+    """
+    chunks = [b'DIRC', struct.pack('>LL', 2, len(entries))]
+    for path in sorted(entries.keys(), key=lambda x: x.encode()):
+        mode, binsha = entries[path]
+        st = os.lstat(repo_dir.joinpath(path))
+        name = path.encode()
+        data = struct.pack(
+            '>LLLLLLLLLL',
+            int(st.st_ctime) & _UINT32, st.st_ctime_ns % 1000000000,
+            int(st.st_mtime) & _UINT32, st.st_mtime_ns % 1000000000,
+            st.st_dev & _UINT32, st.st_ino & _UINT32,
+            mode, st.st_uid & _UINT32, st.st_gid & _UINT32, st.st_size & _UINT32
+        ) + binsha + struct.pack('>H', min(len(name), 0xFFF)) + name
+        # エントリは 1 ~ 8 バイトの NUL で 8 バイト境界に揃える
+        chunks.append(data + b'\0' * (8 - len(data) % 8))
+
+    content = b''.join(chunks)
+    _write_atomic(git_dir.joinpath('index'), content + hashlib.sha1(content).digest())
+
+
+def read_index(git_dir: Path) -> Dict[str, Tuple[int, bytes]]:
+    """index (version 2, 3) に登録されたファイルを読み込む。
+
+    拡張データは読み飛ばす。write_index で書き直した場合に内容が失われるエントリを含む index は扱わない。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+
+    Returns:
+        Dict[str, Tuple[int, bytes]]: Git のルートディレクトリからの相対パスと、モードと blob の SHA-1
+
+    Raises:
+        ValueError: index の形式が不正な場合、対応していない形式の場合
+    """
+    try:
+        with open(git_dir.joinpath('index'), 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return {}
+
+    if data[:4] != b'DIRC' or hashlib.sha1(data[:-20]).digest() != data[-20:]:
+        raise ValueError('Index file is broken.')
+    version, count = struct.unpack('>LL', data[4:12])
+    if version not in (2, 3):
+        raise ValueError(f'Index version {version} is not supported.')
+
+    entries = {}
+    pos = 12
+    for _ in range(count):
+        mode, = struct.unpack('>L', data[pos + 24:pos + 28])
+        binsha = data[pos + 40:pos + 60]
+        flags, = struct.unpack('>H', data[pos + 60:pos + 62])
+        # assume-valid、拡張フラグ (skip-worktree など)、マージ中のステージを持つエントリは扱わない
+        if flags & 0xF000:
+            raise ValueError('Index entries with flags or merge stages are not supported.')
+        end = data.index(b'\0', pos + 62)
+        entries[data[pos + 62:end].decode()] = (mode, binsha)
+        # エントリは 1 ~ 8 バイトの NUL で 8 バイト境界に揃えられている
+        pos += (end - pos + 8) & ~7
+
+    # 分割された index、sparse index は扱わない。それ以外の拡張データはキャッシュのため読み飛ばす
+    while pos < len(data) - 20:
+        signature = data[pos:pos + 4]
+        if signature in (b'link', b'sdir'):
+            raise ValueError(f'Index extension `{signature.decode()}` is not supported.')
+        size, = struct.unpack('>L', data[pos + 4:pos + 8])
+        pos += 8 + size
+
+    return entries
+
+
+def read_head(git_dir: Path) -> Tuple[str, Union[bytes, None]]:
+    """HEAD が指すブランチと commit を返す。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+
+    Returns:
+        Tuple[str, Union[bytes, None]]: ブランチ名と、commit の SHA-1 (バイナリ)。commit が無い場合は None。
+
+    Raises:
+        ValueError: HEAD がブランチを指していない場合
+    """
+    with open(git_dir.joinpath('HEAD'), 'r') as f:
+        head = f.read().strip()
+    if not head.startswith('ref: refs/heads/'):
+        raise ValueError('HEAD does not point to a branch.')
+    ref = head[len('ref: '):]
+
+    try:
+        with open(git_dir.joinpath(ref), 'r') as f:
+            return ref[len('refs/heads/'):], bytes.fromhex(f.read().strip())
+    except FileNotFoundError:
+        pass
+
+    # loose ref が無い場合は packed-refs を参照する
+    try:
+        with open(git_dir.joinpath('packed-refs'), 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) == 2 and fields[1] == ref:
+                    return ref[len('refs/heads/'):], bytes.fromhex(fields[0])
+    except FileNotFoundError:
+        pass
+    return ref[len('refs/heads/'):], None
+
+
+def file_mode(path: Path) -> int:
+    """作業ツリーのファイルに対応する Git のモードを返す。
+
+    Args:
+        path (Path): 対象ファイル
+
+    Returns:
+        int: Git のモード
+    """
+    return MODE_EXECUTABLE if os.stat(path).st_mode & 0o111 else MODE_FILE
+
+
+@lru_cache(maxsize=None)
+def get_identity(role: str) -> Tuple[str, str]:
+    """commit の author、または committer の名前とメールアドレスを返す。
+
+    Args:
+        role (str): author、または committer
+
+    Returns:
+        Tuple[str, str]: 名前とメールアドレス
+    """
+    user = _read_user_config()
+    name = os.environ.get(f'GIT_{role.upper()}_NAME') or user.get('name') or getpass.getuser()
+    email = (os.environ.get(f'GIT_{role.upper()}_EMAIL') or user.get('email')
+             or f'{getpass.getuser()}@{socket.gethostname()}')
+    return name, email
+
+
+def _read_user_config() -> Dict[str, str]:
+    """Git の設定ファイルから user セクションの値を読み込む。
+
+    Returns:
+        Dict[str, str]: user セクションの値
+    """
+    home = Path(os.path.expanduser('~'))
+    xdg = Path(os.environ.get('XDG_CONFIG_HOME') or home.joinpath('.config'))
+    paths = [Path('/etc/gitconfig'), xdg.joinpath('git/config'), home.joinpath('.gitconfig')]
+    if os.environ.get('GIT_CONFIG_GLOBAL'):
+        paths = [Path('/etc/gitconfig'), Path(os.environ['GIT_CONFIG_GLOBAL'])]
+
+    user = {}
+    for path in paths:
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        try:
+            parser.read(path)
+        except (configparser.Error, OSError, UnicodeDecodeError):
+            continue
+        if parser.has_section('user'):
+            user.update({k: v.strip().strip('"') for k, v in parser.items('user')})
+    return user
+
+
+def _install(git_dir: Path, binsha: bytes, tmp: Path) -> None:
+    """一時ファイルに書き込んだオブジェクトを objects ディレクトリに配置する。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+        binsha (bytes): オブジェクトの SHA-1 (バイナリ)
+        tmp (Path): 圧縮済みのオブジェクトを書き込んだ一時ファイル
+    """
+    hexsha = binsha.hex()
+    dest = git_dir.joinpath('objects', hexsha[:2], hexsha[2:])
+    if dest.exists():
+        os.remove(tmp)
+        return
+    os.makedirs(dest.parent, exist_ok=True)
+    os.chmod(tmp, 0o444)
+    os.replace(tmp, dest)
+
+
+def _store(git_dir: Path, binsha: bytes, chunks: List[bytes]) -> None:
+    """圧縮済みのオブジェクトを objects ディレクトリに配置する。
+
+    Args:
+        git_dir (Path): .git ディレクトリのパス
+        binsha (bytes): オブジェクトの SHA-1 (バイナリ)
+        chunks (List[bytes]): 圧縮済みのオブジェクト
+    """
+    hexsha = binsha.hex()
+    if git_dir.joinpath('objects', hexsha[:2], hexsha[2:]).exists():
+        return
+    with tempfile.NamedTemporaryFile(dir=git_dir.joinpath('objects'), delete=False) as tmp:
+        for chunk in chunks:
+            tmp.write(chunk)
+    _install(git_dir, binsha, Path(tmp.name))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """ファイルを一時ファイル経由でアトミックに書き込む。
+
+    Args:
+        path (Path): 書き込み先
+        data (bytes): 書き込む内容
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+        tmp.write(data)
+    os.chmod(tmp.name, 0o644)
+    os.replace(tmp.name, path)
@@ -0,0 +1,135 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+from create_github_project import __version__ as VERSION
+from create_github_project.const import DEFAULT_THEME
+
+
+class RepoState:
+    """リポジトリに配置したファイルの状態を管理するクラス。
+
+    状態はリポジトリのルートディレクトリの `.create-github-project.json` に保存し、リポジトリに commit する。
+    各ファイルについて、配置元の識別子と配置した内容の blob の SHA-1 を保持し、
+    テーマ更新時の再同期で、変更されたファイルとユーザーが編集したファイルの判別に利用する。
+    また、確定済みのテンプレートのパラメータと利用したテーマも保持し、再同期時の対話的な入力やレビュアーの情報の取得を省略する。
+
+    Args:
+        parameters (Dict[str, object]): テンプレートのパラメータ
+        files (Dict[str, Tuple[str, str]]): Git のルートディレクトリからの相対パスと、配置元の識別子と blob の SHA-1
+        version (str): 状態を保存したツールのバージョン
+        digest (Union[str, None]): ファイルを配置した時点のパラメータのハッシュ値。None の場合は parameters から計算する。
+        theme (str): ファイルを配置したテーマ
+    """
+
+    #: 状態を保存するファイルの名前
+    FILE_NAME = '.create-github-project.json'
+
+    def __init__(self,
+                 parameters: Dict[str, object],
+                 files: Dict[str, Tuple[str, str]],
+                 version: str = VERSION,
+                 digest: Union[str, None] = None,
+                 theme: str = DEFAULT_THEME) -> None:
+        self._parameters = parameters
+        self._files = files
+        self._version = version
+        self._digest = digest or self.parameters_digest(parameters)
+        self._theme = theme
+
+    @property
+    def parameters(self) -> Dict[str, object]:
+        """Dict[str, object]: テンプレートのパラメータ"""
+        return self._parameters
+
+    @property
+    def digest(self) -> str:
+        """str: ファイルを配置した時点のパラメータのハッシュ値
+
+        保存後にパラメータが手動で編集された場合、parameters のハッシュ値とは一致しない。
+        """
+        return self._digest
+
+    @property
+    def files(self) -> Dict[str, Tuple[str, str]]:
+        """Dict[str, Tuple[str, str]]: Git のルートディレクトリからの相対パスと、配置元の識別子と blob の SHA-1"""
+        return self._files
+
+    @property
+    def version(self) -> str:
+        """str: 状態を保存したツールのバージョン"""
+        return self._version
+
+    @property
+    def theme(self) -> str:
+        """str: ファイルを配置したテーマ"""
+        return self._theme
+
+    @staticmethod
+    def parameters_digest(parameters: Dict[str, object]) -> str:
+        """テンプレートのパラメータのハッシュ値を返す。
+
+        Args:
+            parameters (Dict[str, object]): テンプレートのパラメータ
+
+        Returns:
+            str: ハッシュ値
+        """
+        data = json.dumps(parameters, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    @classmethod
+    def load(cls, repo_dir: Path) -> 'RepoState':
+        """リポジトリから状態を読み込む。
+
+        Args:
+            repo_dir (Path): リポジトリのルートディレクトリ
+
+        Returns:
+            RepoState: リポジトリの状態
+
+        Raises:
+            FileNotFoundError: 状態が保存されていない場合
+            ValueError: 状態の形式が不正な場合
+        """
+        with open(repo_dir.joinpath(cls.FILE_NAME), 'r') as f:
+            data = json.load(f)
+        try:
+            return cls(data['parameters'],
+                       {path: (v['source'], v['digest']) for path, v in data['files'].items()},
+                       data['version'],
+                       data['digest'],
+                       # テーマを保存していないバージョンで作成された場合は、デフォルトのテーマとみなす
+                       data.get('theme', DEFAULT_THEME))
+        except (KeyError, TypeError, AttributeError):
+            raise ValueError(f'Invalid format: {cls.FILE_NAME}')
+
+    def dump(self, repo_dir: Path) -> None:
+        """リポジトリに状態を保存する。
+
+        Args:
+            repo_dir (Path): リポジトリのルートディレクトリ
+        """
+        with open(repo_dir.joinpath(self.FILE_NAME), 'w') as f:
+            f.write(self.dumps())
+
+    def dumps(self) -> str:
+        """保存する内容を返す。
+
+        差分が読みやすいよう、キーを整列して整形した JSON とする。
+
+        Returns:
+            str: 保存する内容
+        """
+        data = {
+            'version': self._version,
+            'parameters': self._parameters,
+            'digest': self.digest,
+            'theme': self._theme,
+            'files': {
+                path: {'source': source, 'digest': digest}
+                for path, (source, digest) in sorted(self._files.items())
+            }
+        }
+        return json.dumps(data, indent=2, sort_keys=True) + '\n'
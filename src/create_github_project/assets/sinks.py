@@ -0,0 +1,185 @@
+from abc import ABCMeta, abstractmethod
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import tarfile
+import tempfile
+import time
+from typing import BinaryIO, Iterable
+import zipfile
+
+from . import plumbing
+from .stream import CHUNK_SIZE, copy_file, normalize_chunks, write_chunks
+
+#: 出力形式の一覧
+OUTPUT_FORMATS = ['git', 'dir', 'tar', 'zip']
+#: アーカイブ形式の出力形式の一覧
+ARCHIVE_FORMATS = ['tar', 'zip']
+
+
+class BaseSink(metaclass=ABCMeta):
+    """配置対象のファイルの書き込み先の基底クラス。
+
+    ファイルのパスは、いずれも Git のルートディレクトリからの相対パスで指定する。
+    """
+
+    @abstractmethod
+    def write(self, path: str, chunks: Iterable[str]) -> bytes:
+        """末尾の空白文字を改行 1 つに置き換えて、テキストを書き込む。
+
+        Args:
+            path (str): Git のルートディレクトリからの相対パス
+            chunks (Iterable[str]): 書き込むテキスト
+
+        Returns:
+            bytes: 書き込んだ内容の blob の SHA-1 (バイナリ)
+        """
+        pass
+
+    @abstractmethod
+    def copy(self, path: str, src: Path) -> None:
+        """ファイルの内容を変更せずに書き込む。
+
+        Args:
+            path (str): Git のルートディレクトリからの相対パス
+            src (Path): コピー元のパス
+        """
+        pass
+
+    def close(self) -> None:
+        """書き込みを完了する。
+        """
+        pass
+
+
+class DirectorySink(BaseSink):
+    """ディレクトリにファイルを書き込む。
+
+    Args:
+        root (Path): 書き込み先のディレクトリ
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    def write(self, path: str, chunks: Iterable[str]) -> bytes:
+        output = self._root.joinpath(path)
+        os.makedirs(output.parent, exist_ok=True)
+        write_chunks(output, chunks)
+        return plumbing.hash_blob(output)
+
+    def copy(self, path: str, src: Path) -> None:
+        output = self._root.joinpath(path)
+        os.makedirs(output.parent, exist_ok=True)
+        copy_file(src, output)
+
+
+class _ArchiveSink(BaseSink):
+    """アーカイブにファイルを書き込む処理の基底クラス。
+
+    アーカイブのエントリにはサイズが必要なため、テキストは一時ファイル (一定サイズまではメモリ上) に書き込んでから追加する。
+
+    Args:
+        fileobj (BinaryIO): 書き込み先。シーク不可能なストリームでもよい。
+    """
+
+    #: 一時ファイルをメモリ上に保持するサイズの上限
+    SPOOL_SIZE = 1024 * 1024
+
+    def __init__(self, fileobj: BinaryIO) -> None:
+        self._fileobj = fileobj
+        self._mtime = time.time()
+
+    def write(self, path: str, chunks: Iterable[str]) -> bytes:
+        with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE) as spool:
+            for chunk in normalize_chunks(chunks):
+                spool.write(chunk.encode())
+            size = spool.tell()
+
+            spool.seek(0)
+            sha = hashlib.sha1(f'blob {size}'.encode() + b'\0')
+            for chunk in iter(lambda: spool.read(CHUNK_SIZE), b''):
+                sha.update(chunk)
+
+            spool.seek(0)
+            self._add(path, spool, size, plumbing.MODE_FILE)
+        return sha.digest()
+
+    def copy(self, path: str, src: Path) -> None:
+        with open(src, 'rb') as f:
+            st = os.fstat(f.fileno())
+            self._add(path, f, st.st_size, plumbing.file_mode(src))
+
+    @abstractmethod
+    def _add(self, path: str, fileobj: BinaryIO, size: int, mode: int) -> None:
+        """アーカイブにエントリを追加する。
+
+        Args:
+            path (str): Git のルートディレクトリからの相対パス
+            fileobj (BinaryIO): エントリの内容
+            size (int): エントリのサイズ
+            mode (int): Git のモード
+        """
+        pass
+
+
+class TarSink(_ArchiveSink):
+    """tar アーカイブにファイルを書き込む。
+    """
+
+    def __init__(self, fileobj: BinaryIO) -> None:
+        super().__init__(fileobj)
+        # ストリームとして書き込み、書き込み先のシークを不要にする
+        self._tar = tarfile.open(fileobj=fileobj, mode='w|', format=tarfile.PAX_FORMAT)
+
+    def _add(self, path: str, fileobj: BinaryIO, size: int, mode: int) -> None:
+        info = tarfile.TarInfo(path)
+        info.size = size
+        info.mode = mode & 0o777
+        info.mtime = int(self._mtime)
+        self._tar.addfile(info, fileobj)
+
+    def close(self) -> None:
+        self._tar.close()
+
+
+class ZipSink(_ArchiveSink):
+    """zip アーカイブにファイルを書き込む。
+    """
+
+    def __init__(self, fileobj: BinaryIO) -> None:
+        super().__init__(fileobj)
+        self._zip = zipfile.ZipFile(fileobj, 'w', compression=zipfile.ZIP_DEFLATED)
+        self._date_time = time.localtime(self._mtime)[:6]
+
+    def _add(self, path: str, fileobj: BinaryIO, size: int, mode: int) -> None:
+        info = zipfile.ZipInfo(path, self._date_time)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = mode << 16
+        info.file_size = size
+        with self._zip.open(info, 'w') as dest:
+            shutil.copyfileobj(fileobj, dest, CHUNK_SIZE)
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+def open_sink(output_format: str, fileobj: BinaryIO) -> BaseSink:
+    """アーカイブ形式の出力先を作成する。
+
+    Args:
+        output_format (str): 出力形式 (tar, zip)
+        fileobj (BinaryIO): 書き込み先
+
+    Returns:
+        BaseSink: 出力先
+
+    Raises:
+        ValueError: アーカイブ形式でない出力形式が指定された場合
+    """
+    if output_format == 'tar':
+        return TarSink(fileobj)
+    if output_format == 'zip':
+        return ZipSink(fileobj)
+    raise ValueError(f'Output format `{output_format}` is not an archive format.')
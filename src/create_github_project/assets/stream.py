@@ -0,0 +1,134 @@
+import os
+from pathlib import Path
+import shutil
+from typing import BinaryIO, Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows
+    fcntl = None
+
+#: テキストファイル読み込み時のチャンクサイズ (文字数)
+CHUNK_SIZE = 1024 * 1024
+
+#: reflink を作成する ioctl のリクエスト番号 (Linux の FICLONE)
+FICLONE = 0x40049409
+
+
+def read_chunks(path: Path, size: int = CHUNK_SIZE) -> Iterator[str]:
+    """テキストファイルを一定の大きさごとに読み込む。
+
+    Args:
+        path (Path): 読み込むファイルのパス
+        size (int): チャンクサイズ (文字数)
+
+    Yields:
+        str: ファイルの内容
+    """
+    with open(path, 'r') as f:
+        while True:
+            chunk = f.read(size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def normalize_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """末尾の空白文字を改行 1 つに置き換えたテキストを、チャンクごとに返す。
+
+    返す内容は `''.join(chunks).rstrip() + '\\n'` と同一だが、テキスト全体をメモリ上に展開しない。
+    末尾の空白文字かどうかはそれ以降のチャンクを読むまで判断できないため、
+    チャンク末尾の空白文字のみを保留し、空白以外の文字が現れた時点で返す。
+
+    Args:
+        chunks (Iterable[str]): テキスト
+
+    Yields:
+        str: 置き換え後のテキスト
+    """
+    pending = ''
+    for chunk in chunks:
+        stripped = chunk.rstrip()
+        if not stripped:
+            pending += chunk
+            continue
+        if pending:
+            yield pending
+        yield stripped
+        pending = chunk[len(stripped):]
+    yield '\n'
+
+
+def write_chunks(path: Path, chunks: Iterable[str]) -> None:
+    """末尾の空白文字を改行 1 つに置き換えて、テキストをファイルに書き込む。
+
+    Args:
+        path (Path): 書き込み先のパス
+        chunks (Iterable[str]): 書き込むテキスト
+    """
+    with open(path, 'w') as f:
+        for chunk in normalize_chunks(chunks):
+            f.write(chunk)
+
+
+def copy_file(src: Path, dest: Path) -> None:
+    """ファイルの内容を変更せずにコピーする。
+
+    バイナリファイルも扱えるよう、内容はバイト列のまま扱う。コピーは下記の順に試行し、
+    カーネル内でのコピーが利用できる場合は、ユーザー空間へのデータの読み込みを省略する。
+
+    1. reflink (Btrfs、XFS などのコピーオンライト対応のファイルシステム)
+    1. copy_file_range
+    1. 通常の読み込みと書き込み
+
+    Args:
+        src (Path): コピー元のパス
+        dest (Path): コピー先のパス
+    """
+    with open(src, 'rb') as fsrc, open(dest, 'wb') as fdest:
+        if _reflink(fsrc, fdest) or _copy_file_range(fsrc, fdest):
+            return
+        shutil.copyfileobj(fsrc, fdest, CHUNK_SIZE)
+
+
+def _reflink(fsrc: BinaryIO, fdest: BinaryIO) -> bool:
+    """reflink によりファイルをコピーする。
+
+    Args:
+        fsrc (BinaryIO): コピー元
+        fdest (BinaryIO): コピー先
+
+    Returns:
+        bool: コピーできた場合は True
+    """
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(fdest.fileno(), FICLONE, fsrc.fileno())
+    except OSError:
+        return False
+    return True
+
+
+def _copy_file_range(fsrc: BinaryIO, fdest: BinaryIO) -> bool:
+    """copy_file_range によりファイルをコピーする。
+
+    Args:
+        fsrc (BinaryIO): コピー元
+        fdest (BinaryIO): コピー先
+
+    Returns:
+        bool: コピーできた場合は True。途中で失敗した場合は、それまでにコピーした内容を破棄して False を返す。
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    try:
+        while os.copy_file_range(fsrc.fileno(), fdest.fileno(), CHUNK_SIZE * 8):
+            pass
+    except OSError:
+        fsrc.seek(0)
+        fdest.seek(0)
+        fdest.truncate()
+        return False
+    return True
@@ -0,0 +1,151 @@
+import fnmatch
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+from typing import Callable, Tuple, Union
+
+from jinja2 import BaseLoader, Environment, FileSystemLoader, Template
+from jinja2.bccache import Bucket, FileSystemBytecodeCache
+
+from create_github_project.const import CACHE_DIR
+
+#: テンプレート名における、テンプレート格納先と相対パスの区切り文字
+DELIMITER = '::'
+
+
+class LRUBytecodeCache(FileSystemBytecodeCache):
+    """サイズ上限付きの、コンパイル済みテンプレートのキャッシュ。
+
+    キャッシュはテンプレートのパスと内容のハッシュ値をキーとして保存する。
+    合計サイズが上限を超えた場合は、最後に利用された日時が古いものから削除する。
+
+    Args:
+        directory (Path): キャッシュ格納先
+        max_size (int): キャッシュの合計サイズの上限 (byte)
+    """
+
+    def __init__(self, directory: Path, max_size: int) -> None:
+        os.makedirs(directory, exist_ok=True)
+        super().__init__(directory.as_posix())
+        self._max_size = max_size
+
+    def get_bucket(self, environment: Environment, name: str, filename: Union[str, None], source: str) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        key = hashlib.sha1(f'{self.get_cache_key(name, filename)}|{checksum}'.encode()).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        super().load_bytecode(bucket)
+        if bucket.code is None:
+            return
+        # LRU のため、利用日時を更新する
+        try:
+            os.utime(self._get_cache_filename(bucket))
+        except OSError:
+            pass
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        # 並列実行時に他のプロセスが書き込み途中のファイルを読まないよう、一時ファイル経由で書き込む
+        name = self._get_cache_filename(bucket)
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix='.tmp', delete=False) as f:
+            bucket.write_bytecode(f)
+        os.replace(f.name, name)
+        self.evict()
+
+    def evict(self) -> None:
+        """キャッシュの合計サイズが上限以下になるまで、古いキャッシュを削除する。
+        """
+        entries = []
+        for name in fnmatch.filter(os.listdir(self.directory), self.pattern % ('*',)):
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+
+        total = sum(e[1] for e in entries)
+        for _, size, name in sorted(entries):
+            if total <= self._max_size:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+
+class _AssetLoader(BaseLoader):
+    """`<テンプレート格納先>::<相対パス>` 形式の名前でテンプレートを読み込むローダー。
+    """
+
+    def __init__(self) -> None:
+        self._loaders = {}
+
+    def get_source(self, environment: Environment, template: str) -> Tuple[str, str, Callable[[], bool]]:
+        root, _, name = template.partition(DELIMITER)
+        if root not in self._loaders:
+            self._loaders[root] = FileSystemLoader(root)
+        return self._loaders[root].get_source(environment, name)
+
+
+class _SharedEnvironment(Environment):
+    """複数のテンプレート格納先で共有する Environment。
+
+    テンプレート内の include などで指定される相対パスは、呼び出し元と同じテンプレート格納先から解決する。
+    """
+
+    def join_path(self, template: str, parent: str) -> str:
+        if DELIMITER in template:
+            return template
+        return parent.partition(DELIMITER)[0] + DELIMITER + template
+
+
+class TemplateCache:
+    """プロセス内で共有する Jinja の Environment を管理するクラス。
+
+    Environment はテンプレート格納先に依らず 1 つを共有し、コンパイル済みのテンプレートは
+    メモリ上に加えてディスク上にもキャッシュする。これにより、同一プロセス内の複数リポジトリの初期化や、
+    繰り返しのコマンド実行でテンプレートのコンパイルを省略する。
+    """
+
+    #: キャッシュ格納先
+    DIRECTORY = CACHE_DIR.joinpath('templates')
+    #: キャッシュの合計サイズの上限 (byte)
+    MAX_SIZE = 64 * 1024 * 1024
+
+    _environment = None
+
+    @classmethod
+    def environment(cls) -> Environment:
+        """共有の Environment を返す。
+
+        Returns:
+            Environment: Jinja の Environment
+        """
+        if cls._environment is None:
+            cls._environment = _SharedEnvironment(loader=_AssetLoader(),
+                                                  bytecode_cache=LRUBytecodeCache(cls.DIRECTORY, cls.MAX_SIZE),
+                                                  cache_size=-1)
+        return cls._environment
+
+    @classmethod
+    def get_template(cls, src_root: Path, name: str) -> Template:
+        """テンプレートを返す。
+
+        Args:
+            src_root (Path): テンプレート格納先
+            name (str): テンプレート格納先からの相対パス
+
+        Returns:
+            Template: コンパイル済みのテンプレート
+        """
+        return cls.environment().get_template(src_root.resolve().as_posix() + DELIMITER + name)
+
+    @classmethod
+    def clear(cls) -> None:
+        """メモリ上の Environment を破棄する。
+        """
+        cls._environment = None
@@ -1,17 +1,21 @@
-from click import Group
-
-from .init import init
+from .lazy_group import LazyGroup
 from .accounts import build as build_accounts_cmd
+from .themes import build as build_themes_cmd
 from .versions import build as build_versions_cmd
 
 
-def build(cmd: Group) -> None:
+def build(cmd: LazyGroup) -> None:
     """親のコマンドグループにサブコマンドを追加する。
 
+    サブコマンドのモジュールは、サブコマンドの実行時に import する。
+
     Args:
-        cmd (Group): 親コマンドのグループ
+        cmd (LazyGroup): 親コマンドのグループ
     """
-    cmd.add_command(init)
+    cmd.add_lazy_command('init', 'create_github_project.commands.init:init')
+    cmd.add_lazy_command('sync', 'create_github_project.commands.sync:sync')
+    cmd.add_lazy_command('validate', 'create_github_project.commands.validate:validate')
     # コマンドグループ
     build_accounts_cmd(cmd)
+    build_themes_cmd(cmd)
     build_versions_cmd(cmd)
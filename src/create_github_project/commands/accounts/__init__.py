@@ -1,15 +1,13 @@
 import click
 
-from ._list import _list
-from .add import add
-from .drop import drop
+from create_github_project.commands.lazy_group import LazyGroup
 
 __all__ = [
     'build'
 ]
 
 
-@click.group(help='Manage GitHub account to set reviewers.')
+@click.group(cls=LazyGroup, help='Manage GitHub account to set reviewers.')
 def accounts() -> None:
     pass
 
@@ -20,8 +18,9 @@ def build(cmd: click.Group) -> None:
     Args:
         cmd (click.Group): 親コマンド
     """
-    accounts.add_command(_list)
-    accounts.add_command(add)
-    accounts.add_command(drop)
+    accounts.add_lazy_command('list', 'create_github_project.commands.accounts._list:_list')
+    accounts.add_lazy_command('add', 'create_github_project.commands.accounts.add:add')
+    accounts.add_lazy_command('drop', 'create_github_project.commands.accounts.drop:drop')
+    accounts.add_lazy_command('migrate', 'create_github_project.commands.accounts.migrate:migrate')
 
     cmd.add_command(accounts)
@@ -1,21 +1,64 @@
+from pathlib import Path
+from typing import Dict, Union
+
 import click
 
 from create_github_project.utils import Accounts
+from create_github_project.utils.github_users import GitHubUsers
 
 
 @click.command(help='Add GitHub account under managements.')
-@click.argument('account_id', type=str)
-@click.option('--display-name', type=str, help='Display name for this user.', required=True)
-def add(account_id: str, display_name: str) -> None:
+@click.argument('account_id', type=str, required=False)
+@click.option('--display-name', type=str, help='Display name for this user.')
+@click.option('--from-file', 'from_file', type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help=' '.join([
+                  'File listing accounts to add at once.',
+                  'Each line is `ACCOUNT_ID` or `ACCOUNT_ID,DISPLAY_NAME` (display name defaults to account ID).'
+              ]))
+@click.option('--token', type=str, envvar='GITHUB_TOKEN',
+              help='GitHub token to authenticate API requests. Default is environment variable GITHUB_TOKEN.')
+@click.option('--jobs', '-j', 'jobs', type=click.IntRange(min=1), default=GitHubUsers.JOBS, show_default=True,
+              help='Number of accounts looked up in parallel with --from-file.')
+def add(account_id: Union[str, None],
+        display_name: Union[str, None],
+        from_file: Union[Path, None],
+        token: Union[str, None],
+        jobs: int) -> None:
     """GitHub アカウントをツールの管理下に登録する。
 
     Args:
-        account_id (str): GitHub アカウント ID
-        display_name (str): 表示名
+        account_id (Union[str, None]): GitHub アカウント ID
+        display_name (Union[str, None]): 表示名
+        from_file (Union[Path, None]): 一括で登録するアカウントの一覧のファイル
+        token (Union[str, None]): GitHub API の認証に利用するトークン
+        jobs (int): 一括登録時の並列数
 
     Raises:
         click.BadParameter: 対象アカウントが存在しない場合
+        click.ClickException: アカウントの取得に失敗した場合
     """
+    # 起動を高速化するため、利用時に import する
+    from github import GithubException
+    from requests import RequestException
+
+    # 存在しない場合以外のアカウントの取得の失敗と、GitHub API への接続の失敗
+    errors = (GithubException, RequestException)
+
+    if from_file is not None:
+        if account_id is not None or display_name is not None:
+            raise click.BadParameter('`ACCOUNT_ID` and `--display-name` cannot be used with --from-file.',
+                                     param_hint="'--from-file'")
+        try:
+            _add_from_file(from_file, token, jobs)
+        except errors as e:
+            raise click.ClickException(f'Failed to get GitHub accounts: {e}')
+        return
+
+    if account_id is None:
+        raise click.UsageError("Missing argument 'ACCOUNT_ID'.")
+    if display_name is None:
+        raise click.UsageError("Missing option '--display-name'.")
+
     accounts = Accounts()
 
     # 対象アカウントが管理下にある場合は何もしない。
@@ -23,7 +66,10 @@ def add(account_id: str, display_name: str) -> None:
         print(f"GitHub Account '{account_id}' already under management.")
         return
 
-    homepage = accounts.add(account_id, display_name)
+    try:
+        homepage = accounts.add(account_id, display_name, token=token)
+    except errors as e:
+        raise click.ClickException(f"Failed to get GitHub account '{account_id}': {e}")
     if homepage is None:
         raise click.BadParameter(f"Account '{account_id}' not exist.")
 
@@ -34,3 +80,56 @@ def add(account_id: str, display_name: str) -> None:
         f'  - Display name : {display_name}',
         f'  - homepage     : {homepage}'
     ]))
+
+
+def _add_from_file(from_file: Path, token: Union[str, None], jobs: int) -> None:
+    """ファイルに記載された GitHub アカウントを一括でツールの管理下に登録する。
+
+    Args:
+        from_file (Path): アカウントの一覧のファイル
+        token (Union[str, None]): GitHub API の認証に利用するトークン
+        jobs (int): 並列数
+
+    Raises:
+        click.ClickException: 存在しないアカウントが含まれる場合
+    """
+    targets = _load_accounts(from_file)
+    accounts = Accounts()
+    exists = {a for a in targets.keys() if accounts.exists(a)}
+    homepages = accounts.add_many(targets, token, jobs)
+
+    # 結果の一覧
+    results = [
+        (a, 'EXISTS' if a in exists else 'ADDED' if homepages[a] is not None else 'NOT FOUND')
+        for a in targets.keys()
+    ]
+    added = [a for a, status in results if status == 'ADDED']
+    missing = [a for a, status in results if status == 'NOT FOUND']
+    print('\n'.join(
+        [f'Added {len(added)} of {len(results)} accounts:\n'] +
+        [f'  [{status}] {a}' for a, status in results]
+    ))
+    if missing:
+        raise click.ClickException(f'{len(missing)} accounts not exist.')
+
+
+def _load_accounts(path: Path) -> Dict[str, str]:
+    """アカウントの一覧のファイルを読み込む。
+
+    空行と `#` で始まる行は無視する。
+
+    Args:
+        path (Path): アカウントの一覧のファイル
+
+    Returns:
+        Dict[str, str]: GitHub アカウント ID と表示名の対応。ファイルの記載順に並ぶ。
+    """
+    accounts = {}
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            account_id, _, display_name = line.partition(',')
+            accounts[account_id.strip()] = display_name.strip() or account_id.strip()
+    return accounts
@@ -0,0 +1,17 @@
+import click
+
+from create_github_project.utils import Accounts
+
+
+@click.command(help='Migrate GitHub accounts under managements to SQLite database for faster lookups.')
+def migrate() -> None:
+    """管理下にある GitHub アカウントの一覧を、SQLite のデータベースへ移行する。
+
+    Raises:
+        click.ClickException: 移行済みの場合
+    """
+    try:
+        count = Accounts().migrate()
+    except FileExistsError as e:
+        raise click.ClickException(str(e))
+    print(f'Migrated {count} accounts to {Accounts.DB_PATH.as_posix()}.')
@@ -0,0 +1,173 @@
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+import yaml
+
+from .parameters import PRODUCTION_BRANCHES
+from create_github_project.assets import AssetManager
+from create_github_project.assets.asset import Asset
+from create_github_project.assets.blob_store import BlobStore
+from create_github_project.utils import to_option_value
+
+#: spec ファイルの各要素で指定可能なキー
+SPEC_KEYS = (
+    'repo_dir',
+    'repo_name',
+    'production',
+    'commit_types',
+    'reviewers',
+    'parameters',
+    'remote_type',
+    'remote_repo_name',
+)
+#: 値のファイルで指定可能なキー
+VALUE_KEYS = tuple(k for k in SPEC_KEYS if k not in ('repo_dir', 'repo_name'))
+#: 値のファイルで指定可能なリモートリポジトリの種別
+REMOTE_TYPES = ('github', 'gsr')
+
+
+def load_specs(path: Path) -> List[Dict[str, object]]:
+    """バッチ実行用の spec ファイルを読み込む。
+
+    spec ファイルは、拡張子が .jsonl の場合は 1 行 1 リポジトリの JSON Lines、
+    それ以外の場合は下記形式の yaml を想定する。
+
+    .. code-block: yaml
+
+        - repo_dir: "<リポジトリ作成先>"
+          production: main
+          commit_types: [feat, fix]
+          reviewers: [user1, user2]
+          parameters:
+            languages: [python]
+            cloudbuild: "no"
+
+    Args:
+        path (Path): spec ファイルのパス
+
+    Returns:
+        List[Dict[str, object]]: リポジトリごとのパラメータ。値は CLI オプションと同じ文字列形式に揃える。
+
+    Raises:
+        ValueError: spec ファイルの形式が不正な場合
+    """
+    with open(path, 'r') as f:
+        if path.suffix == '.jsonl':
+            raw = [json.loads(line) for line in f if line.strip()]
+        else:
+            raw = yaml.safe_load(f) or []
+
+    if not isinstance(raw, list):
+        raise ValueError('Spec file must contain a list of repositories.')
+
+    specs = []
+    repo_dirs = set()
+    for i, item in enumerate(raw):
+        if not isinstance(item, dict):
+            raise ValueError(f'Spec #{i + 1} must be a mapping.')
+        unknown = set(item.keys()) - set(SPEC_KEYS)
+        if unknown:
+            raise ValueError(f'Unknown key(s) in spec #{i + 1}: ' + ', '.join(map(lambda x: f"'{x}'", sorted(unknown))))
+        if not item.get('repo_dir'):
+            raise ValueError(f"Spec #{i + 1} has no 'repo_dir'.")
+
+        spec = {k: to_option_value(v) for k, v in item.items() if k != 'parameters'}
+        spec['repo_dir'] = Path(item['repo_dir'])
+        if spec['repo_dir'].resolve() in repo_dirs:
+            raise ValueError(f"Spec #{i + 1} has duplicated 'repo_dir': {item['repo_dir']}")
+        repo_dirs.add(spec['repo_dir'].resolve())
+        spec['parameters'] = {k: to_option_value(v) for k, v in (item.get('parameters') or {}).items()}
+        specs.append(spec)
+
+    return specs
+
+
+def load_values(path: Path) -> Dict[str, object]:
+    """オプションのデフォルト値を記載したファイルを読み込む。
+
+    ファイルは下記形式の yaml (または JSON) を想定する。
+
+    .. code-block: yaml
+
+        production: main
+        commit_types: [feat, fix]
+        reviewers: []
+        parameters:
+          languages: [python]
+          cloudbuild: "no"
+
+    Args:
+        path (Path): 値のファイルのパス
+
+    Returns:
+        Dict[str, object]: オプションの値。値は CLI オプションと同じ文字列形式に揃え、parameters は常に含める。
+
+    Raises:
+        ValueError: ファイルの形式が不正な場合
+    """
+    with open(path, 'r') as f:
+        raw = yaml.safe_load(f) or {}
+
+    if not isinstance(raw, dict):
+        raise ValueError('Values file must be a mapping.')
+    unknown = set(raw.keys()) - set(VALUE_KEYS)
+    if unknown:
+        raise ValueError('Unknown key(s) in values file: ' + ', '.join(map(lambda x: f"'{x}'", sorted(unknown))))
+    if not isinstance(raw.get('parameters') or {}, dict):
+        raise ValueError("'parameters' in values file must be a mapping.")
+
+    values = {k: to_option_value(v) for k, v in raw.items() if k != 'parameters'}
+    # CLI オプションの選択肢と同じ検証を行う
+    for k, choices in [('production', PRODUCTION_BRANCHES), ('remote_type', REMOTE_TYPES)]:
+        if values.get(k) is not None and values[k] not in choices:
+            raise ValueError(f"'{k}' in values file must be one of " +
+                             ', '.join(map(lambda x: f"'{x}'", choices)) + f": {values[k]}")
+    values['parameters'] = {k: to_option_value(v) for k, v in (raw.get('parameters') or {}).items()}
+    return values
+
+
+def materialize(targets: List[Tuple[AssetManager, List[Asset]]], jobs: int) -> List[Union[str, None]]:
+    """複数のリポジトリを初期化する。
+
+    リポジトリごとの処理は互いに独立しているため、jobs が 2 以上の場合はプロセスプールで並列に実行する。
+    個々のリポジトリで発生したエラーは処理を中断せずに集計する。
+    blob のキャッシュの削除は、全てのリポジトリの作成後に 1 度のみ行う。
+
+    Args:
+        targets (List[Tuple[AssetManager, List[Asset]]]): 初期化対象のリポジトリと、配置対象のリソース
+        jobs (int): 並列数。0 の場合は CPU のコア数。
+
+    Returns:
+        List[Union[str, None]]: targets と同じ順序に並べた初期化結果。成功した場合は None、失敗した場合はエラー内容。
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(targets) <= 1:
+        results = [_materialize(am, assets) for am, assets in targets]
+    else:
+        managers, assets = zip(*targets)
+        chunksize = max(1, len(targets) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_materialize, managers, assets, chunksize=chunksize))
+
+    BlobStore.evict()
+    return results
+
+
+def _materialize(am: AssetManager, assets: List[Asset]) -> Union[str, None]:
+    """リポジトリを 1 つ初期化する。
+
+    Args:
+        am (AssetManager): 初期化対象のリポジトリ
+        assets (List[Asset]): 配置対象のリソース
+
+    Returns:
+        Union[str, None]: 成功した場合は None、失敗した場合はエラー内容
+    """
+    try:
+        am.initialize(assets)
+    except Exception as e:
+        return f'{type(e).__name__}: {e}'
+    return None
@@ -1,16 +1,30 @@
 from pathlib import Path
-from typing import Tuple
+import sys
+from typing import Dict, List, Tuple, Union
 
 import click
 
+from .batch import load_specs, load_values, materialize
 from .parameters import ParameterParser, PRODUCTION_BRANCHES
-from create_github_project.assets import AssetManager
+from create_github_project.assets import AssetManager, GitEngine
+from create_github_project.assets.asset import Asset
+from create_github_project.assets.blob_store import BlobStore
+from create_github_project.assets.sinks import ARCHIVE_FORMATS, DirectorySink, OUTPUT_FORMATS, open_sink
+from create_github_project.const import DEFAULT_THEME
 from create_github_project.manifest import ManifestParser
+from create_github_project.manifest.theme_packs import ThemePacks
 from create_github_project.utils import click_callbacks, utility_fn
 
 
 @click.command(help="Initialize local Git repository.")
-@click.argument('repo_dir', type=click.Path(exists=False, path_type=Path))
+@click.argument('repo_dir', type=click.Path(exists=False, path_type=Path), required=False)
+@click.option('--batch', 'batch', type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help=' '.join([
+                  'Spec file (YAML or JSONL) to initialize multiple repositories at once.',
+                  'Other options are used as default values for each repository.'
+              ]))
+@click.option('--jobs', '-j', 'jobs', type=click.IntRange(min=0), default=1, show_default=True,
+              help='Number of repositories initialized in parallel with --batch. 0 means the number of CPUs.')
 @click.option('--repo-name', type=str, default='',
               help='GitHub repository name. Default is directory name of `REPO_DIR`.')
 @click.option('--production', type=click.Choice(PRODUCTION_BRANCHES), help='Production branch name.')
@@ -19,67 +33,377 @@ from create_github_project.utils import click_callbacks, utility_fn
 @click.option('--parameter', '-p', 'parameters', type=str, multiple=True,
               callback=click_callbacks.to_multi_parameter,
               help='Theme specific parameters.')
-@click.option('--remote-type', 'remote_type', type=click.Choice(['github', 'gsr']), default='github',
-              help='Remote repository type. Link format in CHANGELOG is changed depending on the value.')
+@click.option('--remote-type', 'remote_type', type=click.Choice(['github', 'gsr']),
+              help=' '.join([
+                  'Remote repository type. Link format in CHANGELOG is changed depending on the value.',
+                  'Default is `github`.'
+              ]))
 @click.option('--remote-repo-name', 'remote_repo_name', type=str,
               help=' '.join([
                   'Remote repository name for changelog. Format is',
                   '`REPO_OWNER`/`REPO_NAME` for GitHub, ',
                   '`PROJECT_ID`/`REPO_NAME` for GSR'
               ]))
-def init(repo_dir: Path,
+@click.option('--theme', type=str, default=DEFAULT_THEME, show_default=True,
+              help='Theme to use. See `themes list` for available themes.')
+@click.option('--git-engine', 'git_engine', type=click.Choice(GitEngine.names()), default='gitpython',
+              show_default=True,
+              help=' '.join([
+                  'How to create Git repositories.',
+                  '`plumbing` writes Git objects and refs directly without running git commands.'
+              ]))
+@click.option('--output-format', 'output_format', type=click.Choice(OUTPUT_FORMATS), default='git',
+              show_default=True,
+              help=' '.join([
+                  'Output format of rendered files.',
+                  '`dir` writes files into `REPO_DIR` without creating a Git repository,',
+                  '`tar` and `zip` write an archive to `REPO_DIR`.'
+              ]))
+@click.option('--stdout', 'stdout', is_flag=True,
+              help=' '.join([
+                  'Write the archive to stdout instead of `REPO_DIR`. Only available with tar and zip.',
+                  'Implies --non-interactive.'
+              ]))
+@click.option('--values', 'values_file', type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help=' '.join([
+                  'YAML file with default values of options',
+                  '(production, commit_types, reviewers, parameters, remote_type, remote_repo_name).',
+                  'Options given on the command line take precedence.'
+              ]))
+@click.option('--non-interactive', 'non_interactive', is_flag=True,
+              help='Fail with the list of missing values instead of prompting for them.')
+def init(repo_dir: Union[Path, None],
+         batch: Union[Path, None],
+         jobs: int,
          repo_name: str,
          production: str,
          commit_types: str,
          reviewers: str,
-         parameters: Tuple[str],
+         parameters: Dict[str, str],
          remote_type: str,
-         remote_repo_name: str) -> None:
+         remote_repo_name: str,
+         theme: str,
+         git_engine: str,
+         output_format: str,
+         stdout: bool,
+         values_file: Union[Path, None],
+         non_interactive: bool) -> None:
     """ローカルリポジトリを初期化するコマンド。
 
     Args:
-        repo_dir (Path): リポジトリ作成先
+        repo_dir (Union[Path, None]): リポジトリ作成先
+        batch (Union[Path, None]): 複数リポジトリを一括作成する場合の spec ファイル
+        jobs (int): 一括作成時の並列数
         repo_name (str): リポジトリ名
         production (str): 本番用ブランチの名前
         commit_types (str): カンマ区切りの commit type
         reviewers (str): カンマ区切り リリースレビュー担当者 GitHub アカウント ID
-        parameters (Tuple[str]): テーマ固有のパラメータ
+        parameters (Dict[str, str]): テーマ固有のパラメータ
+        remote_type (str): リモートリポジトリの種別
+        remote_repo_name (str): リモートリポジトリの名前
+        theme (str): テーマ名
+        git_engine (str): リポジトリ作成に利用する処理
+        output_format (str): 出力形式
+        stdout (bool): アーカイブを標準出力に書き込むかどうか
+        values_file (Union[Path, None]): オプションのデフォルト値を記載したファイル
+        non_interactive (bool): 対話的な入力を行わないかどうか
     """
+    # オプションが指定されていない場合は、ファイルに記載された値を利用する
+    if values_file is not None:
+        try:
+            values = load_values(values_file)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="'--values'")
+        production, commit_types, reviewers, remote_type, remote_repo_name = [
+            v if v is not None else values.get(k) for k, v in [
+                ('production', production),
+                ('commit_types', commit_types),
+                ('reviewers', reviewers),
+                ('remote_type', remote_type),
+                ('remote_repo_name', remote_repo_name)
+            ]
+        ]
+        parameters = dict(values['parameters'], **parameters)
+    remote_type = remote_type or 'github'
+
+    if stdout and output_format not in ARCHIVE_FORMATS:
+        raise click.BadParameter('--stdout can be used only with tar or zip output format.', param_hint="'--stdout'")
+    # 対話的な入力が標準出力のアーカイブに混ざらないよう、--stdout では対話的な入力を行わない
+    non_interactive = non_interactive or stdout
+
+    if batch is not None:
+        if repo_dir is not None or repo_name:
+            raise click.BadParameter('`REPO_DIR` and `--repo-name` cannot be used with --batch.',
+                                     param_hint="'--batch'")
+        if output_format != 'git':
+            raise click.BadParameter('Only git output format can be used with --batch.',
+                                     param_hint="'--output-format'")
+        _init_batch(batch, jobs, production, commit_types, reviewers, parameters, remote_type, remote_repo_name,
+                    theme, git_engine, not non_interactive)
+        return
+
+    if repo_dir is None:
+        raise click.UsageError("Missing argument 'REPO_DIR'.")
+
     # リポジトリ作成先にフォルダ/ファイルが存在しないこと
-    if repo_dir.exists():
+    if not stdout and repo_dir.exists():
         raise click.BadParameter(f'Directory {repo_dir.as_posix()} already exists.')
-    # リポジトリ名が未指定の場合は、リポジトリ作成先から推定する。
-    repo_name = repo_name or repo_dir.name
 
-    # CHANGELOG に埋め込む URL 郡を作成する。
-    remote_url, urls, err = utility_fn.to_remote_urls(remote_type, remote_repo_name)
-    if err:
-        raise click.BadParameter(err, param_hint='--remote-repo-name')
+    # マニフェストファイル
+    mp = load_manifest(theme)
+
+    am, assets, message = prepare_repository(mp, repo_dir, repo_name, production, commit_types, reviewers,
+                                             parameters, remote_type, remote_repo_name, git_engine,
+                                             interactive=not non_interactive)
+
+    if output_format != 'git':
+        _render(am, assets, repo_dir, output_format, stdout)
+        return
+
+    # リポジトリ初期化
+    am.initialize(assets)
+    BlobStore.evict()
+    print(message)
+
+
+def _render(am: AssetManager, assets: List[Asset], repo_dir: Path, output_format: str, stdout: bool) -> None:
+    """Git リポジトリを作成せずに、配置対象のファイルを出力する。
+
+    アーカイブはファイルに展開せずに直接書き込む。標準出力に書き込む場合は、メッセージを表示しない。
+
+    Args:
+        am (AssetManager): 出力対象のリポジトリ
+        assets (List[Asset]): 配置対象のリソース
+        repo_dir (Path): 出力先
+        output_format (str): 出力形式
+        stdout (bool): アーカイブを標準出力に書き込むかどうか
+    """
+    if output_format == 'dir':
+        am.render(assets, DirectorySink(repo_dir))
+    elif stdout:
+        sink = open_sink(output_format, sys.stdout.buffer)
+        am.render(assets, sink)
+        sink.close()
+        sys.stdout.buffer.flush()
+        return
+    else:
+        with open(repo_dir, 'wb') as f:
+            sink = open_sink(output_format, f)
+            am.render(assets, sink)
+            sink.close()
+
+    click.echo(f'Rendered files into {repo_dir.as_posix()} ({output_format}).', err=True)
+
+
+def _init_batch(batch: Path,
+                jobs: int,
+                production: str,
+                commit_types: str,
+                reviewers: str,
+                parameters: Dict[str, str],
+                remote_type: str,
+                remote_repo_name: str,
+                theme: str,
+                git_engine: str,
+                interactive: bool) -> None:
+    """spec ファイルに記載された複数のリポジトリを一括で初期化する。
+
+    マニフェストファイルの読み込みとテンプレートのコンパイルは全リポジトリで共有する。
+    パラメータの確定は対話的な入力を伴うため逐次行い、その後のリポジトリ作成を jobs の数だけ並列に行う。
+    個々のリポジトリで発生したエラーは処理を中断せずに集計し、最後に spec ファイルの順序で結果の一覧を表示する。
+
+    Args:
+        batch (Path): spec ファイル
+        jobs (int): 並列数
+        production (str): 本番用ブランチの名前のデフォルト値
+        commit_types (str): カンマ区切りの commit type のデフォルト値
+        reviewers (str): カンマ区切り リリースレビュー担当者のデフォルト値
+        parameters (Dict[str, str]): テーマ固有のパラメータのデフォルト値
+        remote_type (str): リモートリポジトリの種別のデフォルト値
+        remote_repo_name (str): リモートリポジトリの名前のデフォルト値
+        theme (str): テーマ名
+        git_engine (str): リポジトリ作成に利用する処理
+        interactive (bool): 不足しているパラメータを対話的に入力するかどうか
+
+    Raises:
+        click.ClickException: 初期化に失敗したリポジトリが存在する場合
+    """
+    try:
+        specs = load_specs(batch)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'--batch'")
 
     # マニフェストファイル
-    mp = ManifestParser('default')
+    mp = load_manifest(theme)
+
+    # spec ファイルの値が無い項目は、コマンドのオプションの値を利用する
+    for spec in specs:
+        spec.setdefault('production', production)
+        spec.setdefault('commit_types', commit_types)
+        spec.setdefault('reviewers', reviewers)
+        spec['parameters'] = dict(parameters, **spec['parameters'])
+
+    # パラメータ値の検証
+    # 全ての spec をまとめて検証し、不正な spec は対話的な入力の前に全ての不正内容を通知する
+    invalid = ParameterParser.validate_many(mp.get_input_config(), specs)
+
+    # パラメータの確定
+    errors = []
+    targets = []
+    for spec, invalid_fields in zip(specs, invalid):
+        repo_dir = spec['repo_dir']
+        try:
+            if invalid_fields:
+                raise click.BadParameter('; '.join(f"'{k}': {v}" for k, v in invalid_fields.items()))
+            if repo_dir.exists():
+                raise click.BadParameter(f'Directory {repo_dir.as_posix()} already exists.')
+            am, assets, _ = prepare_repository(mp,
+                                               repo_dir,
+                                               spec.get('repo_name') or '',
+                                               spec['production'],
+                                               spec['commit_types'],
+                                               spec['reviewers'],
+                                               spec['parameters'],
+                                               spec.get('remote_type') or remote_type,
+                                               spec.get('remote_repo_name', remote_repo_name),
+                                               git_engine,
+                                               interactive=interactive)
+        except click.ClickException as e:
+            errors.append(e.format_message())
+        else:
+            errors.append(None)
+            targets.append((am, assets))
+
+    # リポジトリ初期化
+    materialized = iter(materialize(targets, jobs))
+    results = [
+        (spec['repo_dir'], err if err is not None else next(materialized))
+        for spec, err in zip(specs, errors)
+    ]
+
+    # 結果の一覧
+    failed = [r for r in results if r[1] is not None]
+    print('\n'.join(
+        [f'Initialized {len(results) - len(failed)} of {len(results)} repositories:\n'] +
+        [
+            f'  [OK]     {d.as_posix()}' if err is None else f'  [FAILED] {d.as_posix()}: {err}'
+            for d, err in results
+        ]
+    ))
+    if failed:
+        raise click.ClickException(f'Failed to initialize {len(failed)} repositories.')
+
+
+def load_manifest(theme: str) -> ManifestParser:
+    """テーマのマニフェストファイルを読み込む。
+
+    Args:
+        theme (str): テーマ名
+
+    Returns:
+        ManifestParser: マニフェストファイル
+
+    Raises:
+        click.BadParameter: テーマが存在しない場合
+    """
+    try:
+        return ManifestParser(theme)
+    except FileNotFoundError:
+        if ThemePacks.split(theme) is not None:
+            raise click.BadParameter(f"Theme pack '{theme}' is not fetched. Run `themes fetch {theme}` first.",
+                                     param_hint="'--theme'")
+        names = ', '.join(map(lambda x: f"'{x}'", ManifestParser.registry().names()))
+        raise click.BadParameter(f"Theme '{theme}' not found. Available themes: {names}", param_hint="'--theme'")
+
+
+def prepare_repository(mp: ManifestParser,
+                       repo_dir: Path,
+                       repo_name: str,
+                       production: str,
+                       commit_types: str,
+                       reviewers: str,
+                       parameters: Dict[str, str],
+                       remote_type: str,
+                       remote_repo_name: str,
+                       git_engine: str,
+                       interactive: bool = True,
+                       fixed_inputs: Union[Dict[str, object], None] = None) -> Tuple[AssetManager, List[Asset], str]:
+    """リポジトリ 1 つ分のパラメータを確定し、初期化の準備を行う。
+
+    interactive が偽の場合は、不足しているパラメータを対話的に入力せず、不足しているもの全てをエラーとして通知する。
+    fixed_inputs のテーマ固有のパラメータは確定済みの値として扱い、検証や対話的な入力を行わずに利用する。
+
+    Args:
+        mp (ManifestParser): マニフェストファイル
+        repo_dir (Path): リポジトリ作成先
+        repo_name (str): リポジトリ名
+        production (str): 本番用ブランチの名前
+        commit_types (str): カンマ区切りの commit type
+        reviewers (str): カンマ区切り リリースレビュー担当者 GitHub アカウント ID
+        parameters (Dict[str, str]): テーマ固有のパラメータ
+        remote_type (str): リモートリポジトリの種別
+        remote_repo_name (str): リモートリポジトリの名前
+        git_engine (str): リポジトリ作成に利用する処理
+        interactive (bool): 不足しているパラメータを対話的に入力するかどうか
+        fixed_inputs (Union[Dict[str, object], None]): 確定済みのテーマ固有のパラメータ
+
+    Returns:
+        Tuple[AssetManager, List[Asset], str]: 下記のタプル
+
+            * 初期化対象のリポジトリ
+            * 配置対象のリソース
+            * 初期化完了時に表示するメッセージ
+
+    Raises:
+        click.ClickException: パラメータが不正な場合
+    """
+    # リポジトリ名が未指定の場合は、リポジトリ作成先から推定する。
+    repo_name = repo_name or repo_dir.name
+
     unknown = set(parameters.keys()) - set(mp.get_parameter_names())
     if unknown:
         raise click.BadParameter('Unknown parameter detected: ' + ', '.join(map(lambda x: f"'{x}'", unknown)),
                                  param_hint="'--parameter'")
 
     # インプットパラメータ
-    pp = ParameterParser(production, commit_types, reviewers, mp.get_input_config(), parameters)
+    fixed_inputs = fixed_inputs or {}
+    config = [c for c in mp.get_input_config() if c['name'] not in fixed_inputs]
+    pp = ParameterParser(production, commit_types, reviewers, config, parameters)
+    if not interactive:
+        missing = pp.missing()
+        if remote_type == 'gsr' and remote_repo_name is None:
+            missing.append('remote_repo_name')
+        if missing:
+            raise click.UsageError('Missing values in non-interactive mode: ' + ', '.join(missing))
+
+    # CHANGELOG に埋め込む URL 郡を作成する。
+    try:
+        remote_url, urls, err = utility_fn.to_remote_urls(remote_type, remote_repo_name)
+    except ValueError as e:
+        # spec ファイルなど、オプションの選択肢の検証を経ない値の場合
+        raise click.BadParameter(str(e), param_hint="'--remote-type'")
+    if err:
+        raise click.BadParameter(err, param_hint='--remote-repo-name')
+
     result, err = pp.parse()
     if err is not None:
         raise click.ClickException(err)
     production, commit_types, reviewers, parameters = result
+    if fixed_inputs:
+        # 確定済みのパラメータを含め、マニフェストファイルでの定義順に並べる
+        parameters = {
+            name: fixed_inputs[name] if name in fixed_inputs else parameters[name] for name in mp.get_parameter_names()
+        }
 
     # 格納対象リソース
     assets = mp.get_assets(production, commit_types, list(reviewers.keys()), parameters)
 
-    # リポジトリ初期化
-    am = AssetManager(repo_dir, urls, repo_name, production, commit_types, reviewers, parameters)
-    am.initialize(assets)
+    am = AssetManager(repo_dir, urls, repo_name, production, commit_types, reviewers, parameters,
+                      GitEngine.find(git_engine), theme=mp.theme)
 
     # メッセージ
     note = '  (known after push)' if remote_url.endswith('${GITHUB_REPOSITORY}') else ''
-    print('\n'.join([
+    message = '\n'.join([
         '',
         'Repository successfully configured:\n',
         f'  Local repository : {repo_dir}',
@@ -91,4 +415,6 @@ def init(repo_dir: Path,
         '    git push origin --all\n',
         '  - Activate GitHub workflows by visiting Actions tab.\n',
         mp.get_follow_up(2, production, commit_types, reviewers, parameters)
-    ]).rstrip())
+    ]).rstrip()
+
+    return am, assets, message
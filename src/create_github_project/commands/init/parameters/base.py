@@ -1,7 +1,9 @@
 from abc import ABCMeta, abstractmethod, abstractproperty
-from typing import Tuple, Union
+from typing import Tuple, TYPE_CHECKING, Union
 
-import questionary
+if TYPE_CHECKING:
+    # prompt を利用しない場合に端末の初期化を避けるため、questionary は prompt の作成時に import する
+    import questionary
 
 
 class BaseParameter(metaclass=ABCMeta):
@@ -14,8 +16,13 @@ class BaseParameter(metaclass=ABCMeta):
     def __init__(self, value: Union[str, None]) -> None:
         self._raw_value = value
 
+    @property
+    def missing(self) -> bool:
+        """bool: 値が指定されていない (確定時に prompt を利用する) かどうか"""
+        return self._raw_value is None
+
     @abstractproperty
-    def question(self) -> questionary.Question:
+    def question(self) -> 'questionary.Question':
         """パラメータ未指定時に利用する prompt を返す。
 
         Returns:
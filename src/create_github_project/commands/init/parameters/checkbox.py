@@ -1,9 +1,10 @@
-from typing import List, Tuple, Union
-
-import questionary
+from typing import List, Tuple, TYPE_CHECKING, Union
 
 from .base import BaseParameter
 
+if TYPE_CHECKING:
+    import questionary
+
 
 class CheckBox(BaseParameter):
     """チェックボックス形式のパラメータ。
@@ -20,9 +21,13 @@ class CheckBox(BaseParameter):
         self._title = title
         self._choices = choices
         self._default = default
+        # 検証時に毎回作成しないよう、選択肢の集合は作成時に用意する
+        self._choice_set = frozenset(choices)
 
     @property
-    def question(self) -> questionary.Question:
+    def question(self) -> 'questionary.Question':
+        import questionary
+
         choices = [
             questionary.Choice(type_, checked=type_ in self._default) for type_ in self._choices
         ]
@@ -34,8 +39,7 @@ class CheckBox(BaseParameter):
             return True, None
 
         # 空文字でない値が指定されている場合
-        arr = list(set(value.split(',')))
-        unsupported = set(arr) - set(self._choices)
+        unsupported = set(value.split(',')) - self._choice_set
         if unsupported:
             return False, 'Unsupported value designated: ' + ', '.join(map(lambda x: f"'{x}'", unsupported))
 
@@ -4,14 +4,10 @@ from .checkbox import CheckBox
 from .enums import ParameterType
 from .reviewers import Reviewers
 from .select import Select
-from create_github_project.utils import get_commit_types, get_languages
+from create_github_project.utils import Accounts, get_commit_types
 
 # プロダクションブランチ名 一覧
 PRODUCTION_BRANCHES = ['master', 'main']
-# コミット型 一覧
-SUPPORTED_COMMIT_TYPES = get_commit_types()
-# 言語一覧
-SUPPORTED_LANGUAGES = get_languages()
 
 
 class ParameterParser:
@@ -23,6 +19,8 @@ class ParameterParser:
         reviewers (Union[str, None]): リリース時のレビュアー
         config (List[Dict[str, object]]): テーマ固有のパラメータ構成
         params (Dict[str, object]): テーマ固有のパラメータ値
+        accounts (Union[Accounts, None]): レビュアーの選択肢とする GitHub アカウント。
+            None の場合はプロセス内で共有するものを利用する。
     """
 
     def __init__(self,
@@ -30,13 +28,17 @@ class ParameterParser:
                  commit_types: Union[str, None],
                  reviewers: Union[str, None],
                  config: List[Dict[str, object]],
-                 params: Dict[str, object]):
+                 params: Dict[str, object],
+                 accounts: Union[Accounts, None] = None):
+        # アカウント一覧は全てのレビュアー用パラメータで共有し、読み込みを 1 度に抑える
+        accounts = accounts or Accounts.shared()
+
         self._production = Select(production, 'Production branch name?', PRODUCTION_BRANCHES)
         self._commit_types = CheckBox(commit_types,
                                       'Commit types to be included CHANGELOG?',
-                                      SUPPORTED_COMMIT_TYPES,
+                                      get_commit_types(),
                                       ['feat', 'fix', 'docs', 'perf'])
-        self._reviewers = Reviewers(reviewers, 'Who should review on release?')
+        self._reviewers = Reviewers(reviewers, 'Who should review on release?', accounts)
 
         # その他パラメータ
         self._names = [c['name'] for c in config]
@@ -46,6 +48,8 @@ class ParameterParser:
             type_ = ci['type']
             config = ci['config']
             p = ParameterType.find(type_)
+            if p == ParameterType.REVIEWERS:
+                config = dict(config, accounts=accounts)
             self._params[name] = p.value(params.get(name), **config)
 
     def parse(self):
@@ -83,6 +87,75 @@ class ParameterParser:
         # 返却
         return (production, commit_types, reviewers, params), None
 
+    @classmethod
+    def validate_many(cls,
+                      config: List[Dict[str, object]],
+                      specs: List[Dict[str, object]],
+                      accounts: Union[Accounts, None] = None) -> List[Dict[str, str]]:
+        """複数のリポジトリ分のパラメータ値を、まとめて検証する。
+
+        検証に利用するパラメータ (選択肢の集合やアカウントの検索結果) は 1 度のみ作成し、全ての spec で共有する。
+        spec ごとに最初のエラーで打ち切らず、全ての項目を検証する。
+
+        Args:
+            config (List[Dict[str, object]]): テーマ固有のパラメータ構成
+            specs (List[Dict[str, object]]): リポジトリごとのパラメータ値。
+                production、commit_types、reviewers と、テーマ固有のパラメータ値の辞書 parameters を含む。
+                値は CLI オプションと同じ文字列形式とし、None の項目は検証しない。
+            accounts (Union[Accounts, None]): レビュアーの選択肢とする GitHub アカウント。
+                None の場合はプロセス内で共有するものを利用する。
+
+        Returns:
+            List[Dict[str, str]]: specs と同じ順序に並べた、項目名と不正内容の対応。不正が無い spec は空の辞書。
+        """
+        pp = cls(None, None, None, config, {}, accounts)
+        validators = {
+            'production': pp._production,
+            'commit_types': pp._commit_types,
+            'reviewers': pp._reviewers
+        }
+
+        results = []
+        for spec in specs:
+            errors = {}
+            for name, p in validators.items():
+                value = spec.get(name)
+                if value is None:
+                    continue
+                ok, err = p.validate_value(value)
+                if not ok:
+                    errors[name] = err
+
+            for name, value in (spec.get('parameters') or {}).items():
+                p = pp._params.get(name)
+                if p is None:
+                    errors[name] = 'Unknown parameter.'
+                    continue
+                if value is None:
+                    continue
+                ok, err = p.validate_value(value)
+                if not ok:
+                    errors[name] = err
+
+            results.append(errors)
+
+        return results
+
+    def missing(self) -> List[str]:
+        """値が指定されていないパラメータの一覧を返す。
+
+        対話的な入力を行わない場合に、不足しているパラメータをまとめて通知するために利用する。
+
+        Returns:
+            List[str]: パラメータ名。テーマ固有のパラメータはマニフェストファイルでの定義順に並ぶ。
+        """
+        required = [
+            ('production', self._production),
+            ('commit_types', self._commit_types),
+            ('reviewers', self._reviewers)
+        ] + [(name, self._params[name]) for name in self._names]
+        return [name for name, p in required if p.missing]
+
     def _validate(self):
         """コマンド経由で指定されたパラメータ値のバリデーションを行う。
 
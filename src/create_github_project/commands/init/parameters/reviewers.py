@@ -1,21 +1,76 @@
+from typing import Dict, List, Tuple, TYPE_CHECKING, Union
+
 from .checkbox import CheckBox
 from create_github_project.utils import Accounts
 
+if TYPE_CHECKING:
+    import questionary
+
 
 class Reviewers(CheckBox):
     """GitHub レビュアー用 パラメータ。
 
+    登録数が多い場合でも全件を読み込まないよう、値の検証はアカウント毎に行い、選択肢は prompt の表示時に取得する。
+
     Args:
         value (Union[str, None]): 初期値
         title (str): prompt の質問文
+        accounts (Union[Accounts, None]): 管理下にある GitHub アカウント。None の場合はプロセス内で共有するものを利用する。
     """
 
-    def __init__(self, value: str, title: str) -> None:
-        self._accounts = Accounts()
-        super().__init__(value, title, self._accounts.list(), [])
+    #: prompt で全アカウントを選択肢とする登録数の上限。超える場合は、GitHub アカウント ID の接頭辞で絞り込む。
+    PROMPT_LIMIT = 50
+
+    def __init__(self, value: str, title: str, accounts: Union[Accounts, None] = None) -> None:
+        self._accounts = accounts or Accounts.shared()
+        # GitHub アカウント ID と、管理下にあるかどうかの対応。同じアカウントを何度も検証する場合に利用する。
+        self._known: Dict[str, bool] = {}
+        super().__init__(value, title, [], [])
+
+    @property
+    def question(self) -> 'questionary.Question':
+        self._choices = self._candidates()
+        return super().question
+
+    def validate_value(self, value: str) -> Tuple[bool, Union[str, None]]:
+        # 空文字指定の場合
+        if value == '':
+            return True, None
+
+        unsupported = {v for v in set(value.split(',')) if not self._exists(v)}
+        if unsupported:
+            return False, 'Unsupported value designated: ' + ', '.join(map(lambda x: f"'{x}'", unsupported))
+
+        return True, None
 
     def finalize(self):
         # CheckBox クラスの finalize メソッドを override し、
         # GitHub アカウント ID に付帯情報を付与した辞書に変換する。
         arr = super().finalize()
         return {i: self._accounts.get_account_info(i) for i in arr}
+
+    def _exists(self, account_id: str) -> bool:
+        """GitHub アカウントが管理下にあるかどうかを返す。
+
+        Args:
+            account_id (str): GitHub アカウント ID
+
+        Returns:
+            bool: 管理下にあるかどうか
+        """
+        if account_id not in self._known:
+            self._known[account_id] = self._accounts.exists(account_id)
+        return self._known[account_id]
+
+    def _candidates(self) -> List[str]:
+        """prompt の選択肢を返す。
+
+        Returns:
+            List[str]: GitHub アカウント ID
+        """
+        import questionary
+
+        if self._accounts.count() <= self.PROMPT_LIMIT:
+            return self._accounts.list()
+        prefix = questionary.text(f'{self._title} (filter by GitHub account ID prefix)').unsafe_ask()
+        return self._accounts.search(prefix)
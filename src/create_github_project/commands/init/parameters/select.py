@@ -1,9 +1,10 @@
-from typing import List, Tuple, Union
-
-import questionary
+from typing import List, Tuple, TYPE_CHECKING, Union
 
 from .base import BaseParameter
 
+if TYPE_CHECKING:
+    import questionary
+
 
 class Select(BaseParameter):
     """選択肢形式のパラメータ。
@@ -18,14 +19,18 @@ class Select(BaseParameter):
         super().__init__(value)
         self._title = title
         self._choices = choices
+        # 検証時に毎回作成しないよう、選択肢の集合は作成時に用意する
+        self._choice_set = frozenset(choices)
 
     @property
-    def question(self) -> questionary.Question:
+    def question(self) -> 'questionary.Question':
+        import questionary
+
         return questionary.select(self._title, choices=self._choices)
 
     def validate_value(self, value: str) -> Tuple[bool, Union[str, None]]:
         # 許容されない値が指定された場合
-        if value not in self._choices:
+        if value not in self._choice_set:
             msg = f"'{value}' is not one of " + ', '.join(map(lambda x: f"'{x}'", self._choices))
             return False, msg
 
@@ -0,0 +1,34 @@
+import importlib
+from typing import List, Union
+
+import click
+
+
+class LazyGroup(click.Group):
+    """サブコマンドを実行時に import するコマンドグループ。
+
+    サブコマンドのモジュールは、そのサブコマンドが呼び出された時点で初めて import する。
+    これにより、他のサブコマンドが依存するライブラリの import を省略し、CLI の起動を高速化する。
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy_commands = {}
+
+    def add_lazy_command(self, name: str, import_path: str) -> None:
+        """実行時に import するサブコマンドを追加する。
+
+        Args:
+            name (str): サブコマンド名
+            import_path (str): `<モジュール名>:<属性名>` 形式のサブコマンドの import 先
+        """
+        self._lazy_commands[name] = import_path
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self._lazy_commands.keys()))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Union[click.Command, None]:
+        if cmd_name not in self.commands and cmd_name in self._lazy_commands:
+            module, attr = self._lazy_commands[cmd_name].split(':')
+            self.add_command(getattr(importlib.import_module(module), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
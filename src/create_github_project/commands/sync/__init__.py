@@ -0,0 +1,5 @@
+from .cmd import sync
+
+__all__ = [
+    'sync'
+]
@@ -0,0 +1,197 @@
+from pathlib import Path
+from typing import Dict, Union
+
+import click
+
+from create_github_project.assets import AssetManager, GitEngine
+from create_github_project.assets.blob_store import BlobStore
+from create_github_project.assets.repo_state import RepoState
+from create_github_project.commands.init.cmd import load_manifest, prepare_repository
+from create_github_project.commands.init.parameters import PRODUCTION_BRANCHES
+from create_github_project.manifest import ManifestParser
+from create_github_project.utils import click_callbacks, to_option_value
+
+
+@click.command(help=' '.join([
+    'Sync an existing repository created by this tool with the current theme.',
+    'Parameters stored in the repository are reused, and only the options given are changed.'
+]))
+@click.argument('repo_dir', type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option('--repo-name', type=str, default='',
+              help='GitHub repository name. Default is directory name of `REPO_DIR`.')
+@click.option('--production', type=click.Choice(PRODUCTION_BRANCHES), help='Production branch name.')
+@click.option('--commit-types', type=str, help='Comma separated commit types to be included in CHANGELOG.md.')
+@click.option('--reviewers', type=str, help='Comma separated GitHub account ID for release reviewers.')
+@click.option('--parameter', '-p', 'parameters', type=str, multiple=True,
+              callback=click_callbacks.to_multi_parameter,
+              help='Theme specific parameters.')
+@click.option('--remote-type', 'remote_type', type=click.Choice(['github', 'gsr']),
+              help='Remote repository type. Link format in CHANGELOG is changed depending on the value.')
+@click.option('--remote-repo-name', 'remote_repo_name', type=str,
+              help=' '.join([
+                  'Remote repository name for changelog. Format is',
+                  '`REPO_OWNER`/`REPO_NAME` for GitHub, ',
+                  '`PROJECT_ID`/`REPO_NAME` for GSR'
+              ]))
+@click.option('--theme', type=str, help='Theme to sync with. Default is the theme used last time.')
+@click.option('--force', is_flag=True, help='Overwrite or remove files modified after the last sync.')
+@click.option('--git-engine', 'git_engine', type=click.Choice(GitEngine.names()), default='gitpython',
+              show_default=True,
+              help=' '.join([
+                  'How to commit the synced files.',
+                  '`plumbing` writes Git objects and refs directly without running git commands.'
+              ]))
+def sync(repo_dir: Path,
+         repo_name: str,
+         production: str,
+         commit_types: str,
+         reviewers: str,
+         parameters: Dict[str, str],
+         remote_type: str,
+         remote_repo_name: str,
+         theme: Union[str, None],
+         force: bool,
+         git_engine: str) -> None:
+    """既存のローカルリポジトリを、現在のテーマと再同期するコマンド。
+
+    パラメータはリポジトリに保存された値を再利用し、オプションで指定された値のみを変更する。
+    オプションの指定が無く、テーマで追加されたパラメータも無い場合は、対話的な入力を行わない。
+
+    Args:
+        repo_dir (Path): リポジトリのパス
+        repo_name (str): リポジトリ名
+        production (str): 本番用ブランチの名前
+        commit_types (str): カンマ区切りの commit type
+        reviewers (str): カンマ区切り リリースレビュー担当者 GitHub アカウント ID
+        parameters (Dict[str, str]): テーマ固有のパラメータ
+        remote_type (str): リモートリポジトリの種別
+        remote_repo_name (str): リモートリポジトリの名前
+        theme (Union[str, None]): テーマ名。None の場合は前回の同期時のテーマ。
+        force (bool): 前回の同期以降に編集されたファイルも上書き、削除するかどうか
+        git_engine (str): commit に利用する処理
+    """
+    if not repo_dir.joinpath(RepoState.FILE_NAME).is_file():
+        raise click.BadParameter(f'{RepoState.FILE_NAME} is not found in {repo_dir.as_posix()}.'
+                                 ' Only repositories created by this tool can be synced.')
+
+    # GitPython は利用時に import する
+    import git
+
+    try:
+        if git.Repo(repo_dir).is_dirty():
+            raise click.ClickException(f'Repository {repo_dir.as_posix()} has uncommitted changes.')
+    except git.InvalidGitRepositoryError:
+        raise click.BadParameter(f'Directory {repo_dir.as_posix()} is not a Git repository.')
+
+    try:
+        state = RepoState.load(repo_dir)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    stored = state.parameters
+
+    # マニフェストファイル
+    mp = load_manifest(theme or state.theme)
+
+    options = [production, commit_types, reviewers, remote_type, remote_repo_name]
+    changed = repo_name or parameters or any(o is not None for o in options)
+    if changed or not set(mp.get_parameter_names()) <= set(stored['inputs'].keys()):
+        am = _resolve(mp, repo_dir, stored, repo_name, production, commit_types, reviewers, parameters, remote_type,
+                      remote_repo_name, git_engine)
+    else:
+        # 保存されたパラメータをそのまま利用する
+        am = AssetManager.from_parameters(repo_dir, stored, GitEngine.find(git_engine), mp.theme)
+
+    resolved = am.template_parameter
+    assets = mp.get_assets(resolved['production_branch'],
+                           resolved['commit_types'],
+                           list(resolved['reviewers'].keys()),
+                           resolved['inputs'])
+
+    # 再同期
+    try:
+        updated, removed, conflicts = am.sync(assets, force)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    BlobStore.evict()
+
+    lines = [f'Synced {repo_dir.as_posix()}: {len(updated)} updated, {len(removed)} removed.']
+    lines += [f'  [UPDATED]  {p}' for p in updated]
+    lines += [f'  [REMOVED]  {p}' for p in removed]
+    lines += [f'  [CONFLICT] {p}' for p in conflicts]
+    if conflicts:
+        lines.append('\nConflicting files were modified after the last sync and are left unchanged.'
+                     ' Use --force to overwrite them.')
+    print('\n'.join(lines))
+
+
+def _resolve(mp: ManifestParser,
+             repo_dir: Path,
+             stored: Dict[str, object],
+             repo_name: str,
+             production: Union[str, None],
+             commit_types: Union[str, None],
+             reviewers: Union[str, None],
+             parameters: Dict[str, str],
+             remote_type: Union[str, None],
+             remote_repo_name: Union[str, None],
+             git_engine: str) -> AssetManager:
+    """オプションで指定された値と保存されたパラメータから、パラメータを確定する。
+
+    オプションで指定されていないパラメータは保存された値を利用し、テーマで追加されたパラメータのみ対話的に入力する。
+    保存されたパラメータは確定済みの値のため、再度の検証やレビュアーの情報の取得を行わずに利用する。
+
+    Args:
+        mp (ManifestParser): マニフェストファイル
+        repo_dir (Path): リポジトリのパス
+        stored (Dict[str, object]): 保存されたパラメータ
+        repo_name (str): リポジトリ名
+        production (Union[str, None]): 本番用ブランチの名前
+        commit_types (Union[str, None]): カンマ区切りの commit type
+        reviewers (Union[str, None]): カンマ区切り リリースレビュー担当者 GitHub アカウント ID
+        parameters (Dict[str, str]): テーマ固有のパラメータ
+        remote_type (Union[str, None]): リモートリポジトリの種別。None の場合は保存された URL から推定する。
+        remote_repo_name (Union[str, None]): リモートリポジトリの名前
+        git_engine (str): commit に利用する処理
+
+    Returns:
+        AssetManager: 再同期対象のリポジトリ
+
+    Raises:
+        click.ClickException: パラメータが不正な場合
+    """
+    names = set(mp.get_parameter_names())
+    fixed = {k: v for k, v in stored['inputs'].items() if k in names and k not in parameters}
+
+    am, _, _ = prepare_repository(mp,
+                                  repo_dir,
+                                  repo_name or stored['repo_name'],
+                                  production or stored['production_branch'],
+                                  commit_types if commit_types is not None else to_option_value(stored['commit_types']),
+                                  reviewers if reviewers is not None else '',
+                                  parameters,
+                                  remote_type or _remote_type(stored),
+                                  remote_repo_name,
+                                  git_engine,
+                                  fixed_inputs=fixed)
+
+    resolved = am.template_parameter
+    if reviewers is None:
+        resolved['reviewers'] = stored['reviewers']
+    if remote_type is None and remote_repo_name is None:
+        resolved['changelog_urls'] = stored['changelog_urls']
+    return AssetManager.from_parameters(repo_dir, resolved, GitEngine.find(git_engine), mp.theme)
+
+
+def _remote_type(stored: Dict[str, object]) -> str:
+    """保存された CHANGELOG の URL から、リモートリポジトリの種別を推定する。
+
+    Args:
+        stored (Dict[str, object]): 保存されたパラメータ
+
+    Returns:
+        str: リモートリポジトリの種別
+    """
+    urls = stored.get('changelog_urls') or {}
+    if str(urls.get('commitUrlFormat', '')).startswith('https://source.cloud.google.com/'):
+        return 'gsr'
+    return 'github'
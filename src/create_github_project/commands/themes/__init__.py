@@ -0,0 +1,24 @@
+import click
+
+from create_github_project.commands.lazy_group import LazyGroup
+
+__all__ = [
+    'build'
+]
+
+
+@click.group(cls=LazyGroup, help='Manage themes.')
+def themes() -> None:
+    pass
+
+
+def build(cmd: click.Group) -> None:
+    """親コマンドにサブコマンドを追加する。
+
+    Args:
+        cmd (click.Group): 親コマンド
+    """
+    themes.add_lazy_command('list', 'create_github_project.commands.themes._list:_list')
+    themes.add_lazy_command('fetch', 'create_github_project.commands.themes.fetch:fetch')
+
+    cmd.add_command(themes)
@@ -0,0 +1,18 @@
+import click
+
+from create_github_project.manifest import ManifestParser
+
+
+@click.command(name='list', help='List available themes.')
+def _list() -> None:
+    """利用可能なテーマの一覧を出力する。
+    """
+    for info in ManifestParser.registry().index():
+        print(f'- name   : {info.name}')
+        print(f'  origin : {info.origin}')
+        print(f'  path   : {info.path.resolve().as_posix()}')
+        if info.inputs is None:
+            print('  (invalid manifest)')
+            continue
+        print(f'  inputs : {", ".join(info.inputs)}')
+        print(f'  assets : {", ".join(info.assets)}')
@@ -0,0 +1,29 @@
+import click
+
+from create_github_project.manifest.theme_packs import ThemePacks
+
+
+@click.command(help=' '.join([
+    'Fetch a theme from a Git repository into the local cache.',
+    '`SPEC` is `<git-url>@<ref>`, and can be given to --theme afterwards without network access.'
+]))
+@click.argument('spec', type=str)
+def fetch(spec: str) -> None:
+    """リモートの Git リポジトリからテーマを取得する。
+
+    Args:
+        spec (str): テーマパックの名前 (`<Git リポジトリの URL>@<ref>`)
+
+    Raises:
+        click.ClickException: テーマの取得に失敗した場合
+    """
+    try:
+        sha, evicted = ThemePacks.fetch(spec)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    print('\n'.join(
+        [f'Fetched {spec} ({sha}).'] +
+        [f'  [EVICTED] {e}' for e in evicted] +
+        [f'\nUse it with: --theme {spec}']
+    ))
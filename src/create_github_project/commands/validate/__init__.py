@@ -0,0 +1,5 @@
+from .cmd import validate
+
+__all__ = [
+    'validate'
+]
@@ -0,0 +1,198 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+from typing import List, Tuple, Union
+
+import click
+
+from create_github_project.assets.asset_index import TEMPLATE_SUFFIX
+from create_github_project.assets.template_cache import TemplateCache
+from create_github_project.commands.init.batch import load_specs
+from create_github_project.commands.init.parameters import ParameterParser
+from create_github_project.commands.init.parameters.enums import ParameterType
+from create_github_project.const import DEFAULT_THEME
+from create_github_project.manifest import ManifestParser
+from create_github_project.utils import utility_fn
+
+
+@click.command(help=' '.join([
+    'Check a theme and a spec file without creating any repository.',
+    'All problems found are reported at once.'
+]))
+@click.option('--theme', type=str, default=DEFAULT_THEME, show_default=True, help='Theme to check.')
+@click.option('--spec', type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help='Spec file for `init --batch` to check against the theme.')
+@click.option('--jobs', '-j', 'jobs', type=click.IntRange(min=0), default=0,
+              help='Number of processes compiling templates in parallel. Default is number of CPUs.')
+def validate(theme: str, spec: Union[Path, None], jobs: int) -> None:
+    """テーマと spec ファイルを、リポジトリを作成せずに検証するコマンド。
+
+    マニフェストファイルの読み込み、パラメータ型の解決、全テンプレートのコンパイル、spec ファイルのパラメータ値と
+    リモートリポジトリの名前を検証し、検出した不正を最初のエラーで打ち切らずにまとめて表示する。
+
+    Args:
+        theme (str): テーマ名
+        spec (Union[Path, None]): spec ファイル
+        jobs (int): テンプレートのコンパイルの並列数。0 の場合は CPU のコア数。
+
+    Raises:
+        click.ClickException: 不正が検出された場合
+    """
+    errors, mp = _check_theme(theme)
+    n_templates = 0
+    if mp is not None:
+        targets = _list_templates(mp)
+        n_templates = len(targets)
+        errors += _check_templates(targets, jobs)
+        if spec is not None:
+            errors += _check_specs(mp, spec)
+
+    # 結果の一覧
+    print('\n'.join(
+        [f'Checked theme `{theme}` ({n_templates} templates)' + (f' and {spec.as_posix()}' if spec else '') + ':\n'] +
+        ([f'  [ERROR] {e}' for e in errors] or ['  No problems found.'])
+    ))
+    if errors:
+        raise click.ClickException(f'{len(errors)} problems found.')
+
+
+def _check_theme(theme: str) -> Tuple[List[str], Union[ManifestParser, None]]:
+    """マニフェストファイルを読み込み、パラメータの構成とリソースの格納先を検証する。
+
+    Args:
+        theme (str): テーマ名
+
+    Returns:
+        Tuple[List[str], Union[ManifestParser, None]]: 下記のタプル
+
+            * 検出した不正の一覧
+            * マニフェストファイル。読み込めない場合は None。
+    """
+    try:
+        mp = ManifestParser(theme)
+    except FileNotFoundError:
+        return [f'Theme `{theme}` not found.'], None
+    except Exception as e:
+        return [f'manifest: failed to load ({type(e).__name__}: {e})'], None
+
+    errors = []
+    for ci in mp.get_input_config():
+        try:
+            _ = ParameterType.find(ci['type']).value(None, **ci['config'])
+        except NotImplementedError as e:
+            errors.append(f"input '{ci['name']}': {e}")
+        except (TypeError, ValueError) as e:
+            errors.append(f"input '{ci['name']}': invalid config ({e})")
+
+    for name in mp.get_asset_names():
+        if not mp.get_source(name).is_dir():
+            errors.append(f"asset '{name}': directory not found.")
+
+    return errors, mp
+
+
+def _list_templates(mp: ManifestParser) -> List[Tuple[str, Path, str]]:
+    """条件に依らず、全てのリソースに含まれるテンプレートを列挙する。
+
+    他のテンプレートから include される、配置対象外 (EXCLUDE で始まる名前) のテンプレートも含める。
+
+    Args:
+        mp (ManifestParser): マニフェストファイル
+
+    Returns:
+        List[Tuple[str, Path, str]]: リソースの名前、テンプレート格納先、格納先からの相対パスのタプル
+    """
+    targets = []
+    for name in mp.get_asset_names():
+        src_root = mp.get_source(name)
+        if not src_root.is_dir():
+            continue
+        for root, _, files in os.walk(src_root):
+            for f in sorted(files):
+                if f.endswith(TEMPLATE_SUFFIX):
+                    targets.append((name, src_root, Path(root).joinpath(f).relative_to(src_root).as_posix()))
+    return targets
+
+
+def _check_templates(targets: List[Tuple[str, Path, str]], jobs: int) -> List[str]:
+    """テンプレートをコンパイルし、構文を検証する。
+
+    テンプレートは互いに独立しているため、jobs が 2 以上の場合はプロセスプールで並列にコンパイルする。
+    コンパイル結果はテンプレートのキャッシュに保存されるため、その後の init の実行でも再利用される。
+
+    Args:
+        targets (List[Tuple[str, Path, str]]): リソースの名前、テンプレート格納先、格納先からの相対パスのタプル
+        jobs (int): 並列数。0 の場合は CPU のコア数。
+
+    Returns:
+        List[str]: 検出した不正の一覧。targets の順序に並ぶ。
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(targets) <= 1:
+        results = [_compile(*t) for t in targets]
+    else:
+        chunksize = max(1, len(targets) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_compile, *zip(*targets), chunksize=chunksize))
+    return [r for r in results if r is not None]
+
+
+def _compile(name: str, src_root: Path, path: str) -> Union[str, None]:
+    """テンプレートを 1 つコンパイルする。
+
+    Args:
+        name (str): リソースの名前
+        src_root (Path): テンプレート格納先
+        path (str): テンプレート格納先からの相対パス
+
+    Returns:
+        Union[str, None]: 成功した場合は None、失敗した場合はエラー内容
+    """
+    # 起動を高速化するため、利用時に import する
+    from jinja2 import TemplateError, TemplateSyntaxError
+
+    try:
+        TemplateCache.get_template(src_root, path)
+    except TemplateSyntaxError as e:
+        return f'template {name}/{path}:{e.lineno}: {e.message}'
+    except TemplateError as e:
+        return f'template {name}/{path}: {e.message}'
+    return None
+
+
+def _check_specs(mp: ManifestParser, spec: Path) -> List[str]:
+    """spec ファイルのパラメータ値とリモートリポジトリの名前を検証する。
+
+    対話的な入力は行わないため、入力が必要になるリモートリポジトリの名前の不足も不正とする。
+
+    Args:
+        mp (ManifestParser): マニフェストファイル
+        spec (Path): spec ファイル
+
+    Returns:
+        List[str]: 検出した不正の一覧
+    """
+    try:
+        specs = load_specs(spec)
+    except ValueError as e:
+        return [f'spec: {e}']
+
+    errors = []
+    invalid = ParameterParser.validate_many(mp.get_input_config(), specs)
+    for i, (s, invalid_fields) in enumerate(zip(specs, invalid)):
+        prefix = f"spec #{i + 1} ({s['repo_dir'].as_posix()})"
+        errors += [f"{prefix}: '{k}': {v}" for k, v in invalid_fields.items()]
+
+        remote_type = s.get('remote_type') or 'github'
+        remote_repo_name = s.get('remote_repo_name')
+        if remote_type == 'gsr' and remote_repo_name is None:
+            errors.append(f"{prefix}: 'remote_repo_name' is required for gsr.")
+            continue
+        try:
+            _, _, err = utility_fn.to_remote_urls(remote_type, remote_repo_name)
+        except ValueError as e:
+            err = str(e)
+        if err:
+            errors.append(f"{prefix}: 'remote_repo_name': {err}")
+
+    return errors
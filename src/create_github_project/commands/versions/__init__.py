@@ -1,15 +1,13 @@
 import click
 
-from .current import current
-from .update import update
-
+from create_github_project.commands.lazy_group import LazyGroup
 
 __all__ = [
     'build'
 ]
 
 
-@click.group(help='Manage tool versions.')
+@click.group(cls=LazyGroup, help='Manage tool versions.')
 def versions() -> None:
     pass
 
@@ -20,7 +18,7 @@ def build(cmd: click.Group) -> None:
     Args:
         cmd (click.Group): 親コマンド
     """
-    versions.add_command(current)
-    versions.add_command(update)
+    versions.add_lazy_command('current', 'create_github_project.commands.versions.current:current')
+    versions.add_lazy_command('update', 'create_github_project.commands.versions.update:update')
 
     cmd.add_command(versions)
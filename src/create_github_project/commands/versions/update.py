@@ -1,7 +1,4 @@
-import pip
-
 import click
-from github import Github
 
 from .const import REPOSITORY
 from create_github_project import __version__ as VERSION
@@ -11,6 +8,10 @@ from create_github_project import __version__ as VERSION
 def update() -> None:
     """新規リリースがある場合に package の更新を行う。
     """
+    # 起動を高速化するため、利用時に import する
+    from github import Github
+    import pip
+
     repo = Github().get_repo(REPOSITORY)
     latest = list(repo.get_releases())[0]
     if latest.tag_name.endswith(VERSION):
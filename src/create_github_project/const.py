@@ -0,0 +1,11 @@
+import os
+from pathlib import Path
+
+#: ツールの設定ファイル格納先
+CONFIG_DIR = Path(os.path.expanduser('~')).joinpath('.create-github-project')
+#: キャッシュ格納先
+CACHE_DIR = CONFIG_DIR.joinpath('cache')
+#: デフォルトのテーマ名
+DEFAULT_THEME = 'default'
+#: テーマのマニフェストファイル名
+MANIFEST_FILE = 'manifest.yaml'
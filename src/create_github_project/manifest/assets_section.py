@@ -1,6 +1,6 @@
 from typing import Dict, List
 
-from jinja2 import Template
+from .condition import Condition
 
 
 class AssetsSection:
@@ -14,42 +14,57 @@ class AssetsSection:
         - name: "<テンプレートに含める component の名前>"
           if: "<component をテンプレートに含める Jinja の式>"
           to: "<Git のルートディレクトリからのパス>"
+          normalizeNewline: <テンプレート以外のファイルの末尾の空白文字を改行 1 つに置き換えるかどうか>
+
+    キー `if` の式は読み込み時にコンパイルし、キーが省略された場合は常に配置対象とする。
+    キー `normalizeNewline` が省略された場合、テンプレート以外のファイルは内容を変更せずに配置する。
 
     Args:
         config (List[Dict[str, object]]): assets セクションを表す辞書
+
+    Raises:
+        jinja2.TemplateSyntaxError: キー `if` の式の構文が不正な場合
     """
 
     NAME = 'name'
     TO = 'to'
     IF = 'if'
+    NORMALIZE_NEWLINE = 'normalizeNewline'
 
     def __init__(self, config: List[Dict[str, object]]):
         self._params = {
             item[self.NAME]: {
                 self.TO: item[self.TO],
-                self.IF: item.get(self.IF, 'True')
+                self.IF: Condition(item.get(self.IF)),
+                self.NORMALIZE_NEWLINE: bool(item.get(self.NORMALIZE_NEWLINE, False))
             }
             for item in config
         }
 
-    def get_assets(self, **params: Dict[str, object]) -> List[Dict[str, str]]:
+    @property
+    def names(self) -> List[str]:
+        """List[str]: assets セクション内 component の名前の一覧"""
+        return list(self._params.keys())
+
+    def get_assets(self, **params: Dict[str, object]) -> List[Dict[str, object]]:
         """assets セクションで指定されているリソースの一覧を返す。
 
-        このメソッドでは、assets セクション内のキー `if` の template 置換を行い、
-        置換結果が True であれば、Git リポジトリへの配置対象とみなす。
+        このメソッドでは、assets セクション内のキー `if` の式を評価し、
+        評価結果が真であれば、Git リポジトリへの配置対象とみなす。
 
         Args:
-            **param (Dict[str, object]): template 置換に利用するパラメータ
+            **param (Dict[str, object]): 式の評価に利用するパラメータ
 
         Returns:
-            List[Dict[str, str]]: リソース一覧
+            List[Dict[str, object]]: リソース一覧
         """
         assets = []
         for k, v in self._params.items():
-            if Template(v[self.IF]).render(**params) == 'True':
+            if v[self.IF].evaluate(**params):
                 assets.append({
                     'source': f'{k}',
-                    'destination': v[self.TO]
+                    'destination': v[self.TO],
+                    'normalize_newline': v[self.NORMALIZE_NEWLINE]
                 })
 
         return assets
@@ -0,0 +1,72 @@
+import re
+from typing import Dict, Union
+
+from jinja2 import Environment
+
+#: 条件式のコンパイルに利用する Environment
+_ENVIRONMENT = Environment()
+#: `{{ <式> }}` 形式の条件式
+_EXPRESSION = re.compile(r'^\s*\{\{(?P<expression>.*)\}\}\s*$', re.DOTALL)
+
+
+class Condition:
+    """manifest file のキー `if` に指定された条件式を管理するクラス。
+
+    条件式は manifest file の読み込み時に 1 度だけコンパイルし、評価時には真偽値として扱う。
+    条件式が `{{ <式> }}` 形式の場合は Jinja の式としてコンパイルし、
+    それ以外の場合はテンプレートとしてコンパイルする。
+    いずれの場合も、テンプレートとして置換した場合の結果が 'True' であるかどうかで評価する。
+
+    Args:
+        source (Union[str, None]): 条件式。None の場合は常に真とする。
+
+    Raises:
+        jinja2.TemplateSyntaxError: 条件式の構文が不正な場合
+    """
+
+    def __init__(self, source: Union[str, None]) -> None:
+        self._source = source
+        self._compile()
+
+    def __getstate__(self) -> Dict[str, object]:
+        # コンパイル済みの式は pickle できないため、条件式のみを保存する
+        return {'source': self._source}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self._source = state['source']
+        self._compile()
+
+    @property
+    def source(self) -> Union[str, None]:
+        """Union[str, None]: 条件式"""
+        return self._source
+
+    def evaluate(self, **params: Dict[str, object]) -> bool:
+        """条件式を評価する。
+
+        Args:
+            **params (Dict[str, object]): 条件式の評価に利用するパラメータ
+
+        Returns:
+            bool: 評価結果
+        """
+        if self._expression is not None:
+            # 'no' や空でないリストなど、真偽値以外の評価結果は偽とする
+            return str(self._expression(**params)) == 'True'
+        if self._template is not None:
+            return self._template.render(**params) == 'True'
+        return True
+
+    def _compile(self) -> None:
+        """条件式をコンパイルする。
+        """
+        self._expression = None
+        self._template = None
+        if self._source is None:
+            return
+
+        m = _EXPRESSION.match(self._source)
+        if m and '{{' not in m.group('expression') and '}}' not in m.group('expression'):
+            self._expression = _ENVIRONMENT.compile_expression(m.group('expression'))
+        else:
+            self._template = _ENVIRONMENT.from_string(self._source)
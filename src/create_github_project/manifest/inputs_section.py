@@ -15,20 +15,34 @@ class InputsSection:
           param1: ...
           param2: ...
 
+    パラメータ名をキーとした索引は読み込み時に 1 度だけ作成する。
+
     Args:
         config (List[Dict[str, object]]): inputs セクションを表す辞書
+
+    Raises:
+        ValueError: パラメータ名が重複している場合
     """
 
     NAME = 'name'
     TYPE = 'type'
 
     def __init__(self, config: List[Dict[str, object]]) -> None:
-        self._config = config
+        exclude = [self.NAME, self.TYPE]
+
+        self._names = []
+        self._index = {}
+        for item in config:
+            name = item[self.NAME]
+            if name in self._index:
+                raise ValueError(f'Duplicated name: {name}')
+            self._names.append(name)
+            self._index[name] = (item[self.TYPE], {k: v for k, v in item.items() if k not in exclude})
 
     @property
     def names(self) -> List[str]:
         """List[str]: inputs 内 パラメータ名の一覧"""
-        return [item[self.NAME] for item in self._config]
+        return self._names
 
     def get_type(self, name: str) -> str:
         """パラメータの型を返す。
@@ -42,10 +56,9 @@ class InputsSection:
         Raises:
             ValueError: パラメータ名が不正の場合
         """
-        for item in self._config:
-            if item[self.NAME] == name:
-                return item[self.TYPE]
-        raise ValueError(f'Unexpected name: {name}')
+        if name not in self._index:
+            raise ValueError(f'Unexpected name: {name}')
+        return self._index[name][0]
 
     def get_config(self, name: str) -> Dict[str, object]:
         """パラメータの構成を返す。
@@ -59,9 +72,6 @@ class InputsSection:
         Raises:
             ValueError: パラメータ名が不正の場合
         """
-        exclude = [self.NAME, self.TYPE]
-
-        for item in self._config:
-            if item[self.NAME] == name:
-                return {k: v for k, v in item.items() if k not in exclude}
-        raise ValueError(f'Unexpected name: {name}')
+        if name not in self._index:
+            raise ValueError(f'Unexpected name: {name}')
+        return self._index[name][1]
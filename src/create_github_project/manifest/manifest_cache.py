@@ -0,0 +1,70 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Union
+
+from create_github_project import __version__ as VERSION
+from create_github_project.const import CACHE_DIR
+
+
+class ManifestCache:
+    """検証、索引作成済みの manifest file の構造をディスクにキャッシュするクラス。
+
+    キャッシュは manifest file の内容のハッシュ値をキーとして pickle 形式で保存するため、
+    manifest file が更新された場合は自動的に無効となる。
+    """
+
+    #: キャッシュ格納先
+    DIRECTORY = CACHE_DIR.joinpath('manifests')
+    #: キャッシュの形式のバージョン。pickle する section のクラスの構造を変更した場合は値を増やす。
+    FORMAT = 2
+
+    @classmethod
+    def key(cls, data: bytes) -> str:
+        """manifest file の内容からキャッシュのキーを作成する。
+
+        キャッシュの構造はパッケージのバージョンと、同じバージョン内でも section のクラスの構造に依存するため、
+        キーにはパッケージのバージョンとキャッシュの形式のバージョンも含める。
+
+        Args:
+            data (bytes): manifest file の内容
+
+        Returns:
+            str: キャッシュのキー
+        """
+        return hashlib.sha256(f'{VERSION}\0{cls.FORMAT}\0'.encode() + data).hexdigest()
+
+    @classmethod
+    def get(cls, key: str) -> Union[object, None]:
+        """キャッシュを取得する。
+
+        Args:
+            key (str): キャッシュのキー
+
+        Returns:
+            Union[object, None]: キャッシュされた値。キャッシュが存在しない、または読み込めない場合は None。
+        """
+        try:
+            with open(cls.DIRECTORY.joinpath(f'{key}.pickle'), 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    @classmethod
+    def put(cls, key: str, value: object) -> None:
+        """キャッシュを保存する。
+
+        キャッシュの保存に失敗した場合でも、処理は継続する。
+
+        Args:
+            key (str): キャッシュのキー
+            value (object): キャッシュする値
+        """
+        try:
+            os.makedirs(cls.DIRECTORY, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cls.DIRECTORY, suffix='.tmp', delete=False) as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, cls.DIRECTORY.joinpath(f'{key}.pickle'))
+        except OSError:
+            pass
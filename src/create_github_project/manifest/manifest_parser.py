@@ -1,34 +1,90 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-from jinja2 import Template
 import yaml
 
 from .inputs_section import InputsSection
 from .assets_section import AssetsSection
+from .condition import Condition
+from .manifest_cache import ManifestCache
+from .theme_registry import ThemeRegistry
 from create_github_project.assets.asset import Asset
+from create_github_project.const import CONFIG_DIR, MANIFEST_FILE
+
+#: libyaml が利用可能な場合は、C 実装の Loader を利用する
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 class ManifestParser:
     """manifest file のパーサ。
 
+    パース結果は manifest file の内容をキーとしてキャッシュし、内容が変わらない限り再利用する。
+    テーマは `registry` で探索し、指定されたテーマの manifest file のみを読み込む。
+
     Args:
         theme (str): テーマ名
+
+    Raises:
+        FileNotFoundError: テーマが存在しない場合
     """
 
     _ROOT = Path(__file__).parent.joinpath('../templates')
     THEMES = _ROOT.joinpath('themes')
     COMPONENTS = _ROOT.joinpath('components')
+    #: ユーザーが追加するテーマの格納先
+    USER_THEMES = CONFIG_DIR.joinpath('themes')
 
     def __init__(self, theme: str):
+        theme_dir = self.registry().find(theme)
+        with open(theme_dir.joinpath(MANIFEST_FILE), 'rb') as f:
+            data = f.read()
+
+        key = ManifestCache.key(data)
+        sections = ManifestCache.get(key)
+        if sections is None:
+            sections = self._parse(data)
+            ManifestCache.put(key, sections)
 
-        with open(self.THEMES.joinpath(theme).joinpath('manifest.yaml'), 'r') as f:
-            manifest = yaml.safe_load(f)
+        self._name = theme
+        self._theme = theme_dir
+        self._inputs, self._assets, self._follow_ups = sections
 
-        self._theme = self.THEMES.joinpath(theme)
-        self._inputs = InputsSection(manifest['inputs'])
-        self._assets = AssetsSection(manifest['assets'])
-        self._follow_ups = manifest['followUps']
+    @classmethod
+    def registry(cls) -> ThemeRegistry:
+        """利用可能なテーマの一覧を返す。
+
+        パッケージに同梱するテーマ、ユーザーが追加したテーマ、entry point で登録されたテーマの順に優先する。
+
+        Returns:
+            ThemeRegistry: テーマの一覧
+        """
+        return ThemeRegistry([('package', cls.THEMES), ('user', cls.USER_THEMES)])
+
+    @property
+    def theme(self) -> str:
+        """str: テーマ名"""
+        return self._name
+
+    @staticmethod
+    def _parse(data: bytes) -> Tuple[InputsSection, AssetsSection, List[Tuple[Condition, str]]]:
+        """manifest file をパースする。
+
+        Args:
+            data (bytes): manifest file の内容
+
+        Returns:
+            Tuple[InputsSection, AssetsSection, List[Tuple[Condition, str]]]: 下記のタプル
+
+                * inputs セクション
+                * assets セクション
+                * followUps セクションの条件式と内容
+        """
+        manifest = yaml.load(data, Loader=YAML_LOADER)
+        return (
+            InputsSection(manifest['inputs']),
+            AssetsSection(manifest['assets']),
+            [(Condition(f.get('if')), f['content']) for f in manifest['followUps']]
+        )
 
     def get_parameter_names(self) -> List[str]:
         """manifest file で定義された、インプットパラメータ名の一覧を返す。
@@ -76,16 +132,28 @@ class ManifestParser:
                                       inputs=inputs)
 
         # map to asset instance
-        assets = []
-        for a in arr:
-            src_raw = a['source']
-            dest = a['destination']
-            if src_raw.startswith('@'):
-                assets.append(Asset(self.COMPONENTS.joinpath(src_raw[1:]), dest))
-            else:
-                assets.append(Asset(self._theme.joinpath(src_raw), dest))
+        return [Asset(self.get_source(a['source']), a['destination'], a['normalize_newline']) for a in arr]
+
+    def get_asset_names(self) -> List[str]:
+        """manifest file で定義された、条件に依らない全ての component の名前を返す。
+
+        Returns:
+            List[str]: component の名前。`@` で始まる場合は、テーマ間で共有する component。
+        """
+        return self._assets.names
+
+    def get_source(self, name: str) -> Path:
+        """component の格納先を返す。
+
+        Args:
+            name (str): component の名前
 
-        return assets
+        Returns:
+            Path: component の格納先
+        """
+        if name.startswith('@'):
+            return self.COMPONENTS.joinpath(name[1:])
+        return self._theme.joinpath(name)
 
     def get_follow_up(self,
                       indent: int,
@@ -113,9 +181,9 @@ class ManifestParser:
         }
 
         msg = []
-        for f in self._follow_ups:
-            if Template(f.get('if', 'True')).render(**params) == 'True':
-                content = '\n'.join(' ' * indent + line for line in f['content'].split('\n'))
+        for condition, content in self._follow_ups:
+            if condition.evaluate(**params):
+                content = '\n'.join(' ' * indent + line for line in content.split('\n'))
                 msg.append(content)
 
         return '\n\n'.join(msg)
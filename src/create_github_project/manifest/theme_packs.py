@@ -0,0 +1,240 @@
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Dict, Iterator, List, Tuple, Union
+
+from create_github_project.const import CACHE_DIR, MANIFEST_FILE
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows
+    fcntl = None
+
+
+class ThemePacks:
+    """リモートの Git リポジトリから取得したテーマ (テーマパック) を管理するクラス。
+
+    テーマパックは `<Git リポジトリの URL>@<ref>` 形式の名前で指定し、リポジトリのルートに manifest file を含むものとする。
+    取得したテーマは commit の SHA-1 をディレクトリ名とするスナップショットとして保存し、以後は変更しない。
+    名前と SHA-1 の対応も保存するため、取得後のテーマの利用ではリモートリポジトリに接続しない。
+    スナップショットの合計サイズが上限を超えた場合は、最後に利用した日時が古いものから削除する。
+    """
+
+    #: スナップショット格納先
+    DIRECTORY = CACHE_DIR.joinpath('theme_packs')
+    #: スナップショットの合計サイズの上限 (byte)
+    MAX_SIZE = 256 * 1024 * 1024
+
+    #: 名前と SHA-1 の対応、スナップショットのサイズを保存するファイル名
+    _INDEX_FILE = 'index.json'
+
+    @staticmethod
+    def split(spec: str) -> Union[Tuple[str, str], None]:
+        """テーマパックの名前を、Git リポジトリの URL と ref に分割する。
+
+        Args:
+            spec (str): テーマパックの名前
+
+        Returns:
+            Union[Tuple[str, str], None]: Git リポジトリの URL と ref。テーマパックの名前の形式でない場合は None。
+        """
+        url, _, ref = spec.rpartition('@')
+        # `git@host:owner/repo.git` 形式の URL の `@` を ref の区切りと誤認しないよう、ref に `:` を含むものは除く
+        if not url or not ref or ':' in ref:
+            return None
+        return url, ref
+
+    @classmethod
+    def resolve(cls, spec: str) -> Union[Path, None]:
+        """取得済みのテーマパックの格納先を返す。リモートリポジトリには接続しない。
+
+        Args:
+            spec (str): テーマパックの名前
+
+        Returns:
+            Union[Path, None]: テーマパックの格納先。取得していない場合は None。
+        """
+        sha = cls._load_index()['refs'].get(spec)
+        if sha is None:
+            return None
+        path = cls.DIRECTORY.joinpath(sha)
+        try:
+            # 削除対象の選択のため、最後に利用した日時を更新する
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    @classmethod
+    def snapshots(cls) -> Dict[str, Path]:
+        """取得済みのテーマパックの一覧を返す。最後に利用した日時は更新しない。
+
+        Returns:
+            Dict[str, Path]: テーマパックの名前と格納先の対応。名前の昇順に並ぶ。
+        """
+        refs = cls._load_index()['refs']
+        return {
+            spec: cls.DIRECTORY.joinpath(sha)
+            for spec, sha in sorted(refs.items()) if cls.DIRECTORY.joinpath(sha).is_dir()
+        }
+
+    @classmethod
+    def fetch(cls, spec: str) -> Tuple[str, List[str]]:
+        """リモートリポジトリからテーマパックを取得する。
+
+        ref の指す commit のスナップショットが既に存在する場合は、名前と SHA-1 の対応のみを更新する。
+
+        Args:
+            spec (str): テーマパックの名前
+
+        Returns:
+            Tuple[str, List[str]]: 取得した commit の SHA-1 と、上限サイズを超えたため削除したスナップショットの SHA-1
+
+        Raises:
+            ValueError: テーマパックの名前が不正な場合、テーマパックの取得に失敗した場合
+        """
+        parsed = cls.split(spec)
+        if parsed is None:
+            raise ValueError(f'Theme pack must be `<git-url>@<ref>`: {spec}')
+        url, ref = parsed
+
+        # GitPython は利用時に import する
+        import git
+
+        os.makedirs(cls.DIRECTORY, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=cls.DIRECTORY, prefix='.fetch-'))
+        repo = git.Repo.init(tmp)
+        try:
+            try:
+                repo.git.fetch('--depth=1', url, ref)
+                sha = repo.git.rev_parse('FETCH_HEAD^{commit}')
+            except git.GitCommandError as e:
+                raise ValueError(f'Failed to fetch {spec}: {e.stderr.strip()}')
+
+            # 他のプロセスによるスナップショットの削除、名前と SHA-1 の対応の更新と競合しないよう、ロックを取得して反映する
+            with cls._lock():
+                path = cls.DIRECTORY.joinpath(sha)
+                size = None
+                if not path.is_dir():
+                    repo.git.checkout(sha)
+                    repo.close()
+                    shutil.rmtree(tmp.joinpath('.git'))
+                    if not tmp.joinpath(MANIFEST_FILE).is_file():
+                        raise ValueError(f'{MANIFEST_FILE} is not found at the root of {spec}.')
+                    size = cls._size(tmp)
+                    os.replace(tmp, path)
+
+                index = cls._load_index()
+                index['refs'][spec] = sha
+                if size is None and sha not in index['sizes']:
+                    # 名前と SHA-1 の対応のファイルが失われた場合など
+                    size = cls._size(path)
+                if size is not None:
+                    index['sizes'][sha] = size
+                os.utime(path)
+                evicted = cls._evict(index, keep=sha)
+                cls._dump_index(index)
+        finally:
+            repo.close()
+            shutil.rmtree(tmp, ignore_errors=True)
+
+        return sha, evicted
+
+    @classmethod
+    def _evict(cls, index: Dict[str, Dict[str, object]], keep: str) -> List[str]:
+        """合計サイズが上限を超えたスナップショットを、最後に利用した日時が古いものから削除する。
+
+        Args:
+            index (Dict[str, Dict[str, object]]): 名前と SHA-1 の対応、スナップショットのサイズ。削除したものは取り除く。
+            keep (str): 削除しないスナップショットの SHA-1
+
+        Returns:
+            List[str]: 削除したスナップショットの SHA-1
+        """
+        entries = []
+        for sha, size in index['sizes'].items():
+            try:
+                entries.append((os.stat(cls.DIRECTORY.joinpath(sha)).st_mtime, sha, size))
+            except OSError:
+                continue
+
+        evicted = []
+        total = sum(e[2] for e in entries)
+        for _, sha, size in sorted(entries):
+            if total <= cls.MAX_SIZE:
+                break
+            if sha == keep:
+                continue
+            shutil.rmtree(cls.DIRECTORY.joinpath(sha), ignore_errors=True)
+            evicted.append(sha)
+            total -= size
+
+        # 削除したもの、既に存在しないものの対応を取り除く
+        index['sizes'] = {sha: size for _, sha, size in entries if sha not in evicted}
+        index['refs'] = {spec: sha for spec, sha in index['refs'].items() if sha in index['sizes']}
+        return evicted
+
+    @staticmethod
+    def _size(root: Path) -> int:
+        """ディレクトリ内のファイルの合計サイズを返す。
+
+        Args:
+            root (Path): ディレクトリ
+
+        Returns:
+            int: 合計サイズ (byte)
+        """
+        total = 0
+        for d, _, files in os.walk(root):
+            for f in files:
+                total += os.lstat(os.path.join(d, f)).st_size
+        return total
+
+    @classmethod
+    def _load_index(cls) -> Dict[str, Dict[str, object]]:
+        """名前と SHA-1 の対応、スナップショットのサイズを読み込む。
+
+        Returns:
+            Dict[str, Dict[str, object]]: refs (名前と SHA-1 の対応) と sizes (SHA-1 とサイズの対応)。
+            読み込めない場合は空。
+        """
+        try:
+            with open(cls.DIRECTORY.joinpath(cls._INDEX_FILE), 'r') as f:
+                data = json.load(f)
+            return {'refs': dict(data['refs']), 'sizes': dict(data['sizes'])}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {'refs': {}, 'sizes': {}}
+
+    @classmethod
+    @contextmanager
+    def _lock(cls) -> Iterator[None]:
+        """スナップショットと、名前と SHA-1 の対応を更新するための排他ロックを取得する。
+
+        ロックには、名前と SHA-1 の対応のファイルとは別のファイルを利用する (置き換えによりロックが外れないようにするため)。
+        """
+        os.makedirs(cls.DIRECTORY, exist_ok=True)
+        with open(cls.DIRECTORY.joinpath(cls._INDEX_FILE + '.lock'), 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    @classmethod
+    def _dump_index(cls, index: Dict[str, Dict[str, object]]) -> None:
+        """名前と SHA-1 の対応、スナップショットのサイズを保存する。
+
+        ロックを取得した状態で呼び出す。
+
+        Args:
+            index (Dict[str, Dict[str, object]]): refs (名前と SHA-1 の対応) と sizes (SHA-1 とサイズの対応)
+        """
+        with tempfile.NamedTemporaryFile('w', dir=cls.DIRECTORY, suffix='.tmp', delete=False) as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(f.name, cls.DIRECTORY.joinpath(cls._INDEX_FILE))
@@ -0,0 +1,281 @@
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Dict, List, Tuple, Union
+
+from .theme_packs import ThemePacks
+from create_github_project.const import CACHE_DIR, MANIFEST_FILE
+
+
+class ThemeInfo:
+    """テーマの一覧表示に利用するメタデータ。
+
+    Args:
+        name (str): テーマ名
+        path (Path): テーマの格納先
+        origin (str): テーマの提供元 (package, user, pack, entry point)
+        inputs (Union[List[str], None]): インプットパラメータ名。マニフェストファイルが不正な場合は None。
+        assets (Union[List[str], None]): リソースの名前。マニフェストファイルが不正な場合は None。
+    """
+
+    def __init__(self,
+                 name: str,
+                 path: Path,
+                 origin: str,
+                 inputs: Union[List[str], None],
+                 assets: Union[List[str], None]) -> None:
+        self._name = name
+        self._path = path
+        self._origin = origin
+        self._inputs = inputs
+        self._assets = assets
+
+    @property
+    def name(self) -> str:
+        """str: テーマ名"""
+        return self._name
+
+    @property
+    def path(self) -> Path:
+        """Path: テーマの格納先"""
+        return self._path
+
+    @property
+    def origin(self) -> str:
+        """str: テーマの提供元 (package, user, pack, entry point)"""
+        return self._origin
+
+    @property
+    def inputs(self) -> Union[List[str], None]:
+        """Union[List[str], None]: インプットパラメータ名。マニフェストファイルが不正な場合は None。"""
+        return self._inputs
+
+    @property
+    def assets(self) -> Union[List[str], None]:
+        """Union[List[str], None]: リソースの名前。マニフェストファイルが不正な場合は None。"""
+        return self._assets
+
+
+class ThemeRegistry:
+    """利用可能なテーマを管理するクラス。
+
+    テーマはテーマ格納先のディレクトリ、取得済みのテーマパック (`<Git リポジトリの URL>@<ref>` 形式の名前)、
+    entry point の順に探索し、同名のテーマは先に見つかったものを利用する。
+    テーマの探索ではマニフェストファイルを読み込まず、選択されたテーマのみを ManifestParser で読み込む。
+    一覧表示用のメタデータはマニフェストファイルの stat 情報をキーとしてディスクにキャッシュし、
+    マニフェストファイルが更新されない限り読み込みを省略する。
+
+    entry point は `create_github_project.themes` グループに登録し、テーマの格納先 (パッケージ、または
+    パスを返す属性) を指定する。entry point の import はテーマの選択時、または一覧表示時にのみ行う。
+
+    Args:
+        directories (List[Tuple[str, Path]]): テーマの提供元とテーマ格納先のディレクトリ。先頭のものを優先する。
+    """
+
+    #: entry point のグループ名
+    ENTRY_POINT_GROUP = 'create_github_project.themes'
+    #: メタデータのキャッシュ格納先
+    INDEX_PATH = CACHE_DIR.joinpath('themes.json')
+
+    def __init__(self, directories: List[Tuple[str, Path]]) -> None:
+        self._directories = directories
+
+    def names(self) -> List[str]:
+        """利用可能なテーマ名の一覧を返す。
+
+        Returns:
+            List[str]: テーマ名。探索順に並ぶ。
+        """
+        return list(self._discover().keys())
+
+    def find(self, name: str) -> Path:
+        """テーマの格納先を返す。
+
+        テーマパックはリモートリポジトリに接続せず、取得済みのスナップショットから探索する。
+        テーマ格納先のディレクトリとテーマパックに無い場合のみ、entry point を探索する。
+
+        Args:
+            name (str): テーマ名
+
+        Returns:
+            Path: テーマの格納先
+
+        Raises:
+            FileNotFoundError: テーマが存在しない場合
+        """
+        if ThemePacks.split(name) is not None:
+            path = ThemePacks.resolve(name)
+            if path is not None and path.joinpath(MANIFEST_FILE).is_file():
+                return path
+
+        # テーマ格納先の外を参照しないよう、パス区切りを含む名前は扱わない
+        if name and name == Path(name).name and name not in ('.', '..'):
+            for _, directory in self._directories:
+                path = directory.joinpath(name)
+                if path.joinpath(MANIFEST_FILE).is_file():
+                    return path
+
+            ep = self._entry_points().get(name)
+            if ep is not None:
+                path = self._load_entry_point(ep)
+                if path is not None and path.joinpath(MANIFEST_FILE).is_file():
+                    return path
+
+        raise FileNotFoundError(f'Theme `{name}` not found.')
+
+    def index(self) -> List[ThemeInfo]:
+        """利用可能なテーマのメタデータを返す。
+
+        Returns:
+            List[ThemeInfo]: テーマのメタデータ。探索順に並ぶ。
+        """
+        cache = self._load_index()
+        updated = False
+
+        infos = []
+        for name, (origin, path) in self._discover().items():
+            if path is None:
+                continue
+            manifest = path.joinpath(MANIFEST_FILE)
+            try:
+                st = os.stat(manifest)
+            except OSError:
+                continue
+
+            key = manifest.resolve().as_posix()
+            stat = [st.st_mtime_ns, st.st_size]
+            entry = cache.get(key)
+            if entry is None or entry['stat'] != stat:
+                entry = dict(self._read_metadata(manifest), stat=stat)
+                cache[key] = entry
+                updated = True
+            infos.append(ThemeInfo(name, path, origin, entry['inputs'], entry['assets']))
+
+        if updated:
+            self._dump_index(cache)
+        return infos
+
+    def _discover(self) -> Dict[str, Tuple[str, Union[Path, None]]]:
+        """利用可能なテーマを探索する。
+
+        Returns:
+            Dict[str, Tuple[str, Union[Path, None]]]: テーマ名と、提供元と格納先のタプルの対応。
+            entry point の読み込みに失敗した場合の格納先は None。
+        """
+        themes = {}
+        for origin, directory in self._directories:
+            try:
+                names = sorted(os.listdir(directory))
+            except OSError:
+                continue
+            for name in names:
+                if name not in themes and directory.joinpath(name, MANIFEST_FILE).is_file():
+                    themes[name] = (origin, directory.joinpath(name))
+
+        for spec, path in ThemePacks.snapshots().items():
+            themes.setdefault(spec, ('pack', path))
+
+        for name, ep in sorted(self._entry_points().items()):
+            if name not in themes:
+                themes[name] = ('entry point', self._load_entry_point(ep))
+
+        return themes
+
+    @classmethod
+    def _entry_points(cls) -> Dict[str, object]:
+        """テーマを登録する entry point を返す。
+
+        Returns:
+            Dict[str, object]: テーマ名と entry point の対応
+        """
+        # 起動を高速化するため、利用時に import する
+        try:
+            from importlib import metadata
+        except ImportError:  # pragma: no cover
+            # Python 3.7 では、backport がインストールされている場合のみ entry point を利用する
+            try:
+                import importlib_metadata as metadata
+            except ImportError:
+                return {}
+
+        eps = metadata.entry_points()
+        if hasattr(eps, 'select'):
+            eps = eps.select(group=cls.ENTRY_POINT_GROUP)
+        else:  # pragma: no cover
+            eps = eps.get(cls.ENTRY_POINT_GROUP, [])
+        return {ep.name: ep for ep in eps}
+
+    @staticmethod
+    def _load_entry_point(ep: object) -> Union[Path, None]:
+        """entry point からテーマの格納先を取得する。
+
+        Args:
+            ep (importlib.metadata.EntryPoint): entry point
+
+        Returns:
+            Union[Path, None]: テーマの格納先。読み込みに失敗した場合は None。
+        """
+        try:
+            obj = ep.load()
+        except Exception:
+            return None
+        if isinstance(obj, (str, os.PathLike)):
+            return Path(obj)
+        if getattr(obj, '__file__', None):
+            return Path(obj.__file__).parent
+        return None
+
+    @staticmethod
+    def _read_metadata(manifest: Path) -> Dict[str, Union[List[str], None]]:
+        """マニフェストファイルから、一覧表示用のメタデータのみを取得する。
+
+        条件式のコンパイルなど、ManifestParser による読み込みは行わない。
+
+        Args:
+            manifest (Path): マニフェストファイル
+
+        Returns:
+            Dict[str, Union[List[str], None]]: インプットパラメータ名とリソースの名前
+        """
+        # 起動を高速化するため、利用時に import する
+        import yaml
+        from .manifest_parser import YAML_LOADER
+
+        try:
+            with open(manifest, 'rb') as f:
+                data = yaml.load(f, Loader=YAML_LOADER)
+            return {
+                'inputs': [i['name'] for i in data['inputs']],
+                'assets': [a['name'] for a in data['assets']]
+            }
+        except (OSError, yaml.YAMLError, KeyError, TypeError):
+            return {'inputs': None, 'assets': None}
+
+    @classmethod
+    def _load_index(cls) -> Dict[str, Dict[str, object]]:
+        """メタデータのキャッシュを読み込む。
+
+        Returns:
+            Dict[str, Dict[str, object]]: マニフェストファイルのパスとメタデータの対応。読み込めない場合は空。
+        """
+        try:
+            with open(cls.INDEX_PATH, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _dump_index(cls, cache: Dict[str, Dict[str, object]]) -> None:
+        """メタデータのキャッシュを保存する。保存に失敗した場合でも、処理は継続する。
+
+        Args:
+            cache (Dict[str, Dict[str, object]]): マニフェストファイルのパスとメタデータの対応
+        """
+        try:
+            os.makedirs(cls.INDEX_PATH.parent, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=cls.INDEX_PATH.parent, suffix='.tmp', delete=False) as f:
+                json.dump(cache, f)
+            os.replace(f.name, cls.INDEX_PATH)
+        except OSError:
+            pass
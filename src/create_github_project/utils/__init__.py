@@ -1,9 +1,10 @@
 from .accounts import Accounts
-from .utility_fn import get_commit_types, get_languages, to_remote_urls
+from .utility_fn import get_commit_types, get_languages, to_option_value, to_remote_urls
 
 __all__ = [
     'Accounts',
     'get_commit_types',
     'get_languages',
+    'to_option_value',
     'to_remote_urls'
 ]
@@ -0,0 +1,316 @@
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows
+    fcntl = None
+
+
+class JsonAccountStore:
+    """JSON ファイルに保存する、GitHub アカウントの一覧。
+
+    複数のプロセスから同時に更新できるよう、ファイルは排他ロックを取得した上で最新の内容を読み直して更新し、
+    一時ファイルへの書き込みと rename により置き換える。
+    また、ファイルの内容は stat 情報が変わらない限り、同一プロセス内で再利用する。
+
+    Args:
+        path (Path): アカウント一覧のファイル
+    """
+
+    # ファイルのパスと、stat 情報と内容の対応
+    _cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Dict[str, str]]]] = {}
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._accounts = self._read()
+
+    def exists(self, account_id: str) -> bool:
+        """対象アカウントが登録されているかどうかを返す。
+
+        Args:
+            account_id (str): GitHub アカウント ID
+
+        Returns:
+            bool: 登録されているかどうか
+        """
+        return account_id in self._accounts.keys()
+
+    def get(self, account_id: str) -> Dict[str, str]:
+        """アカウント情報を返す。
+
+        Args:
+            account_id (str): GitHub アカウント ID
+
+        Returns:
+            Dict[str, str]: アカウント情報
+
+        Raises:
+            KeyError: 対象アカウントが登録されていない場合
+        """
+        return self._accounts[account_id]
+
+    def ids(self) -> List[str]:
+        """登録されている GitHub アカウント ID の一覧を返す。
+
+        Returns:
+            List[str]: GitHub アカウント ID
+        """
+        return list(self._accounts.keys())
+
+    def items(self) -> List[Tuple[str, Dict[str, str]]]:
+        """登録されているアカウントを、GitHub アカウント ID の昇順に返す。
+
+        Returns:
+            List[Tuple[str, Dict[str, str]]]: GitHub アカウント ID とアカウント情報
+        """
+        return sorted(self._accounts.items())
+
+    def search(self, prefix: str) -> List[str]:
+        """GitHub アカウント ID を前方一致で検索する。
+
+        Args:
+            prefix (str): GitHub アカウント ID の接頭辞
+
+        Returns:
+            List[str]: 一致した GitHub アカウント ID。昇順に並ぶ。
+        """
+        return sorted(a for a in self._accounts.keys() if a.startswith(prefix))
+
+    def count(self) -> int:
+        """登録されているアカウントの数を返す。
+
+        Returns:
+            int: アカウントの数
+        """
+        return len(self._accounts)
+
+    def add(self, accounts: Dict[str, Dict[str, str]]) -> List[str]:
+        """アカウントを登録する。既に登録されているアカウントは上書きしない。
+
+        Args:
+            accounts (Dict[str, Dict[str, str]]): GitHub アカウント ID とアカウント情報の対応
+
+        Returns:
+            List[str]: 登録した GitHub アカウント ID
+        """
+        with self._lock():
+            self._accounts = self._read()
+            added = [a for a in accounts.keys() if a not in self._accounts.keys()]
+            for account_id in added:
+                self._accounts[account_id] = accounts[account_id]
+            if added:
+                self._update_file()
+        return added
+
+    def drop(self, account_id: str) -> None:
+        """アカウントの登録を削除する。
+
+        Args:
+            account_id (str): GitHub アカウント ID
+
+        Raises:
+            KeyError: 対象アカウントが登録されていない場合
+        """
+        with self._lock():
+            self._accounts = self._read()
+            _ = self._accounts.pop(account_id)
+            self._update_file()
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        """アカウント一覧のファイルを読み込む。
+
+        Returns:
+            Dict[str, Dict[str, str]]: GitHub アカウント ID とアカウント情報の対応。ファイルが存在しない場合は空。
+        """
+        key = self._path.as_posix()
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return {}
+
+        # ファイルは rename で置き換えるため、inode も比較する
+        stat = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != stat:
+            with open(self._path, 'r') as f:
+                cached = (stat, json.load(f))
+            self._cache[key] = cached
+
+        # 呼び出し元での更新がキャッシュに影響しないよう、複製を返す
+        return dict(cached[1])
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """アカウント一覧のファイルの排他ロックを取得する。
+
+        ロックには、アカウント一覧のファイルとは別のファイルを利用する (置き換えによりロックが外れないようにするため)。
+        """
+        os.makedirs(self._path.parent, exist_ok=True)
+        with open(self._path.parent.joinpath(self._path.name + '.lock'), 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _update_file(self) -> None:
+        """アカウント一覧のファイルを更新する。
+
+        ロックを取得した状態で呼び出す。
+        """
+        with tempfile.NamedTemporaryFile('w', dir=self._path.parent, suffix='.tmp', delete=False) as f:
+            json.dump(self._accounts, f, indent=4)
+        try:
+            os.replace(f.name, self._path)
+        except OSError:
+            os.remove(f.name)
+            raise
+
+        st = os.stat(self._path)
+        self._cache[self._path.as_posix()] = ((st.st_ino, st.st_mtime_ns, st.st_size), dict(self._accounts))
+
+
+class SqliteAccountStore:
+    """SQLite のデータベースに保存する、GitHub アカウントの一覧。
+
+    登録数が多い場合向けに、全件を読み込まずに GitHub アカウント ID の索引 (主キー) で検索する。
+    同時更新の排他制御は SQLite に委ねる。
+
+    Args:
+        path (Path): データベースのファイル
+    """
+
+    #: 同時更新時のロック待ちの上限 (秒)
+    TIMEOUT = 30
+
+    def __init__(self, path: Path) -> None:
+        # 起動を高速化するため、利用時に import する
+        import sqlite3
+
+        os.makedirs(path.parent, exist_ok=True)
+        self._conn = sqlite3.connect(path.as_posix(), timeout=self.TIMEOUT)
+        with self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS accounts ('
+                'account_id TEXT PRIMARY KEY, display_name TEXT NOT NULL, homepage TEXT NOT NULL'
+                ') WITHOUT ROWID'
+            )
+
+    def close(self) -> None:
+        """データベースとの接続を閉じる。
+        """
+        self._conn.close()
+
+    def exists(self, account_id: str) -> bool:
+        """対象アカウントが登録されているかどうかを返す。
+
+        Args:
+            account_id (str): GitHub アカウント ID
+
+        Returns:
+            bool: 登録されているかどうか
+        """
+        cur = self._conn.execute('SELECT 1 FROM accounts WHERE account_id = ?', (account_id,))
+        return cur.fetchone() is not None
+
+    def get(self, account_id: str) -> Dict[str, str]:
+        """アカウント情報を返す。
+
+        Args:
+            account_id (str): GitHub アカウント ID
+
+        Returns:
+            Dict[str, str]: アカウント情報
+
+        Raises:
+            KeyError: 対象アカウントが登録されていない場合
+        """
+        cur = self._conn.execute('SELECT display_name, homepage FROM accounts WHERE account_id = ?', (account_id,))
+        row = cur.fetchone()
+        if row is None:
+            raise KeyError(account_id)
+        return {'display_name': row[0], 'homepage': row[1]}
+
+    def ids(self) -> List[str]:
+        """登録されている GitHub アカウント ID の一覧を返す。
+
+        Returns:
+            List[str]: GitHub アカウント ID
+        """
+        return [row[0] for row in self._conn.execute('SELECT account_id FROM accounts ORDER BY account_id')]
+
+    def items(self) -> List[Tuple[str, Dict[str, str]]]:
+        """登録されているアカウントを、GitHub アカウント ID の昇順に返す。
+
+        Returns:
+            List[Tuple[str, Dict[str, str]]]: GitHub アカウント ID とアカウント情報
+        """
+        cur = self._conn.execute('SELECT account_id, display_name, homepage FROM accounts ORDER BY account_id')
+        return [(row[0], {'display_name': row[1], 'homepage': row[2]}) for row in cur]
+
+    def search(self, prefix: str) -> List[str]:
+        """GitHub アカウント ID を前方一致で検索する。
+
+        LIKE は大文字と小文字を区別しないため索引を利用できない。範囲の条件で検索する。
+
+        Args:
+            prefix (str): GitHub アカウント ID の接頭辞
+
+        Returns:
+            List[str]: 一致した GitHub アカウント ID。昇順に並ぶ。
+        """
+        cur = self._conn.execute(
+            'SELECT account_id FROM accounts WHERE account_id >= ? AND account_id < ? ORDER BY account_id',
+            (prefix, prefix + '\U0010ffff')
+        )
+        return [row[0] for row in cur]
+
+    def count(self) -> int:
+        """登録されているアカウントの数を返す。
+
+        Returns:
+            int: アカウントの数
+        """
+        return self._conn.execute('SELECT COUNT(*) FROM accounts').fetchone()[0]
+
+    def add(self, accounts: Dict[str, Dict[str, str]]) -> List[str]:
+        """アカウントを登録する。既に登録されているアカウントは上書きしない。
+
+        Args:
+            accounts (Dict[str, Dict[str, str]]): GitHub アカウント ID とアカウント情報の対応
+
+        Returns:
+            List[str]: 登録した GitHub アカウント ID
+        """
+        added = []
+        with self._conn:
+            for account_id, info in accounts.items():
+                cur = self._conn.execute(
+                    'INSERT OR IGNORE INTO accounts (account_id, display_name, homepage) VALUES (?, ?, ?)',
+                    (account_id, info['display_name'], info['homepage'])
+                )
+                if cur.rowcount:
+                    added.append(account_id)
+        return added
+
+    def drop(self, account_id: str) -> None:
+        """アカウントの登録を削除する。
+
+        Args:
+            account_id (str): GitHub アカウント ID
+
+        Raises:
+            KeyError: 対象アカウントが登録されていない場合
+        """
+        with self._conn:
+            cur = self._conn.execute('DELETE FROM accounts WHERE account_id = ?', (account_id,))
+        if not cur.rowcount:
+            raise KeyError(account_id)
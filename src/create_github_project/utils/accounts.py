@@ -1,23 +1,46 @@
-import json
-from operator import itemgetter
 import os
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
-from github import Github
+from .account_stores import JsonAccountStore, SqliteAccountStore
+from .github_users import GitHubUsers
 
 
 class Accounts:
+    """ツール管理下にある GitHub アカウントの一覧。
+
+    アカウントは JSON ファイルに保存する。`migrate` により SQLite のデータベースへ移行した後は、データベースを利用する。
+    パラメータの検証など、同一プロセス内で何度も参照する場合は `shared` で取得したインスタンスを共有する。
+    """
 
     #: アカウント一覧を管理するファイル
     FILE_PATH = Path(os.path.expanduser('~')).joinpath('.create-github-project/accounts.json')
+    #: アカウント一覧を管理するデータベース
+    DB_PATH = Path(os.path.expanduser('~')).joinpath('.create-github-project/accounts.sqlite3')
+
+    # 保存先と、プロセス内で共有するインスタンスの対応
+    _shared: Dict[Tuple[str, str], 'Accounts'] = {}
 
     def __init__(self):
         # アカウント一覧を取得しておく。
-        self._accounts = {}
-        if self.initialized():
-            with open(self.FILE_PATH, 'r') as f:
-                self._accounts = json.load(f)
+        if self.DB_PATH.exists():
+            self._store = SqliteAccountStore(self.DB_PATH)
+        else:
+            self._store = JsonAccountStore(self.FILE_PATH)
+
+    @classmethod
+    def shared(cls) -> 'Accounts':
+        """プロセス内で共有するインスタンスを返す。
+
+        アカウント一覧の読み込みは、保存先ごとに初回の呼び出し時のみ行う。
+
+        Returns:
+            Accounts: インスタンス
+        """
+        key = (cls.FILE_PATH.as_posix(), cls.DB_PATH.as_posix())
+        if key not in cls._shared:
+            cls._shared[key] = cls()
+        return cls._shared[key]
 
     def initialized(self) -> bool:
         """アカウントファイルが存在するかどうかを返す。
@@ -25,7 +48,7 @@ class Accounts:
         Returns:
             bool: アカウントファイルが存在するかどうか
         """
-        return self.FILE_PATH.exists()
+        return self.FILE_PATH.exists() or self.DB_PATH.exists()
 
     def exists(self, account_id: str) -> bool:
         """対象アカウントが既に管理下にあるかどうかを返す。
@@ -36,7 +59,7 @@ class Accounts:
         Returns:
             bool: 管理下にあるかどうか
         """
-        return account_id in self._accounts.keys()
+        return self._store.exists(account_id)
 
     def list(self) -> List[str]:
         """管理下にある GitHub アカウント ID の一覧を返す。
@@ -44,46 +67,90 @@ class Accounts:
         Returns:
             List[str]: 管理下にある GitHub アカウント ID
         """
-        return list(self._accounts.keys())
+        return self._store.ids()
+
+    def search(self, prefix: str) -> List[str]:
+        """管理下にある GitHub アカウント ID を前方一致で検索する。
+
+        Args:
+            prefix (str): GitHub アカウント ID の接頭辞
+
+        Returns:
+            List[str]: 一致した GitHub アカウント ID。昇順に並ぶ。
+        """
+        return self._store.search(prefix)
+
+    def count(self) -> int:
+        """管理下にある GitHub アカウントの数を返す。
+
+        Returns:
+            int: アカウントの数
+        """
+        return self._store.count()
 
     def dump_list(self) -> None:
         """管理下にある GitHub アカウントを標準出力に表示する。
         """
-        for account_id, info in sorted(self._accounts.items(), key=itemgetter(0)):
+        for account_id, info in self._store.items():
             print(f'- account_id   : {account_id}')
             print(f'  display_name : {info["display_name"]}')
             print(f'  homepage     : {info["homepage"]}')
 
-    def add(self, account_id: str, display_name: str) -> Union[str, None]:
+    def add(self, account_id: str, display_name: str, token: Union[str, None] = None) -> Union[str, None]:
         """GitHub アカウントをツール管理下に登録する。
 
         Args:
             account_id (str): GitHub アカウント ID
             display_name (str): 表示名
+            token (Union[str, None]): GitHub API の認証に利用するトークン
 
         Returns:
             Union[str, None]: 対象アカウントの URL, アカウント取得に失敗した場合 None
+
+        Raises:
+            github.GithubException: アカウントの取得に失敗した場合 (アカウントが存在しない場合を除く)
+            requests.RequestException: GitHub API に接続できない場合
+        """
+        return self.add_many({account_id: display_name}, token)[account_id]
+
+    def add_many(self,
+                 accounts: Dict[str, str],
+                 token: Union[str, None] = None,
+                 jobs: int = GitHubUsers.JOBS) -> Dict[str, Union[str, None]]:
+        """複数の GitHub アカウントをまとめてツール管理下に登録する。
+
+        アカウントの存在確認は並列に行い、アカウント一覧の更新は 1 度のみ行う。
+
+        Args:
+            accounts (Dict[str, str]): GitHub アカウント ID と表示名の対応
+            token (Union[str, None]): GitHub API の認証に利用するトークン
+            jobs (int): 存在確認の並列数
+
+        Returns:
+            Dict[str, Union[str, None]]: GitHub アカウント ID と URL の対応。
+            既に登録されている場合、アカウント取得に失敗した場合の URL は None。
+
+        Raises:
+            github.GithubException: アカウントの取得に失敗した場合 (アカウントが存在しない場合を除く)
+            requests.RequestException: GitHub API に接続できない場合
         """
-        # 既に登録されている場合
-        if account_id in self._accounts.keys():
-            return None
+        # 既に登録されているものは除く
+        targets = {a: name for a, name in accounts.items() if not self._store.exists(a)}
 
         # アカウント存在確認
-        try:
-            user = Github().get_user(account_id)
-        except Exception:
-            return None
+        homepages = GitHubUsers.resolve(list(targets.keys()), token, jobs) if targets else {}
 
         # 情報更新
-        self._accounts.update({
+        # 存在確認の間に他のプロセスが登録したものは上書きしない
+        self._store.add({
             account_id: dict(
-                display_name=display_name,
-                homepage=user.html_url
+                display_name=targets[account_id],
+                homepage=homepage
             )
+            for account_id, homepage in homepages.items() if homepage is not None
         })
-        self._update_file()
 
-        return user.html_url
+        return {a: homepages.get(a) for a in accounts.keys()}
 
     def drop(self, account_id: str) -> None:
         """GitHub アカウントを管理から外す。
@@ -91,13 +158,11 @@ class Accounts:
         Args:
             account_id (str): GitHub アカウント ID
         """
-        if account_id not in self._accounts.keys():
+        try:
+            self._store.drop(account_id)
+        except KeyError:
             raise ValueError(f"Account '{account_id}' is not under management.")
 
-        # 情報更新
-        _ = self._accounts.pop(account_id)
-        self._update_file()
-
     def get_account_info(self, account_id: str) -> Dict[str, str]:
         """GitHub アカウント情報を返す。
 
@@ -107,11 +172,30 @@ class Accounts:
         Returns:
             Dict[str, str]: アカウント情報
         """
-        return self._accounts[account_id]
+        return self._store.get(account_id)
+
+    def migrate(self) -> int:
+        """アカウント一覧を JSON ファイルから SQLite のデータベースへ移行する。
+
+        JSON ファイルは削除せずに残すが、移行後は利用しない。
+
+        Returns:
+            int: 移行したアカウントの数
 
-    def _update_file(self):
-        """アカウント一覧のファイルを更新する。
+        Raises:
+            FileExistsError: 移行済みの場合
         """
-        os.makedirs(self.FILE_PATH.parent, exist_ok=True)
-        with open(self.FILE_PATH, 'w') as f:
-            json.dump(self._accounts, f, indent=4)
+        if self.DB_PATH.exists():
+            raise FileExistsError(f'Accounts already migrated to {self.DB_PATH.as_posix()}.')
+
+        # 移行途中のデータベースを利用しないよう、一時ファイルに作成してから rename する
+        tmp = self.DB_PATH.parent.joinpath(self.DB_PATH.name + '.tmp')
+        if tmp.exists():
+            os.remove(tmp)
+        store = SqliteAccountStore(tmp)
+        added = store.add(dict(JsonAccountStore(self.FILE_PATH).items()))
+        store.close()
+        os.replace(tmp, self.DB_PATH)
+
+        self._store = SqliteAccountStore(self.DB_PATH)
+        return len(added)
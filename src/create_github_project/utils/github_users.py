@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List, Union
+
+from create_github_project.const import CACHE_DIR
+
+
+class GitHubUsers:
+    """GitHub アカウントの存在確認を行うクラス。
+
+    確認結果 (アカウントのページの URL) は一定期間ディスクにキャッシュし、同じアカウントの確認では GitHub API を呼び出さない。
+    存在しないアカウントは、作成される可能性があるためキャッシュしない。
+    複数のアカウントは、接続を共有して並列に確認する。
+    """
+
+    #: キャッシュ格納先
+    CACHE_PATH = CACHE_DIR.joinpath('github_users.json')
+    #: キャッシュの有効期間 (秒)
+    TTL = 7 * 24 * 60 * 60
+    #: 並列数のデフォルト値
+    JOBS = 8
+
+    @classmethod
+    def resolve(cls,
+                account_ids: List[str],
+                token: Union[str, None] = None,
+                jobs: int = JOBS) -> Dict[str, Union[str, None]]:
+        """GitHub アカウントのページの URL を返す。
+
+        Args:
+            account_ids (List[str]): GitHub アカウント ID
+            token (Union[str, None]): GitHub API の認証に利用するトークン。None の場合は環境変数 GITHUB_TOKEN の値を利用する。
+            jobs (int): 並列数
+
+        Returns:
+            Dict[str, Union[str, None]]: GitHub アカウント ID と URL の対応。アカウントが存在しない場合の URL は None。
+
+        Raises:
+            github.GithubException: アカウントの取得に失敗した場合 (アカウントが存在しない場合を除く)
+            requests.RequestException: GitHub API に接続できない場合
+        """
+        now = time.time()
+        cache = cls._load()
+
+        result = {}
+        missing = []
+        for account_id in dict.fromkeys(account_ids):
+            entry = cache.get(account_id)
+            if entry is not None and now - entry['fetched_at'] < cls.TTL:
+                result[account_id] = entry['homepage']
+            else:
+                missing.append(account_id)
+        if not missing:
+            return result
+
+        # 起動を高速化するため、利用時に import する
+        from github import Auth, Github
+
+        # 接続は全スレッドで共有する
+        token = token or os.environ.get('GITHUB_TOKEN')
+        gh = Github(auth=Auth.Token(token) if token else None, pool_size=jobs)
+        try:
+            with ThreadPoolExecutor(max_workers=min(jobs, len(missing))) as executor:
+                for account_id, homepage in zip(missing, executor.map(lambda a: cls._fetch(gh, a), missing)):
+                    result[account_id] = homepage
+                    if homepage is not None:
+                        cache[account_id] = {'homepage': homepage, 'fetched_at': now}
+        finally:
+            # 失敗した場合も、それまでに確認できたアカウントはキャッシュする
+            cls._dump(cache)
+
+        return result
+
+    @staticmethod
+    def _fetch(gh: object, account_id: str) -> Union[str, None]:
+        """GitHub API でアカウントを取得する。
+
+        Args:
+            gh (github.Github): GitHub API のクライアント
+            account_id (str): GitHub アカウント ID
+
+        Returns:
+            Union[str, None]: アカウントのページの URL。アカウントが存在しない場合は None。
+        """
+        from github import UnknownObjectException
+
+        try:
+            return gh.get_user(account_id).html_url
+        except UnknownObjectException:
+            return None
+
+    @classmethod
+    def _load(cls) -> Dict[str, Dict[str, object]]:
+        """キャッシュを読み込む。
+
+        Returns:
+            Dict[str, Dict[str, object]]: GitHub アカウント ID と確認結果の対応。読み込めない場合は空。
+        """
+        try:
+            with open(cls.CACHE_PATH, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _dump(cls, cache: Dict[str, Dict[str, object]]) -> None:
+        """キャッシュを保存する。保存に失敗した場合でも、処理は継続する。
+
+        Args:
+            cache (Dict[str, Dict[str, object]]): GitHub アカウント ID と確認結果の対応
+        """
+        try:
+            os.makedirs(cls.CACHE_PATH.parent, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=cls.CACHE_PATH.parent, suffix='.tmp', delete=False) as f:
+                json.dump(cache, f)
+            os.replace(f.name, cls.CACHE_PATH)
+        except OSError:
+            pass
@@ -1,11 +1,9 @@
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
 from typing import Dict, List, Tuple, Union
 
-from jinja2 import Template
-import questionary
-
 VERSIONRC = Path(__file__).parent.joinpath('../templates/components/core/release/.versionrc.json.jinja')
 LANGUAGES = Path(__file__).parent.joinpath('../templates/components/languages')
 
@@ -16,9 +14,23 @@ def get_commit_types() -> List[str]:
     Returns:
         List[str]: コミット型
     """
+    return list(_load_commit_types())
+
+
+@lru_cache(maxsize=None)
+def _load_commit_types() -> Tuple[str]:
+    """コミット型の一覧をテンプレートから読み込む。
+
+    テンプレートの置換は初回呼び出し時にのみ行う。
+
+    Returns:
+        Tuple[str]: コミット型
+    """
+    from jinja2 import Template
+
     with open(VERSIONRC, 'r') as f:
         data = Template(f.read()).render(commit_types=[])
-    return [t['type'] for t in json.loads(data)['types']]
+    return tuple(t['type'] for t in json.loads(data)['types'])
 
 
 def get_languages() -> List[str]:
@@ -65,6 +77,7 @@ def to_remote_urls(type_: str, name: Union[str, None]) -> Tuple[Union[str, None]
         if type_ == 'github':
             name = '${GITHUB_REPOSITORY}'
         elif type_ in ('gsr'):
+            import questionary
             name = questionary.text('Remote repository name?').unsafe_ask()
         else:
             raise NotImplementedError(f'Unsupported repository type `{type_}`.')
@@ -90,3 +103,19 @@ def to_remote_urls(type_: str, name: Union[str, None]) -> Tuple[Union[str, None]
         }, None
     else:
         raise NotImplementedError(f'Unsupported repository type `{type_}`.')
+
+
+def to_option_value(value: object) -> Union[str, None]:
+    """パラメータの値を CLI オプションと同じ文字列形式に変換する。
+
+    Args:
+        value (object): パラメータの値。辞書の場合はキーを値の一覧とみなす。
+
+    Returns:
+        Union[str, None]: カンマ区切りの文字列。値が None の場合は None。
+    """
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, dict)):
+        return ','.join(map(str, value))
+    return str(value)
@@ -0,0 +1,68 @@
+import os
+from pathlib import Path
+from py._path.local import LocalPath
+
+import pytest
+from pytest_mock import MockerFixture
+
+from create_github_project.assets import plumbing
+from create_github_project.assets.asset_index import AssetIndex
+
+
+@pytest.fixture
+def src_root(tmpdir: LocalPath) -> Path:
+    root = Path(tmpdir.strpath).joinpath('src')
+    root.joinpath('sub/dir').mkdir(parents=True)
+    root.joinpath('b.txt').write_text('b\n')
+    root.joinpath('a.txt.jinja').write_text('{{ repo_name }}\n')
+    root.joinpath('EXCLUDE-file.txt').write_text('excluded\n')
+    root.joinpath('sub/dir/c.txt').write_text('c\n')
+    yield root
+
+
+def test_get(src_root: Path) -> None:
+    entries = AssetIndex.get(src_root)
+    assert [e.path for e in entries] == ['a.txt.jinja', 'b.txt', 'sub/dir/c.txt']
+    assert [e.template for e in entries] == [True, False, False]
+    assert [e.size for e in entries] == [16, 2, 2]
+    assert entries[1].digest == plumbing.hash_blob(src_root.joinpath('b.txt')).hex()
+
+
+def test_cached(src_root: Path, mocker: MockerFixture) -> None:
+    AssetIndex.get(src_root)
+
+    # 同一プロセス内では索引を検証しない
+    walk = mocker.spy(os, 'walk')
+    validate = mocker.spy(AssetIndex, '_validate')
+    AssetIndex.get(src_root)
+    walk.assert_not_called()
+    validate.assert_not_called()
+
+    # ディスク上のキャッシュを利用する場合は stat 情報のみ参照する
+    AssetIndex.clear()
+    hash_blob = mocker.spy(plumbing, 'hash_blob')
+    assert [e.path for e in AssetIndex.get(src_root)] == ['a.txt.jinja', 'b.txt', 'sub/dir/c.txt']
+    walk.assert_not_called()
+    hash_blob.assert_not_called()
+
+
+def test_invalidated(src_root: Path, mocker: MockerFixture) -> None:
+    AssetIndex.get(src_root)
+    AssetIndex.clear()
+
+    # ファイルの追加と変更
+    src_root.joinpath('sub/d.txt').write_text('d\n')
+    src_root.joinpath('b.txt').write_text('bb\n')
+    os.utime(src_root.joinpath('b.txt'), ns=(0, 0))
+
+    hash_blob = mocker.spy(plumbing, 'hash_blob')
+    entries = AssetIndex.get(src_root)
+    assert [e.path for e in entries] == ['a.txt.jinja', 'b.txt', 'sub/d.txt', 'sub/dir/c.txt']
+    assert entries[1].digest == plumbing.hash_blob(src_root.joinpath('b.txt')).hex()
+    # 変更されていないファイルのハッシュ値は再計算しない
+    assert sorted(c.args[0].name for c in hash_blob.call_args_list) == ['b.txt', 'b.txt', 'd.txt']
+
+    # ファイルの削除
+    AssetIndex.clear()
+    os.remove(src_root.joinpath('sub/dir/c.txt'))
+    assert [e.path for e in AssetIndex.get(src_root)] == ['a.txt.jinja', 'b.txt', 'sub/d.txt']
@@ -4,6 +4,7 @@ from typing import Dict, List
 
 import git
 import pytest
+from pytest_mock import MockerFixture
 
 from create_github_project.assets import AssetManager
 from create_github_project.assets.asset import Asset
@@ -94,3 +95,16 @@ class TestManifestParser:
 
         repo = git.Repo(git_root)
         assert {b.name for b in repo.branches} == {production, 'develop'}
+
+    def test_index_written_once(self, mocker: MockerFixture, git_root: Path) -> None:
+        add = mocker.spy(git.IndexFile, 'add')
+        src = self.TEST_DATA_ROOT.joinpath('no_param')
+        assets = [Asset(src.joinpath('dir1'), '/'), Asset(src.joinpath('dir2'), '/')]
+        am = AssetManager(git_root, {}, 'no_param', self.PRODUCTION, self.COMMIT_TYPES, {}, {})
+
+        am.initialize(assets)
+
+        add.assert_called_once()
+        repo = git.Repo(git_root)
+        assert {e.path for e in repo.head.commit.tree.traverse()} >= {'file1.txt', 'subdir/file2.txt'}
+        assert not repo.is_dirty(untracked_files=True)
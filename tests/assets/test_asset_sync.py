@@ -0,0 +1,156 @@
+import json
+from pathlib import Path
+from py._path.local import LocalPath
+import subprocess
+from typing import Dict
+
+import git
+import pytest
+from pytest_mock import MockerFixture
+
+from create_github_project.assets import AssetManager, GitEngine
+from create_github_project.assets.asset import Asset
+from create_github_project.assets.asset_index import AssetIndex
+from create_github_project.assets.repo_state import RepoState
+
+
+class TestSync:
+
+    @pytest.fixture
+    def theme(self, tmpdir: LocalPath) -> Path:
+        root = Path(tmpdir.strpath).joinpath('theme')
+        root.mkdir()
+        root.joinpath('static.txt').write_text('static\n')
+        root.joinpath('template.txt.jinja').write_text('value: {{ inputs.value }}\n')
+        yield root
+
+    @pytest.fixture
+    def repo_dir(self, tmpdir: LocalPath, theme: Path) -> Path:
+        repo_dir = Path(tmpdir.strpath).joinpath('repo')
+        self.manager(repo_dir).initialize([Asset(theme, '/')])
+        yield repo_dir
+
+    @staticmethod
+    def manager(repo_dir: Path, parameters: Dict[str, object] = None,
+                engine: GitEngine = GitEngine.GITPYTHON) -> AssetManager:
+        return AssetManager(repo_dir, {}, 'repo', 'main', ['feat'], {}, parameters or {'value': 1}, engine)
+
+    @staticmethod
+    def update_theme(path: Path, content: str) -> None:
+        path.write_text(content)
+        # テーマの変更を反映する
+        AssetIndex.clear()
+
+    def test_state(self, repo_dir: Path) -> None:
+        state = RepoState.load(repo_dir)
+        assert set(state.files.keys()) == {'static.txt', 'template.txt'}
+        assert state.parameters == self.manager(repo_dir).template_parameter
+        assert state.theme == 'default'
+        assert AssetManager.from_parameters(repo_dir, state.parameters).template_parameter == state.parameters
+        repo = git.Repo(repo_dir)
+        assert RepoState.FILE_NAME in {e.path for e in repo.head.commit.tree.traverse()}
+        assert not repo.is_dirty(untracked_files=True)
+
+    def test_no_change(self, repo_dir: Path, theme: Path) -> None:
+        commit = git.Repo(repo_dir).head.commit
+        assert self.manager(repo_dir).sync([Asset(theme, '/')]) == ([], [], [])
+        assert git.Repo(repo_dir).head.commit == commit
+
+    def test_theme_updated(self, repo_dir: Path, theme: Path) -> None:
+        commit = git.Repo(repo_dir).head.commit
+        self.update_theme(theme.joinpath('static.txt'), 'updated\n')
+        self.update_theme(theme.joinpath('new.txt'), 'new\n')
+        theme.joinpath('template.txt.jinja').unlink()
+        AssetIndex.clear()
+
+        updated, removed, conflicts = self.manager(repo_dir).sync([Asset(theme, '/')])
+
+        assert updated == ['new.txt', 'static.txt']
+        assert removed == ['template.txt']
+        assert conflicts == []
+        assert repo_dir.joinpath('static.txt').read_text() == 'updated\n'
+        assert not repo_dir.joinpath('template.txt').exists()
+        # 1 つの commit にまとめる
+        repo = git.Repo(repo_dir)
+        assert repo.head.commit.parents == (commit,)
+        assert repo.head.commit.message == AssetManager.SYNC_COMMIT_MESSAGE
+        assert not repo.is_dirty(untracked_files=True)
+        assert set(json.loads(repo_dir.joinpath(RepoState.FILE_NAME).read_text())['files'].keys()) == {
+            'new.txt', 'static.txt'
+        }
+
+    def test_plumbing(self, mocker: MockerFixture, repo_dir: Path, theme: Path) -> None:
+        commit = git.Repo(repo_dir).head.commit
+        self.update_theme(theme.joinpath('static.txt'), 'updated\n')
+        theme.joinpath('template.txt.jinja').unlink()
+        AssetIndex.clear()
+
+        # git コマンドを起動せずに commit する
+        popen = mocker.patch('subprocess.Popen', side_effect=AssertionError('subprocess called'))
+        updated, removed, _ = self.manager(repo_dir, engine=GitEngine.PLUMBING).sync([Asset(theme, '/')])
+        popen.assert_not_called()
+        mocker.stop(popen)
+
+        assert (updated, removed) == (['static.txt'], ['template.txt'])
+        subprocess.run(['git', 'fsck', '--strict', '--no-dangling'], cwd=repo_dir, check=True)
+        repo = git.Repo(repo_dir)
+        assert repo.head.commit.parents == (commit,)
+        assert repo.head.commit.message == AssetManager.SYNC_COMMIT_MESSAGE + '\n'
+        assert {e.path for e in repo.head.commit.tree.traverse()} == {'static.txt', RepoState.FILE_NAME}
+        assert not repo.is_dirty(untracked_files=True)
+
+    def test_parameters_updated(self, repo_dir: Path, theme: Path) -> None:
+        updated, _, _ = self.manager(repo_dir, {'value': 2}).sync([Asset(theme, '/')])
+        assert updated == ['template.txt']
+        assert repo_dir.joinpath('template.txt').read_text() == 'value: 2\n'
+
+    def test_parameters_edited(self, repo_dir: Path, theme: Path) -> None:
+        # 保存されたパラメータを手動で編集した場合も、テンプレートを再度置換する
+        path = repo_dir.joinpath(RepoState.FILE_NAME)
+        data = json.loads(path.read_text())
+        data['parameters']['inputs']['value'] = 3
+        path.write_text(json.dumps(data))
+
+        state = RepoState.load(repo_dir)
+        updated, _, _ = AssetManager.from_parameters(repo_dir, state.parameters).sync([Asset(theme, '/')])
+        assert updated == ['template.txt']
+        assert repo_dir.joinpath('template.txt').read_text() == 'value: 3\n'
+
+    def test_theme_changed(self, repo_dir: Path, theme: Path) -> None:
+        # テーマを保存していないバージョンで作成した場合は、デフォルトのテーマとみなす
+        path = repo_dir.joinpath(RepoState.FILE_NAME)
+        data = json.loads(path.read_text())
+        del data['theme']
+        path.write_text(json.dumps(data))
+        assert RepoState.load(repo_dir).theme == 'default'
+
+        # ファイルに変更が無くても、テーマの変更は保存する
+        state = RepoState.load(repo_dir)
+        am = AssetManager.from_parameters(repo_dir, state.parameters, theme='custom')
+        updated, removed, _ = am.sync([Asset(theme, '/')])
+        assert (updated, removed) == ([], [])
+        assert RepoState.load(repo_dir).theme == 'custom'
+        assert not git.Repo(repo_dir).is_dirty()
+
+    @pytest.mark.parametrize(['force'], [[False], [True]])
+    def test_conflict(self, repo_dir: Path, theme: Path, force: bool) -> None:
+        repo_dir.joinpath('static.txt').write_text('modified by user\n')
+        repo = git.Repo(repo_dir)
+        repo.index.add(['static.txt'])
+        repo.index.commit('docs: modify')
+        self.update_theme(theme.joinpath('static.txt'), 'updated\n')
+
+        updated, _, conflicts = self.manager(repo_dir).sync([Asset(theme, '/')], force)
+
+        if force:
+            assert (updated, conflicts) == (['static.txt'], [])
+            assert repo_dir.joinpath('static.txt').read_text() == 'updated\n'
+        else:
+            assert (updated, conflicts) == ([], ['static.txt'])
+            assert repo_dir.joinpath('static.txt').read_text() == 'modified by user\n'
+            # 競合は次回の同期でも検出する
+            assert self.manager(repo_dir).sync([Asset(theme, '/')]) == ([], [], ['static.txt'])
+
+    def test_not_synced(self, tmpdir: LocalPath, theme: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            self.manager(Path(tmpdir.strpath)).sync([Asset(theme, '/')])
@@ -0,0 +1,96 @@
+import os
+from pathlib import Path
+from py._path.local import LocalPath
+import time
+from typing import List
+
+import git
+import pytest
+
+from create_github_project.assets import AssetManager
+from create_github_project.assets.asset import Asset
+from create_github_project.commands.init.parameters import ParameterParser
+from create_github_project.manifest import ManifestParser
+
+pytestmark = pytest.mark.skipif(not os.environ.get('CREATE_GITHUB_PROJECT_BENCHMARK'),
+                                reason='set CREATE_GITHUB_PROJECT_BENCHMARK=1 to run benchmarks')
+
+
+class PerFileAssetManager(AssetManager):
+    """ファイル毎に index を更新する、比較用の AssetManager。
+    """
+
+    def initialize(self, assets: List[Asset]) -> None:
+        repo = git.Repo.init(self._repo_dir)
+        repo.git.checkout(b=self._production)
+        for a in assets:
+            dest = Path(self._repo_dir.as_posix() + '/' + a.destination)
+            for path in self.deploy_files(a.source, dest):
+                repo.index.add([path])
+        repo.index.commit(self.COMMIT_MESSAGE)
+        repo.git.checkout(self._production, b=self.DEVELOP)
+
+
+class TestBenchmark:
+
+    SYNTHETIC_FILES = 5000
+
+    @staticmethod
+    def default_theme_assets() -> List[Asset]:
+        mp = ManifestParser('default')
+        return mp.get_assets('master', ['feat', 'fix'], [], {
+            'languages': ['java', 'python'],
+            'code_reviewers': {},
+            'cloudbuild': 'yes'
+        })
+
+    @classmethod
+    def synthetic_theme_assets(cls, root: Path) -> List[Asset]:
+        for i in range(cls.SYNTHETIC_FILES):
+            path = root.joinpath(f'dir{i % 50:02d}', f'file{i:04d}.txt' + ('.jinja' if i % 10 == 0 else ''))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f'file {i}: {{{{ repo_name }}}}\n')
+        return [Asset(root, '/')]
+
+    @staticmethod
+    def measure(cls_: type, repo_dir: Path, assets: List[Asset]) -> float:
+        am = cls_(repo_dir, {}, 'benchmark', 'master', ['feat', 'fix'], {}, {})
+        start = time.perf_counter()
+        am.initialize(assets)
+        return time.perf_counter() - start
+
+    @pytest.mark.parametrize(['theme'], [['default'], ['synthetic']])
+    def test_bulk_index(self, tmpdir: LocalPath, theme: str) -> None:
+        root = Path(tmpdir.strpath)
+        if theme == 'default':
+            assets = self.default_theme_assets()
+        else:
+            assets = self.synthetic_theme_assets(root.joinpath('theme'))
+
+        per_file = self.measure(PerFileAssetManager, root.joinpath('per_file'), assets)
+        bulk = self.measure(AssetManager, root.joinpath('bulk'), assets)
+
+        print(f'\n[{theme}] per-file index: {per_file:.3f}s, bulk index: {bulk:.3f}s, '
+              f'speedup: x{per_file / bulk:.1f}')
+        if theme == 'synthetic':
+            assert bulk < per_file
+
+    def test_validate_many(self) -> None:
+        mp = ManifestParser('default')
+        specs = [
+            {
+                'production': ['master', 'main'][i % 2],
+                'commit_types': 'feat,fix',
+                'reviewers': '',
+                'parameters': {'languages': 'java,python', 'code_reviewers': '', 'cloudbuild': 'yes'}
+            }
+            for i in range(10000)
+        ]
+
+        start = time.perf_counter()
+        results = ParameterParser.validate_many(mp.get_input_config(), specs)
+        elapsed = time.perf_counter() - start
+
+        print(f'\n[validate_many] {len(specs)} specs: {elapsed:.3f}s')
+        assert results == [{}] * len(specs)
+        assert elapsed < 1
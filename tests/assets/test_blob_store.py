@@ -0,0 +1,121 @@
+import os
+from pathlib import Path
+from py._path.local import LocalPath
+import subprocess
+
+from pytest_mock import MockerFixture
+
+from create_github_project.assets import AssetManager, GitEngine
+from create_github_project.assets import plumbing
+from create_github_project.assets.asset import Asset
+from create_github_project.assets.blob_store import BlobStore
+
+
+class TestBlobStore:
+
+    TEST_DATA_ROOT = Path(__file__).parent.joinpath('cases')
+
+    @classmethod
+    def initialize(cls, repo_dir: Path) -> None:
+        am = AssetManager(repo_dir, {}, 'blob', 'main', ['feat'], {}, {}, GitEngine.PLUMBING)
+        am.initialize([
+            Asset(cls.TEST_DATA_ROOT.joinpath('no_param/dir1'), '/'),
+            Asset(cls.TEST_DATA_ROOT.joinpath('no_param/dir2'), '/'),
+            Asset(cls.TEST_DATA_ROOT.joinpath('with_param/files'), 'nested'),
+        ])
+
+    @staticmethod
+    def blobs(repo_dir: Path) -> dict:
+        objects = repo_dir.joinpath('.git/objects')
+        return {
+            d + name: os.stat(objects.joinpath(d, name))
+            for d in os.listdir(objects) if len(d) == 2
+            for name in os.listdir(objects.joinpath(d))
+        }
+
+    def test_shared(self, tmpdir: LocalPath, mocker: MockerFixture) -> None:
+        root = Path(tmpdir.strpath)
+        spy = mocker.spy(plumbing, 'write_blob')
+
+        self.initialize(root.joinpath('repo1'))
+        # subdir/file2.txt と nested/file2.txt は同一の内容のため、圧縮はリポジトリの状態を含めて 4 回のみ
+        assert spy.call_count == 4
+        self.initialize(root.joinpath('repo2'))
+        # 2 つ目以降のリポジトリでは blob の圧縮を行わない
+        assert spy.call_count == 4
+
+        for repo_dir in [root.joinpath('repo1'), root.joinpath('repo2')]:
+            subprocess.run(['git', 'fsck', '--strict', '--no-dangling'], cwd=repo_dir, check=True)
+
+        # blob はハードリンクで共有される
+        repo1 = self.blobs(root.joinpath('repo1'))
+        repo2 = self.blobs(root.joinpath('repo2'))
+        blobs = set(plumbing.hash_blob(root.joinpath('repo1', p)).hex() for p in [
+            'file1.txt', 'subdir/file2.txt', 'nested/file1.txt', 'nested/file2.txt'
+        ])
+        assert len(blobs) == 3
+        for sha in blobs:
+            assert repo1[sha].st_ino == repo2[sha].st_ino
+
+    def test_no_rehash(self, tmpdir: LocalPath, mocker: MockerFixture) -> None:
+        # 内容を変更せずにコピーしたファイルは、索引のハッシュ値を利用して再計算しない
+        root = Path(tmpdir.strpath)
+        self.initialize(root.joinpath('repo1'))
+
+        spy = mocker.spy(plumbing, 'hash_blob')
+        self.initialize(root.joinpath('repo2'))
+        # テンプレートの置換結果とリポジトリの状態のみ計算する
+        assert [c.args[0] for c in spy.call_args_list] == [
+            root.joinpath('repo2/nested/file1.txt'), root.joinpath('repo2/.create-github-project.json')
+        ]
+
+    def test_fallback(self, tmpdir: LocalPath) -> None:
+        # キャッシュに書き込めない場合は、リポジトリに直接書き込む
+        repo_dir = Path(tmpdir.strpath)
+        repo_dir.joinpath('not-a-directory').write_text('')
+        BlobStore.DIRECTORY = repo_dir.joinpath('not-a-directory/blobs')
+        repo_dir.joinpath('.git/objects').mkdir(parents=True)
+        repo_dir.joinpath('file.txt').write_text('data\n')
+
+        binsha = BlobStore.write_blob(repo_dir.joinpath('.git'), repo_dir.joinpath('file.txt'))
+        assert repo_dir.joinpath('.git/objects', binsha.hex()[:2], binsha.hex()[2:]).exists()
+
+    def test_evict(self, tmpdir: LocalPath) -> None:
+        root = Path(tmpdir.strpath)
+        self.initialize(root.joinpath('repo1'))
+        objects = BlobStore.DIRECTORY.joinpath('objects')
+        assert sum(len(os.listdir(objects.joinpath(d))) for d in os.listdir(objects)) == 4
+
+        BlobStore.MAX_SIZE, max_size = 0, BlobStore.MAX_SIZE
+        try:
+            BlobStore.evict()
+        finally:
+            BlobStore.MAX_SIZE = max_size
+        assert sum(len(os.listdir(objects.joinpath(d))) for d in os.listdir(objects)) == 0
+        # リポジトリの blob は削除されない
+        subprocess.run(['git', 'fsck', '--strict', '--no-dangling'], cwd=root.joinpath('repo1'), check=True)
+
+    def test_evict_ignores_files(self, tmpdir: LocalPath) -> None:
+        # objects ディレクトリ直下のファイル (中断された実行の一時ファイルなど) は無視する
+        root = Path(tmpdir.strpath)
+        objects = BlobStore.DIRECTORY.joinpath('objects')
+        objects.mkdir(parents=True)
+        objects.joinpath('tmpstale').touch()
+        self.initialize(root.joinpath('repo1'))
+
+        BlobStore.MAX_SIZE, max_size = 0, BlobStore.MAX_SIZE
+        try:
+            BlobStore.evict()
+        finally:
+            BlobStore.MAX_SIZE = max_size
+        assert objects.joinpath('tmpstale').is_file()
+        assert sum(len(os.listdir(objects.joinpath(d))) for d in os.listdir(objects) if len(d) == 2) == 0
+
+    def test_tmp_outside_objects(self, tmpdir: LocalPath, mocker: MockerFixture) -> None:
+        # 圧縮中の一時ファイルは objects ディレクトリに作成しない
+        spy = mocker.spy(plumbing, 'write_blob')
+        self.initialize(Path(tmpdir.strpath).joinpath('repo1'))
+
+        assert spy.call_count == 4
+        assert all(c.args[2] == BlobStore.DIRECTORY.joinpath('tmp') for c in spy.call_args_list)
+        assert all(len(d) == 2 for d in os.listdir(BlobStore.DIRECTORY.joinpath('objects')))
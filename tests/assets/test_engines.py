@@ -0,0 +1,117 @@
+from pathlib import Path
+from py._path.local import LocalPath
+import subprocess
+from typing import List
+
+import git
+import pytest
+from pytest_mock import MockerFixture
+
+from create_github_project.assets import AssetManager, GitEngine
+from create_github_project.assets.asset import Asset
+
+
+class TestEngines:
+
+    TEST_DATA_ROOT = Path(__file__).parent.joinpath('cases')
+
+    @classmethod
+    def assets(cls) -> List[Asset]:
+        return [
+            Asset(cls.TEST_DATA_ROOT.joinpath('no_param/dir1'), '/'),
+            Asset(cls.TEST_DATA_ROOT.joinpath('no_param/dir2'), 'nested'),
+            Asset(cls.TEST_DATA_ROOT.joinpath('with_param/files'), '/'),
+        ]
+
+    @staticmethod
+    def initialize(repo_dir: Path, engine: GitEngine) -> git.Repo:
+        am = AssetManager(repo_dir, {}, 'engine', 'main', ['feat'], {}, {}, engine)
+        am.initialize(TestEngines.assets())
+        return git.Repo(repo_dir)
+
+    def test_plumbing(self, tmpdir: LocalPath) -> None:
+        repo_dir = Path(tmpdir.strpath).joinpath('repo')
+        repo = self.initialize(repo_dir, GitEngine.PLUMBING)
+
+        # repository is consistent
+        subprocess.run(['git', 'fsck', '--strict', '--no-dangling'], cwd=repo_dir, check=True)
+        assert not repo.is_dirty(untracked_files=True)
+        # branches
+        assert {b.name for b in repo.branches} == {'main', 'develop'}
+        assert repo.active_branch.name == 'develop'
+        assert repo.branches['main'].commit == repo.branches['develop'].commit
+        assert repo.head.commit.message == AssetManager.COMMIT_MESSAGE + '\n'
+        assert {e.path for e in repo.head.commit.tree.traverse() if e.type == 'blob'} == {
+            'file1.txt', 'file2.txt', 'nested/subdir/file2.txt', '.create-github-project.json'
+        }
+
+    def test_same_tree(self, tmpdir: LocalPath) -> None:
+        root = Path(tmpdir.strpath)
+        plumbing = self.initialize(root.joinpath('plumbing'), GitEngine.PLUMBING)
+        gitpython = self.initialize(root.joinpath('gitpython'), GitEngine.GITPYTHON)
+        assert plumbing.head.commit.tree.hexsha == gitpython.head.commit.tree.hexsha
+
+    def test_no_subprocess(self, mocker: MockerFixture, tmpdir: LocalPath) -> None:
+        popen = mocker.patch('subprocess.Popen', side_effect=AssertionError('subprocess called'))
+        am = AssetManager(Path(tmpdir.strpath).joinpath('repo'), {}, 'engine', 'main', ['feat'], {}, {},
+                          GitEngine.PLUMBING)
+        am.initialize(self.assets())
+        popen.assert_not_called()
+
+    @pytest.mark.parametrize(['name', 'expect'], [['gitpython', GitEngine.GITPYTHON], ['plumbing', GitEngine.PLUMBING]])
+    def test_find(self, name: str, expect: GitEngine) -> None:
+        assert GitEngine.find(name) == expect
+
+    def test_find_fail(self) -> None:
+        with pytest.raises(ValueError):
+            GitEngine.find('unknown')
+
+    @staticmethod
+    def update(repo_dir: Path, engine: GitEngine) -> None:
+        engine = engine.value(repo_dir, 'main', 'develop')
+        engine.open()
+        repo_dir.joinpath('file1.txt').write_text('updated\n')
+        repo_dir.joinpath('nested', 'subdir', 'file2.txt').unlink()
+        repo_dir.joinpath('new', 'file.txt').parent.mkdir()
+        repo_dir.joinpath('new', 'file.txt').write_text('new\n')
+        engine.update(['file1.txt', 'new/file.txt'], ['nested/subdir/file2.txt'], 'chore: update')
+
+    @pytest.mark.parametrize(['pack_refs'], [[False], [True]])
+    def test_update(self, tmpdir: LocalPath, pack_refs: bool) -> None:
+        root = Path(tmpdir.strpath)
+        plumbing = self.initialize(root.joinpath('plumbing'), GitEngine.GITPYTHON)
+        gitpython = self.initialize(root.joinpath('gitpython'), GitEngine.GITPYTHON)
+        parent = plumbing.head.commit
+        if pack_refs:
+            subprocess.run(['git', 'pack-refs', '--all'], cwd=plumbing.working_dir, check=True)
+
+        self.update(Path(plumbing.working_dir), GitEngine.PLUMBING)
+        self.update(Path(gitpython.working_dir), GitEngine.GITPYTHON)
+
+        # 現在のブランチに commit し、git コマンドと同じ tree となる
+        subprocess.run(['git', 'fsck', '--strict', '--no-dangling'], cwd=plumbing.working_dir, check=True)
+        assert not plumbing.is_dirty(untracked_files=True)
+        assert plumbing.active_branch.name == 'develop'
+        assert plumbing.head.commit.parents == (parent,)
+        assert plumbing.branches['main'].commit == parent
+        assert plumbing.head.commit.tree.hexsha == gitpython.head.commit.tree.hexsha
+
+    @pytest.mark.parametrize(
+        ['args'],
+        [
+            # 拡張フラグを持つエントリ
+            [['update-index', '--skip-worktree', 'file1.txt']],
+            [['update-index', '--assume-unchanged', 'file1.txt']],
+            # HEAD がブランチを指していない
+            [['checkout', '--detach']],
+            # 対応していない index の形式
+            [['update-index', '--index-version', '4']],
+            [['update-index', '--split-index']],
+        ]
+    )
+    def test_update_unsupported(self, tmpdir: LocalPath, args: List[str]) -> None:
+        repo = self.initialize(Path(tmpdir.strpath).joinpath('repo'), GitEngine.GITPYTHON)
+        subprocess.run(['git'] + args, cwd=repo.working_dir, check=True)
+        engine = GitEngine.PLUMBING.value(Path(repo.working_dir), 'main', 'develop')
+        with pytest.raises(ValueError):
+            engine.open()
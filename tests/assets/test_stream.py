@@ -0,0 +1,122 @@
+from pathlib import Path
+from py._path.local import LocalPath
+import tracemalloc
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from create_github_project.assets import AssetManager
+from create_github_project.assets import stream
+from create_github_project.assets.stream import copy_file, read_chunks, write_chunks
+
+#: 改行や NUL、末尾の空白を含む、テキストとしての正規化で壊れるデータ
+BINARY = bytes(range(256)) * 1024 + b'\r\n \n\n'
+
+
+@pytest.mark.parametrize(
+    ['chunks'],
+    [
+        [[]],
+        [['']],
+        [[' \n', '\t', '\n\n']],
+        [['abc']],
+        [['abc\n\n\n']],
+        [['abc  ', '  ', '\ndef', ' \n']],
+        [['a', ' ', 'b', '\n', '', 'c\t\n']],
+        [['\n\nabc\n', '\n']],
+    ]
+)
+def test_write_chunks(tmpdir: LocalPath, chunks: List[str]) -> None:
+    path = Path(tmpdir.strpath).joinpath('out.txt')
+    write_chunks(path, chunks)
+
+    with open(path, 'r') as f:
+        assert f.read() == ''.join(chunks).rstrip() + '\n'
+
+
+def test_read_chunks(tmpdir: LocalPath) -> None:
+    path = Path(tmpdir.strpath).joinpath('in.txt')
+    with open(path, 'w') as f:
+        f.write('0123456789' * 10)
+
+    chunks = list(read_chunks(path, 30))
+    assert [len(c) for c in chunks] == [30, 30, 30, 10]
+    assert ''.join(chunks) == '0123456789' * 10
+
+
+def test_constant_memory(tmpdir: LocalPath) -> None:
+    # 32 MiB の静的ファイルと、同程度の出力となるテンプレートを配置してもメモリ使用量が増えない
+    src_root = Path(tmpdir.strpath).joinpath('src')
+    repo_dir = Path(tmpdir.strpath).joinpath('repo')
+    src_root.mkdir()
+    size = 32 * 1024 * 1024
+    line = 'x' * 63 + '\n'
+    with open(src_root.joinpath('large.txt'), 'w') as f:
+        for _ in range(size // len(line)):
+            f.write(line)
+    with open(src_root.joinpath('large.md.jinja'), 'w') as f:
+        f.write(f"{{% for _ in range({size // len(line)}) %}}{{{{ inputs.line }}}}\n{{% endfor %}}")
+
+    am = AssetManager(repo_dir, {}, 'repo', 'main', [], {}, {'line': line[:-1]})
+    tracemalloc.start()
+    try:
+        am.deploy_files(src_root, repo_dir)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert repo_dir.joinpath('large.txt').stat().st_size == size
+    assert repo_dir.joinpath('large.md').stat().st_size == size
+    assert peak < size // 4
+
+
+@pytest.mark.parametrize(
+    ['reflink', 'copy_file_range'],
+    [
+        [True, True],
+        [False, True],
+        [False, False],
+    ]
+)
+def test_copy_file(tmpdir: LocalPath, mocker: MockerFixture, reflink: bool, copy_file_range: bool) -> None:
+    src = Path(tmpdir.strpath).joinpath('src.bin')
+    dest = Path(tmpdir.strpath).joinpath('dest.bin')
+    with open(src, 'wb') as f:
+        f.write(BINARY)
+
+    # 利用できないコピー方法は失敗させる
+    if not reflink:
+        mocker.patch.object(stream.fcntl, 'ioctl', side_effect=OSError)
+    if not copy_file_range:
+        mocker.patch.object(stream.os, 'copy_file_range', side_effect=OSError, create=True)
+
+    copy_file(src, dest)
+    with open(dest, 'rb') as f:
+        assert f.read() == BINARY
+
+
+@pytest.mark.parametrize(
+    ['normalize_newline', 'expect'],
+    [
+        [False, BINARY],
+        [True, b'text\n'],
+    ]
+)
+def test_normalize_newline(tmpdir: LocalPath, normalize_newline: bool, expect: bytes) -> None:
+    src_root = Path(tmpdir.strpath).joinpath('src')
+    repo_dir = Path(tmpdir.strpath).joinpath('repo')
+    src_root.mkdir()
+    with open(src_root.joinpath('file'), 'wb') as f:
+        f.write(BINARY if not normalize_newline else b'text \r\n\n')
+    with open(src_root.joinpath('template.jinja'), 'wb') as f:
+        f.write(b'{{ repo_name }} \n\n')
+
+    am = AssetManager(repo_dir, {}, 'repo', 'main', [], {}, {})
+    am.deploy_files(src_root, repo_dir, normalize_newline)
+
+    with open(repo_dir.joinpath('file'), 'rb') as f:
+        assert f.read() == expect
+    # テンプレートは常に正規化する
+    with open(repo_dir.joinpath('template'), 'rb') as f:
+        assert f.read() == b'repo\n'
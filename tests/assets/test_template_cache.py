@@ -0,0 +1,61 @@
+import os
+from pathlib import Path
+from py._path.local import LocalPath
+
+from pytest_mock import MockerFixture
+
+from create_github_project.assets.template_cache import LRUBytecodeCache, TemplateCache
+
+
+class TestTemplateCache:
+
+    TEST_DATA_ROOT = Path(__file__).parent.joinpath('cases')
+
+    @staticmethod
+    def create_templates(root: Path) -> None:
+        root.joinpath('sub').mkdir(parents=True)
+        root.joinpath('sub/child.jinja').write_text('child: {{ name }}')
+        root.joinpath('parent.jinja').write_text("parent\n{% include 'sub/child.jinja' %}")
+
+    def test_shared_environment(self, tmpdir: LocalPath) -> None:
+        root1 = Path(tmpdir.strpath).joinpath('root1')
+        root2 = Path(tmpdir.strpath).joinpath('root2')
+        self.create_templates(root1)
+        self.create_templates(root2)
+        root2.joinpath('sub/child.jinja').write_text('other child: {{ name }}')
+
+        # include is resolved from the same root
+        assert TemplateCache.get_template(root1, 'parent.jinja').render(name='x') == 'parent\nchild: x'
+        assert TemplateCache.get_template(root2, 'parent.jinja').render(name='x') == 'parent\nother child: x'
+        # compiled template is reused
+        assert TemplateCache.get_template(root1, 'parent.jinja') is TemplateCache.get_template(root1, 'parent.jinja')
+
+    def test_bytecode_reused(self, mocker: MockerFixture, tmpdir: LocalPath, template_cache: Path) -> None:
+        root = Path(tmpdir.strpath).joinpath('root')
+        self.create_templates(root)
+        TemplateCache.get_template(root, 'parent.jinja').render(name='x')
+        assert len(os.listdir(template_cache)) == 2
+
+        # another process: templates are loaded from the bytecode cache without compiling
+        TemplateCache.clear()
+        compile_ = mocker.spy(TemplateCache.environment(), 'compile')
+        assert TemplateCache.get_template(root, 'parent.jinja').render(name='y') == 'parent\nchild: y'
+        compile_.assert_not_called()
+
+        # content changed: compiled again
+        root.joinpath('sub/child.jinja').write_text('changed: {{ name }}')
+        TemplateCache.clear()
+        assert TemplateCache.get_template(root, 'parent.jinja').render(name='z') == 'parent\nchanged: z'
+        assert len(os.listdir(template_cache)) == 3
+
+    def test_evict(self, tmpdir: LocalPath) -> None:
+        directory = Path(tmpdir.strpath).joinpath('cache')
+        cache = LRUBytecodeCache(directory, 250)
+        for i in range(5):
+            path = directory.joinpath(f'__jinja2_{i}.cache')
+            path.write_bytes(b'x' * 100)
+            os.utime(path, (i, i))
+
+        cache.evict()
+
+        assert sorted(os.listdir(directory)) == ['__jinja2_3.cache', '__jinja2_4.cache']
@@ -1,3 +1,6 @@
+import json
+from pathlib import Path
+from py._path.local import LocalPath
 from typing import Dict, List
 from unittest.mock import MagicMock
 
@@ -9,6 +12,7 @@ from create_github_project.commands.init.parameters.select import Select
 from create_github_project.commands.init.parameters.reviewers import Reviewers
 from create_github_project.commands.init.parameters import ParameterParser
 from create_github_project.utils import Accounts
+from create_github_project.utils import account_stores
 
 CHECKBOX = {
     'name': 'x',
@@ -152,6 +156,7 @@ class TestParameterParser:
         q_reviewers.unsafe_ask.return_value = []
         q_select.unsafe_ask.return_value = 'value'
         mocker.patch.object(Accounts, 'list', return_value=['user1', 'user2'])
+        mocker.patch.object(Accounts, 'exists', side_effect=lambda a: a in ['user1', 'user2'])
         mocker.patch.object(Accounts, 'get_account_info', return_value={})
 
         pp = ParameterParser(production, commit_types, reviewers, config, params)
@@ -222,9 +227,50 @@ class TestParameterParser:
                            config: Dict[str, str], params: Dict[str, str]) -> None:
 
         mocker.patch.object(Accounts, 'list', return_value=['user1', 'user2'])
+        mocker.patch.object(Accounts, 'exists', side_effect=lambda a: a in ['user1', 'user2'])
         mocker.patch.object(Accounts, 'get_account_info', return_value={})
 
         pp = ParameterParser(production, commit_types, reviewers, config, params)
         result, err = pp.parse()
         assert result is None
         assert err is not None
+
+    def test_shared_accounts(self, mocker: MockFixture, tmpdir: LocalPath) -> None:
+        # アカウント一覧
+        root = Path(tmpdir.strpath)
+        mocker.patch.object(Accounts, 'FILE_PATH', root.joinpath('accounts.json'))
+        mocker.patch.object(Accounts, 'DB_PATH', root.joinpath('accounts.sqlite3'))
+        with open(Accounts.FILE_PATH, 'w') as f:
+            json.dump({u: {'display_name': u, 'homepage': 'https://github.com/' + u} for u in ['user1', 'user2']}, f)
+        init = mocker.spy(Accounts, '__init__')
+        load = mocker.spy(account_stores.json, 'load')
+
+        # 複数のレビュアー用パラメータで、アカウント一覧の読み込みは 1 度のみ
+        config = [dict(REVIEWERS, name=name) for name in ['x', 'y', 'z']]
+        for _ in range(2):
+            pp = ParameterParser('master', 'feat', 'user1', config, {'x': 'user1', 'y': 'user2', 'z': ''})
+            result, err = pp.parse()
+            assert err is None
+            assert result[2] == {'user1': {'display_name': 'user1', 'homepage': 'https://github.com/user1'}}
+
+        assert init.call_count == 1
+        assert load.call_count == 1
+
+    def test_validate_many(self, mocker: MockFixture) -> None:
+        exists = mocker.patch.object(Accounts, 'exists', side_effect=lambda a: a in ['user1', 'user2'])
+        config = [dict(CHECKBOX, name='x'), dict(REVIEWERS, name='y'), dict(SELECT, name='z')]
+
+        results = ParameterParser.validate_many(config, [
+            # 未指定の項目は検証しない
+            {},
+            {'production': 'master', 'commit_types': 'feat,fix', 'reviewers': 'user1',
+             'parameters': {'x': 'c1,c2', 'y': 'user1,user2', 'z': 'c1'}},
+            {'production': 'trunk', 'commit_types': 'feat,unknown', 'reviewers': 'user3',
+             'parameters': {'x': 'c3', 'y': 'user1,user3', 'z': None, 'w': '1'}},
+        ] + [{'reviewers': 'user1,user2'}] * 100)
+
+        assert results[:2] == [{}, {}]
+        assert set(results[2].keys()) == {'production', 'commit_types', 'reviewers', 'x', 'y', 'w'}
+        assert results[3:] == [{}] * 100
+        # アカウントの検索は、レビュアー用パラメータとアカウントの組ごとに 1 度のみ
+        assert exists.call_count == 3 + 3
@@ -51,6 +51,8 @@ class TestReviewers:
 
         question.unsafe_ask.return_value = [] if value is None else value.split()
         mocker.patch.object(Accounts, 'list', return_value=accounts)
+        mocker.patch.object(Accounts, 'count', return_value=len(accounts))
+        mocker.patch.object(Accounts, 'exists', side_effect=lambda a: a in accounts)
         mocker.patch.object(Accounts, 'get_account_info', side_effect=self.get_account_list)
 
         r = Reviewers(value, "prompt")
@@ -78,3 +80,19 @@ class TestReviewers:
         r = Reviewers(value, "prompt")
         ok, _ = r.validate()
         assert not ok
+
+    def test_prompt_search(self, mocker: MockFixture, question: MagicMock) -> None:
+        # 登録数が多い場合は、接頭辞で絞り込んだアカウントのみを選択肢とする
+        text = mocker.Mock(spec=Question)
+        text.unsafe_ask.return_value = 'user1'
+        mocker.patch('questionary.text', return_value=text)
+        checkbox = mocker.patch('questionary.checkbox', return_value=question)
+        question.unsafe_ask.return_value = []
+        mocker.patch.object(Accounts, 'count', return_value=Reviewers.PROMPT_LIMIT + 1)
+        mocker.patch.object(Accounts, 'list', side_effect=AssertionError('all accounts listed'))
+        search = mocker.patch.object(Accounts, 'search', return_value=['user1', 'user10'])
+
+        Reviewers(None, 'prompt').finalize()
+
+        search.assert_called_once_with('user1')
+        assert [c.title for c in checkbox.call_args[1]['choices']] == ['user1', 'user10']
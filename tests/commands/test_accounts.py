@@ -1,8 +1,12 @@
+from pathlib import Path
+from py._path.local import LocalPath
 from typing import List
 
 from click.testing import CliRunner, Result
+from github import GithubException
 import pytest
 from pytest_mock.plugin import MockerFixture
+import requests
 
 from create_github_project.__main__ import cli
 from create_github_project.commands import build
@@ -48,10 +52,53 @@ class TestAccounts:
             assert result.exit_code != 0
 
         if add_calls:
-            add.assert_called_once_with('dummy', 'dummy name')
+            add.assert_called_once_with('dummy', 'dummy name', token=None)
         else:
             add.assert_not_called()
 
+    def test_add_from_file(self, mocker: MockerFixture, tmpdir: LocalPath) -> None:
+        _ = mocker.patch.object(Accounts, 'exists', side_effect=lambda a: a == 'user1')
+        add_many = mocker.patch.object(Accounts, 'add_many', return_value={
+            'user1': None, 'user2': 'https://github.com/user2', 'user3': None
+        })
+        path = Path(tmpdir.strpath).joinpath('users.txt')
+        path.write_text('# comment\nuser1\n\nuser2, User 2\nuser3\n')
+
+        # execute
+        result = self.run('add', ['--from-file', path.as_posix(), '--token', 'token'])
+
+        # examine
+        assert result.exit_code != 0
+        add_many.assert_called_once_with({'user1': 'user1', 'user2': 'User 2', 'user3': 'user3'}, 'token', 8)
+        assert '[EXISTS] user1' in result.output
+        assert '[ADDED] user2' in result.output
+        assert '[NOT FOUND] user3' in result.output
+
+    @pytest.mark.parametrize(
+        ['error'],
+        [
+            [GithubException(403, {}, {})],
+            [requests.exceptions.ConnectionError('connection refused')],
+            [requests.exceptions.Timeout('timed out')],
+        ]
+    )
+    @pytest.mark.parametrize(['from_file'], [[False], [True]])
+    def test_add_error(self, mocker: MockerFixture, tmpdir: LocalPath, error: Exception, from_file: bool) -> None:
+        # 接続の失敗は traceback を表示せず、エラーとして通知する
+        _ = mocker.patch.object(Accounts, 'exists', return_value=False)
+        _ = mocker.patch.object(Accounts, 'add_many', side_effect=error)
+        path = Path(tmpdir.strpath).joinpath('users.txt')
+        path.write_text('user1\n')
+
+        # execute
+        args = ['--from-file', path.as_posix()] if from_file else ['user1', '--display-name', 'User 1']
+        result = self.run('add', args)
+
+        # examine
+        assert result.exit_code == 1
+        assert isinstance(result.exception, SystemExit)
+        assert 'Failed to get GitHub account' in result.output
+
     @pytest.mark.parametrize(
         ['exists', 'ok', 'drop_calls'],
         [
@@ -78,3 +125,20 @@ class TestAccounts:
             drop.assert_called_once_with('dummy')
         else:
             drop.assert_not_called()
+
+    @pytest.mark.parametrize(['migrated'], [[False], [True]])
+    def test_migrate(self, mocker: MockerFixture, migrated: bool) -> None:
+        migrate = mocker.patch.object(Accounts, 'migrate',
+                                      side_effect=FileExistsError('migrated') if migrated else None,
+                                      return_value=3)
+
+        # execute
+        result = self.run('migrate', [])
+
+        # examine
+        migrate.assert_called_once_with()
+        if migrated:
+            assert result.exit_code != 0
+        else:
+            assert result.exit_code == 0
+            assert 'Migrated 3 accounts' in result.output
@@ -1,13 +1,22 @@
+import io
+import json
 from pathlib import Path
-from typing import List
+from py._path.local import LocalPath
+import subprocess
+import tarfile
+from typing import Dict, List
 from unittest.mock import MagicMock
+import zipfile
 
 from click.testing import CliRunner, Result
+import git
 import pytest
 from pytest_mock.plugin import MockerFixture
+import yaml
 
 from create_github_project.__main__ import cli
-from create_github_project.assets import AssetManager
+from create_github_project.assets import AssetManager, GitEngine
+from create_github_project.assets.blob_store import BlobStore
 from create_github_project.commands import build
 from create_github_project.commands.init.parameters import ParameterParser
 from create_github_project.manifest import ManifestParser
@@ -89,3 +98,370 @@ class TestInit:
         # examine
         assert result.exit_code == 0
         initialize.assert_called_once()
+
+    @pytest.mark.parametrize(['args', 'engine'], [[[], GitEngine.GITPYTHON],
+                                                  [['--git-engine', 'plumbing'], GitEngine.PLUMBING]])
+    def test_git_engine(self, mocker: MockerFixture, initialize: MagicMock,
+                        args: List[str], engine: GitEngine) -> None:
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=[['master', [], {}, {}], None])
+        am = mocker.spy(AssetManager, '__init__')
+
+        result = self.run(args, mocker)
+
+        assert result.exit_code == 0
+        assert am.call_args[0][-1] == engine
+
+    @pytest.mark.parametrize(['args', 'theme'], [[[], 'default'], [['--theme', 'custom'], 'custom']])
+    def test_theme(self, mocker: MockerFixture, initialize: MagicMock, themes: Path,
+                   args: List[str], theme: str) -> None:
+        themes.joinpath('custom').mkdir(parents=True)
+        themes.joinpath('custom', 'manifest.yaml').write_bytes(
+            ManifestParser.THEMES.joinpath('default', 'manifest.yaml').read_bytes())
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=[['master', [], {}, {}], None])
+        am = mocker.spy(AssetManager, '__init__')
+
+        result = self.run(args, mocker)
+
+        assert result.exit_code == 0
+        assert am.call_args[1]['theme'] == theme
+
+    def test_theme_not_found(self, mocker: MockerFixture, initialize: MagicMock) -> None:
+        result = self.run(['--theme', 'not-exist'], mocker)
+
+        assert result.exit_code != 0
+        assert "Theme 'not-exist' not found. Available themes: 'default'" in result.output
+        initialize.assert_not_called()
+
+    def test_theme_pack_not_fetched(self, mocker: MockerFixture, initialize: MagicMock) -> None:
+        result = self.run(['--theme', 'https://example.com/themes.git@v1'], mocker)
+
+        assert result.exit_code != 0
+        assert 'Run `themes fetch https://example.com/themes.git@v1` first.' in result.output
+        initialize.assert_not_called()
+
+    def test_non_interactive_missing(self, mocker: MockerFixture, initialize: MagicMock) -> None:
+        parse = mocker.patch.object(ParameterParser, 'parse')
+        result = self.run(['--non-interactive', '--production', 'master', '-p', 'languages=python'], mocker)
+
+        # 不足しているパラメータを全て通知し、対話的な入力は行わない
+        assert result.exit_code != 0
+        assert 'commit_types, reviewers, code_reviewers, cloudbuild' in result.output
+        parse.assert_not_called()
+        initialize.assert_not_called()
+
+    def test_non_interactive(self, mocker: MockerFixture, initialize: MagicMock) -> None:
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=[['master', [], {}, {}], None])
+        result = self.run(['--non-interactive', '--production', 'master', '--commit-types', 'feat', '--reviewers', '',
+                           '-p', 'languages=', '-p', 'code_reviewers=', '-p', 'cloudbuild=yes'], mocker)
+        assert result.exit_code == 0
+        initialize.assert_called_once()
+
+    def test_values(self, mocker: MockerFixture, tmpdir: LocalPath, initialize: MagicMock) -> None:
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=[['master', [], {}, {}], None])
+        pp = mocker.spy(ParameterParser, '__init__')
+        values = Path(tmpdir.strpath).joinpath('values.yaml')
+        with open(values, 'w') as f:
+            yaml.dump({
+                'production': 'main',
+                'commit_types': ['feat', 'fix'],
+                'reviewers': [],
+                'parameters': {'languages': ['python'], 'code_reviewers': [], 'cloudbuild': 'no'}
+            }, f)
+
+        # コマンドのオプションを優先する
+        result = self.run(['--values', values.as_posix(), '--non-interactive', '--production', 'master',
+                           '-p', 'cloudbuild=yes'], mocker)
+
+        assert result.exit_code == 0
+        assert pp.call_args[0][1:] == ('master', 'feat,fix', '', mocker.ANY,
+                                       {'languages': 'python', 'code_reviewers': '', 'cloudbuild': 'yes'})
+
+    @pytest.mark.parametrize(
+        ['values'],
+        [
+            [['main']],
+            [{'repo_dir': 'x'}],
+            [{'parameters': ['x']}],
+            # CLI オプションの選択肢に無い値
+            [{'production': 'trunk'}],
+            [{'remote_type': 'bogus'}],
+        ]
+    )
+    def test_invalid_values(self, mocker: MockerFixture, tmpdir: LocalPath, initialize: MagicMock,
+                            values: object) -> None:
+        path = Path(tmpdir.strpath).joinpath('values.yaml')
+        with open(path, 'w') as f:
+            yaml.dump(values, f)
+        result = self.run(['--values', path.as_posix()], mocker)
+        assert result.exit_code != 0
+        assert "'--values'" in result.output
+        initialize.assert_not_called()
+
+
+class TestInitBatch:
+
+    PARSED = [
+        [
+            'master',
+            ['feat', 'fix'],
+            # reviewers
+            {},
+            # custom parameters
+            {
+                'languages': []
+            }
+        ],
+        None
+    ]
+
+    @staticmethod
+    def run(args: List[str]) -> Result:
+        build(cli)
+        runner = CliRunner()
+        return runner.invoke(cli, ['init'] + args)
+
+    @pytest.fixture(autouse=True)
+    def initialize(self, mocker: MockerFixture) -> MagicMock:
+        yield mocker.patch.object(AssetManager, 'initialize')
+
+    @staticmethod
+    def create_spec_file(tmpdir: LocalPath, name: str, specs: List[Dict[str, object]]) -> str:
+        path = Path(tmpdir.strpath).joinpath(name)
+        with open(path, 'w') as f:
+            if path.suffix == '.jsonl':
+                f.write('\n'.join(json.dumps(s) for s in specs))
+            else:
+                yaml.dump(specs, f)
+        return path.as_posix()
+
+    @pytest.mark.parametrize(['name'], [['specs.yaml'], ['specs.jsonl']])
+    def test_ok(self, mocker: MockerFixture, tmpdir: LocalPath, initialize: MagicMock, name: str) -> None:
+        parse = mocker.patch.object(ParameterParser, 'parse', return_value=self.PARSED)
+        manifest = mocker.spy(ManifestParser, '__init__')
+        root = Path(tmpdir.strpath)
+        spec_file = self.create_spec_file(tmpdir, name, [
+            {'repo_dir': root.joinpath('repo1').as_posix(), 'commit_types': ['feat', 'fix']},
+            {'repo_dir': root.joinpath('repo2').as_posix(), 'parameters': {'languages': ['java', 'python']}},
+        ])
+
+        result = self.run(['--batch', spec_file])
+
+        assert result.exit_code == 0
+        assert initialize.call_count == 2
+        assert parse.call_count == 2
+        # manifest file is parsed only once
+        assert manifest.call_count == 1
+        assert '[OK]' in result.output
+
+    def test_partial_failure(self, mocker: MockerFixture, tmpdir: LocalPath, initialize: MagicMock) -> None:
+        _ = mocker.patch.object(ParameterParser, 'parse', side_effect=[self.PARSED, [None, 'error']])
+        root = Path(tmpdir.strpath)
+        spec_file = self.create_spec_file(tmpdir, 'specs.yaml', [
+            {'repo_dir': root.joinpath('repo1').as_posix()},
+            {'repo_dir': root.joinpath('repo2').as_posix()},
+        ])
+
+        result = self.run(['--batch', spec_file])
+
+        assert result.exit_code != 0
+        assert initialize.call_count == 1
+        assert '[OK]' in result.output
+        assert '[FAILED]' in result.output
+
+    def test_unsupported_remote_type(self, mocker: MockerFixture, tmpdir: LocalPath, initialize: MagicMock) -> None:
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=self.PARSED)
+        root = Path(tmpdir.strpath)
+        spec_file = self.create_spec_file(tmpdir, 'specs.yaml', [
+            {'repo_dir': root.joinpath('repo1').as_posix(), 'remote_type': 'bogus'},
+            {'repo_dir': root.joinpath('repo2').as_posix()},
+        ])
+
+        result = self.run(['--batch', spec_file])
+
+        # 不正な spec のみ失敗し、他のリポジトリは作成する
+        assert result.exit_code != 0
+        assert initialize.call_count == 1
+        lines = [line for line in result.output.split('\n') if line.startswith('  [')]
+        assert [line.split()[0] for line in lines] == ['[FAILED]', '[OK]']
+        assert 'bogus' in lines[0]
+
+    def test_invalid_values(self, mocker: MockerFixture, tmpdir: LocalPath, initialize: MagicMock) -> None:
+        parse = mocker.patch.object(ParameterParser, 'parse', return_value=self.PARSED)
+        root = Path(tmpdir.strpath)
+        spec_file = self.create_spec_file(tmpdir, 'specs.yaml', [
+            {'repo_dir': root.joinpath('repo1').as_posix()},
+            {'repo_dir': root.joinpath('repo2').as_posix(), 'production': 'trunk',
+             'parameters': {'cloudbuild': 'maybe', 'unknown': 'x'}},
+        ])
+
+        result = self.run(['--batch', spec_file])
+
+        # 不正な spec はパラメータを確定せず、全ての不正内容を表示する
+        assert result.exit_code != 0
+        assert parse.call_count == 1
+        assert initialize.call_count == 1
+        failed = [line for line in result.output.split('\n') if line.startswith('  [FAILED]')]
+        assert len(failed) == 1
+        assert all(f"'{name}'" in failed[0] for name in ['production', 'cloudbuild', 'unknown'])
+
+    @pytest.mark.parametrize(
+        ['specs'],
+        [
+            # no repo_dir
+            [[{'production': 'main'}]],
+            # unknown key
+            [[{'repo_dir': 'repo1', 'unknown': 'x'}]],
+            # not a list
+            [{'repo_dir': 'repo1'}],
+            # duplicated repo_dir
+            [[{'repo_dir': 'repo1'}, {'repo_dir': './repo1'}]],
+        ]
+    )
+    def test_invalid_spec(self, tmpdir: LocalPath, initialize: MagicMock, specs: object) -> None:
+        spec_file = self.create_spec_file(tmpdir, 'specs.yaml', specs)
+        result = self.run(['--batch', spec_file])
+        assert result.exit_code != 0
+        initialize.assert_not_called()
+
+    def test_jobs(self, mocker: MockerFixture, tmpdir: LocalPath, initialize: MagicMock) -> None:
+        # initialize repositories for real in worker processes
+        mocker.stop(initialize)
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=self.PARSED)
+        root = Path(tmpdir.strpath)
+        # parent of repo3 is a regular file, so initialization fails
+        root.joinpath('file').touch()
+        repo_dirs = [root.joinpath(name) for name in ['repo1', 'repo2', 'file/repo3', 'repo4']]
+        spec_file = self.create_spec_file(tmpdir, 'specs.yaml', [{'repo_dir': d.as_posix()} for d in repo_dirs])
+
+        result = self.run(['--batch', spec_file, '--jobs', '2'])
+
+        assert result.exit_code != 0
+        # results are listed in the order of spec file
+        lines = [line for line in result.output.split('\n') if line.startswith('  [')]
+        assert [line.split()[1].rstrip(':') for line in lines] == [d.as_posix() for d in repo_dirs]
+        assert [line.split()[0] for line in lines] == ['[OK]', '[OK]', '[FAILED]', '[OK]']
+        for d in [repo_dirs[0], repo_dirs[1], repo_dirs[3]]:
+            repo = git.Repo(d)
+            assert {b.name for b in repo.branches} == {'master', 'develop'}
+
+    def test_jobs_plumbing(self, mocker: MockerFixture, tmpdir: LocalPath, initialize: MagicMock,
+                           blob_store: Path) -> None:
+        # blob のキャッシュを共有する複数のプロセスで、リポジトリを作成する
+        mocker.stop(initialize)
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=self.PARSED)
+        evict = mocker.spy(BlobStore, 'evict')
+        # 中断された実行で残った一時ファイル
+        blob_store.joinpath('objects').mkdir(parents=True)
+        blob_store.joinpath('objects', 'tmpstale').touch()
+        root = Path(tmpdir.strpath)
+        repo_dirs = [root.joinpath(f'repo{i}') for i in range(6)]
+        spec_file = self.create_spec_file(tmpdir, 'specs.yaml', [{'repo_dir': d.as_posix()} for d in repo_dirs])
+
+        result = self.run(['--batch', spec_file, '--jobs', '3', '--git-engine', 'plumbing'])
+
+        assert result.exit_code == 0, result.output
+        assert '[FAILED]' not in result.output
+        for d in repo_dirs:
+            subprocess.run(['git', 'fsck', '--strict', '--no-dangling'], cwd=d, check=True)
+            assert {b.name for b in git.Repo(d).branches} == {'master', 'develop'}
+        # キャッシュの削除は、全てのリポジトリの作成後に 1 度のみ行う
+        evict.assert_called_once()
+
+    def test_with_repo_dir(self, tmpdir: LocalPath, initialize: MagicMock) -> None:
+        spec_file = self.create_spec_file(tmpdir, 'specs.yaml', [{'repo_dir': 'repo1'}])
+        result = self.run(['repo_dir', '--batch', spec_file])
+        assert result.exit_code != 0
+        initialize.assert_not_called()
+
+    def test_no_repo_dir(self, initialize: MagicMock) -> None:
+        result = self.run([])
+        assert result.exit_code != 0
+        initialize.assert_not_called()
+
+
+class TestInitOutputFormat:
+
+    PARSED = [['master', ['feat', 'fix'], {}, {'languages': [], 'code_reviewers': {}, 'cloudbuild': 'yes'}], None]
+    VALUES = ['--production', 'master', '--commit-types', 'feat,fix', '--reviewers', '',
+              '-p', 'languages=', '-p', 'code_reviewers=', '-p', 'cloudbuild=yes']
+
+    @staticmethod
+    def run(args: List[str]) -> Result:
+        build(cli)
+        runner = CliRunner()
+        return runner.invoke(cli, ['init'] + args)
+
+    @pytest.fixture(autouse=True)
+    def initialize(self, mocker: MockerFixture) -> MagicMock:
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=self.PARSED)
+        yield mocker.patch.object(AssetManager, 'initialize')
+
+    @staticmethod
+    def read_dir(root: Path) -> Dict[str, bytes]:
+        return {p.relative_to(root).as_posix(): p.read_bytes() for p in root.glob('**/*') if p.is_file()}
+
+    @staticmethod
+    def read_archive(output_format: str, data: bytes) -> Dict[str, bytes]:
+        if output_format == 'tar':
+            with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+                return {m.name: tar.extractfile(m).read() for m in tar.getmembers()}
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            return {name: zf.read(name) for name in zf.namelist()}
+
+    def test_dir(self, tmpdir: LocalPath, initialize: MagicMock) -> None:
+        repo_dir = Path(tmpdir.strpath).joinpath('repo')
+        result = self.run([repo_dir.as_posix(), '--output-format', 'dir'])
+
+        assert result.exit_code == 0
+        assert 'Repository successfully configured' not in result.output
+        assert repo_dir.joinpath('.create-github-project.json').is_file()
+        assert not repo_dir.joinpath('.git').exists()
+        initialize.assert_not_called()
+
+    @pytest.mark.parametrize(['output_format'], [['tar'], ['zip']])
+    @pytest.mark.parametrize(['stdout'], [[True], [False]])
+    def test_archive(self, tmpdir: LocalPath, initialize: MagicMock, output_format: str, stdout: bool) -> None:
+        root = Path(tmpdir.strpath)
+        expected = root.joinpath('repo')
+        self.run([expected.as_posix(), '--output-format', 'dir'] + self.VALUES)
+
+        # アーカイブの内容は、ディレクトリに出力した場合と一致する
+        output = root.joinpath('out', 'repo')
+        output.parent.mkdir()
+        result = self.run([output.as_posix(), '--output-format', output_format] + self.VALUES +
+                          (['--stdout'] if stdout else []))
+
+        assert result.exit_code == 0
+        if stdout:
+            assert not output.exists()
+            data = result.stdout_bytes
+        else:
+            data = output.read_bytes()
+        assert self.read_archive(output_format, data) == self.read_dir(expected)
+        initialize.assert_not_called()
+
+    @pytest.mark.parametrize(['args'], [[['--stdout']], [['--output-format', 'dir', '--stdout']]])
+    def test_stdout_without_archive(self, tmpdir: LocalPath, initialize: MagicMock, args: List[str]) -> None:
+        result = self.run([Path(tmpdir.strpath).joinpath('repo').as_posix()] + args)
+        assert result.exit_code != 0
+        initialize.assert_not_called()
+
+    def test_stdout_missing_values(self, mocker: MockerFixture, tmpdir: LocalPath, initialize: MagicMock) -> None:
+        select = mocker.patch('questionary.select')
+        checkbox = mocker.patch('questionary.checkbox')
+        result = self.run([Path(tmpdir.strpath).joinpath('repo').as_posix(), '--output-format', 'tar', '--stdout',
+                           '--production', 'master'])
+
+        # 対話的な入力を行わず、アーカイブを書き込まずに終了する
+        assert result.exit_code != 0
+        assert 'Missing values in non-interactive mode' in result.output
+        assert result.stdout_bytes == b''
+        select.assert_not_called()
+        checkbox.assert_not_called()
+        initialize.assert_not_called()
+
+    def test_batch(self, tmpdir: LocalPath, initialize: MagicMock) -> None:
+        spec_file = TestInitBatch.create_spec_file(tmpdir, 'specs.yaml', [{'repo_dir': 'repo1'}])
+        result = self.run(['--batch', spec_file, '--output-format', 'tar'])
+        assert result.exit_code != 0
+        initialize.assert_not_called()
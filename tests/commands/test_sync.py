@@ -0,0 +1,173 @@
+from pathlib import Path
+from py._path.local import LocalPath
+from typing import List
+from unittest.mock import MagicMock
+
+from click.testing import CliRunner, Result
+import git
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+from create_github_project.__main__ import cli
+from create_github_project.assets import AssetManager, GitEngine
+from create_github_project.assets.repo_state import RepoState
+from create_github_project.commands import build
+from create_github_project.commands.init.parameters import ParameterParser
+from create_github_project.manifest import ManifestParser
+from create_github_project.utils import Accounts
+
+
+class TestSync:
+
+    PARSED = [['master', ['feat', 'fix'], {}, {'languages': [], 'code_reviewers': {}, 'cloudbuild': 'yes'}], None]
+    STORED = {
+        'repo_name': 'stored',
+        'changelog_urls': {'compare': 'https://example.com/compare'},
+        'production_branch': 'main',
+        'commit_types': ['feat'],
+        'reviewers': {'user1': {'display_name': 'user1', 'homepage': 'https://github.com/user1'}},
+        'inputs': {'languages': ['python'], 'code_reviewers': {}, 'cloudbuild': 'no'}
+    }
+
+    @staticmethod
+    def run(args: List[str]) -> Result:
+        build(cli)
+        runner = CliRunner()
+        return runner.invoke(cli, ['sync'] + args)
+
+    @pytest.fixture(autouse=True)
+    def sync(self, mocker: MockerFixture) -> MagicMock:
+        yield mocker.patch.object(AssetManager, 'sync', return_value=(['a.txt'], ['b.txt'], ['c.txt']))
+
+    @pytest.fixture
+    def repo_dir(self, tmpdir: LocalPath) -> Path:
+        repo_dir = Path(tmpdir.strpath)
+        repo = git.Repo.init(repo_dir)
+        RepoState(self.STORED, {}).dump(repo_dir)
+        repo.index.add([RepoState.FILE_NAME])
+        repo.index.commit('initial commit')
+        yield repo_dir
+
+    def test_ok(self, mocker: MockerFixture, repo_dir: Path, sync: MagicMock) -> None:
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=self.PARSED)
+        result = self.run([repo_dir.as_posix(), '--force'])
+
+        assert result.exit_code == 0
+        assert sync.call_args[0][1] is True
+        assert '1 updated, 1 removed' in result.output
+        assert '[CONFLICT] c.txt' in result.output
+
+    def test_replay(self, mocker: MockerFixture, repo_dir: Path, sync: MagicMock) -> None:
+        # 保存されたパラメータを利用し、パラメータの入力やレビュアーの情報の取得を行わない
+        parser = mocker.patch.object(ParameterParser, '__init__', side_effect=AssertionError('parameters parsed'))
+        init = mocker.spy(AssetManager, '__init__')
+        result = self.run([repo_dir.as_posix()])
+
+        assert result.exit_code == 0
+        parser.assert_not_called()
+        assert init.call_args[0][1:8] == (
+            repo_dir, self.STORED['changelog_urls'], 'stored', 'main', ['feat'], self.STORED['reviewers'],
+            self.STORED['inputs']
+        )
+
+    @pytest.mark.parametrize(['args'], [[[]], [['-p', 'cloudbuild=yes']]])
+    def test_git_engine(self, mocker: MockerFixture, repo_dir: Path, sync: MagicMock, args: List[str]) -> None:
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=self.PARSED)
+        init = mocker.spy(AssetManager, '__init__')
+        result = self.run([repo_dir.as_posix(), '--git-engine', 'plumbing'] + args)
+
+        assert result.exit_code == 0
+        assert init.call_args[0][8] == GitEngine.PLUMBING
+
+    def test_override(self, mocker: MockerFixture, repo_dir: Path, sync: MagicMock) -> None:
+        # 指定されたオプション以外は、保存されたパラメータを利用する
+        parser = mocker.spy(ParameterParser, '__init__')
+        _ = mocker.patch.object(ParameterParser, 'parse', return_value=self.PARSED)
+        init = mocker.spy(AssetManager, '__init__')
+        result = self.run([repo_dir.as_posix(), '-p', 'cloudbuild=yes'])
+
+        assert result.exit_code == 0
+        assert parser.call_args[0][1:4] == ('main', 'feat', '')
+        # オプションで指定されていないパラメータは検証せず、保存された値を利用する
+        assert [c['name'] for c in parser.call_args[0][4]] == ['cloudbuild']
+        assert parser.call_args[0][5] == {'cloudbuild': 'yes'}
+        # レビュアーとリモートリポジトリの URL は保存された値
+        assert init.call_args[0][2] == self.STORED['changelog_urls']
+        assert init.call_args[0][6] == self.STORED['reviewers']
+        assert init.call_args[0][7] == {'languages': ['python'], 'code_reviewers': {}, 'cloudbuild': 'yes'}
+
+    def test_override_without_accounts(self, mocker: MockerFixture, tmpdir: LocalPath, repo_dir: Path,
+                                       sync: MagicMock) -> None:
+        # アカウント一覧に無いレビュアーが保存されていても、アカウントの検索を行わずに保存された値を利用する
+        code_reviewers = {'alice': {'display_name': 'alice', 'homepage': 'https://github.com/alice'}}
+        stored = dict(self.STORED, inputs=dict(self.STORED['inputs'], code_reviewers=code_reviewers))
+        RepoState(stored, {}).dump(repo_dir)
+        git.Repo(repo_dir).index.add([RepoState.FILE_NAME])
+        git.Repo(repo_dir).index.commit('stored reviewers')
+        mocker.patch.object(Accounts, 'FILE_PATH', Path(tmpdir.strpath).joinpath('no-accounts', 'accounts.json'))
+        mocker.patch.object(Accounts, 'DB_PATH', Path(tmpdir.strpath).joinpath('no-accounts', 'accounts.sqlite3'))
+        init = mocker.spy(AssetManager, '__init__')
+        result = self.run([repo_dir.as_posix(), '--production', 'master'])
+
+        assert result.exit_code == 0, result.output
+        assert init.call_args[0][4] == 'master'
+        assert init.call_args[0][7]['code_reviewers'] == code_reviewers
+
+    @pytest.mark.parametrize(
+        ['args', 'expected'],
+        [
+            [['--remote-repo-name', 'project/repo'], 'https://source.cloud.google.com/project/repo/+/{{hash}}'],
+            [['--remote-type', 'github', '--remote-repo-name', 'owner/repo'],
+             'https://github.com/owner/repo/commit/{{hash}}'],
+        ]
+    )
+    def test_remote_type(self, mocker: MockerFixture, repo_dir: Path, sync: MagicMock, args: List[str],
+                         expected: str) -> None:
+        # リモートリポジトリの種別が指定されていない場合は、保存された種別を利用する
+        stored = dict(self.STORED, changelog_urls={
+            'commitUrlFormat': 'https://source.cloud.google.com/project/old/+/{{hash}}',
+            'compareUrlFormat': 'https://source.cloud.google.com/project/old/+/refs/tags/{{currentTag}}'
+        })
+        RepoState(stored, {}).dump(repo_dir)
+        git.Repo(repo_dir).index.add([RepoState.FILE_NAME])
+        git.Repo(repo_dir).index.commit('gsr')
+        init = mocker.spy(AssetManager, '__init__')
+        result = self.run([repo_dir.as_posix()] + args)
+
+        assert result.exit_code == 0, result.output
+        assert init.call_args[0][2]['commitUrlFormat'] == expected
+
+    @pytest.mark.parametrize(['args', 'expected'], [[[], 'custom'], [['--theme', 'default'], 'default']])
+    def test_theme(self, mocker: MockerFixture, repo_dir: Path, themes: Path, args: List[str], expected: str) -> None:
+        # 前回の同期時のテーマを利用する
+        themes.joinpath('custom').mkdir(parents=True)
+        themes.joinpath('custom', 'manifest.yaml').write_bytes(
+            ManifestParser.THEMES.joinpath('default', 'manifest.yaml').read_bytes())
+        RepoState(self.STORED, {}, theme='custom').dump(repo_dir)
+        git.Repo(repo_dir).index.add([RepoState.FILE_NAME])
+        git.Repo(repo_dir).index.commit('custom theme')
+        init = mocker.spy(AssetManager, '__init__')
+        result = self.run([repo_dir.as_posix()] + args)
+
+        assert result.exit_code == 0
+        assert init.call_args[0][-1] == expected
+
+    def test_theme_not_found(self, repo_dir: Path, sync: MagicMock) -> None:
+        result = self.run([repo_dir.as_posix(), '--theme', 'not-exist'])
+
+        assert result.exit_code != 0
+        assert "Theme 'not-exist' not found." in result.output
+        sync.assert_not_called()
+
+    def test_not_synced(self, tmpdir: LocalPath, sync: MagicMock) -> None:
+        result = self.run([tmpdir.strpath])
+        assert result.exit_code != 0
+        assert RepoState.FILE_NAME in result.output
+        sync.assert_not_called()
+
+    def test_dirty(self, repo_dir: Path, sync: MagicMock) -> None:
+        repo_dir.joinpath(RepoState.FILE_NAME).write_text('{}')
+        result = self.run([repo_dir.as_posix()])
+        assert result.exit_code != 0
+        assert 'uncommitted changes' in result.output
+        sync.assert_not_called()
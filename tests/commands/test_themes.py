@@ -0,0 +1,48 @@
+from pathlib import Path
+from py._path.local import LocalPath
+from typing import List
+
+from click.testing import CliRunner, Result
+import git
+
+from create_github_project.__main__ import cli
+from create_github_project.commands import build
+
+
+class TestThemes:
+
+    @staticmethod
+    def run(cmd: str, args: List[str]) -> Result:
+        build(cli)
+        runner = CliRunner()
+        return runner.invoke(cli, ['themes', cmd] + args)
+
+    def test_list(self, themes: Path) -> None:
+        themes.joinpath('custom').mkdir(parents=True)
+        themes.joinpath('custom', 'manifest.yaml').write_text('inputs: [')
+        result = self.run('list', [])
+
+        assert result.exit_code == 0
+        assert '- name   : default\n  origin : package\n' in result.output
+        assert '  inputs : languages, code_reviewers, cloudbuild\n' in result.output
+        assert '- name   : custom\n  origin : user\n' in result.output
+        assert '(invalid manifest)' in result.output
+
+    def test_fetch(self, tmpdir: LocalPath) -> None:
+        repo = git.Repo.init(Path(tmpdir.strpath).joinpath('remote'))
+        Path(repo.working_tree_dir).joinpath('manifest.yaml').write_text('inputs: []\nassets: []\nfollowUps: []\n')
+        repo.index.add(['manifest.yaml'])
+        sha = repo.index.commit('initial commit').hexsha
+        spec = f'{repo.working_tree_dir}@HEAD'
+
+        result = self.run('fetch', [spec])
+        assert result.exit_code == 0
+        assert f'Fetched {spec} ({sha}).' in result.output
+
+        result = self.run('list', [])
+        assert f'- name   : {spec}\n  origin : pack\n' in result.output
+
+    def test_fetch_error(self, tmpdir: LocalPath) -> None:
+        result = self.run('fetch', [f'{tmpdir.strpath}/not-exist@HEAD'])
+        assert result.exit_code != 0
+        assert 'Failed to fetch' in result.output
@@ -0,0 +1,122 @@
+from pathlib import Path
+from py._path.local import LocalPath
+from typing import List
+
+from click.testing import CliRunner, Result
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+from create_github_project.__main__ import cli
+from create_github_project.commands import build
+from create_github_project.manifest import ManifestParser
+
+
+class TestValidate:
+
+    MANIFEST = '\n'.join([
+        'inputs:',
+        '  - name: languages',
+        '    type: checkbox',
+        '    title: "Languages?"',
+        '    choices: [java, python]',
+        '    default: []',
+        '  - name: unknown',
+        '    type: radio',
+        '    title: "Unknown?"',
+        'assets:',
+        '  - name: assets/ok',
+        '    to: /',
+        '  - name: assets/broken',
+        '    if: "{{ \'java\' in inputs.languages }}"',
+        '    to: /',
+        '  - name: assets/missing',
+        '    to: /',
+        'followUps: []',
+    ])
+
+    @staticmethod
+    def run(args: List[str]) -> Result:
+        build(cli)
+        runner = CliRunner()
+        return runner.invoke(cli, ['validate'] + args)
+
+    @pytest.fixture
+    def theme_dir(self, mocker: MockerFixture, tmpdir: LocalPath) -> Path:
+        themes = Path(tmpdir.strpath).joinpath('themes')
+        theme = themes.joinpath('broken')
+        theme.joinpath('assets/ok').mkdir(parents=True)
+        theme.joinpath('assets/ok/README.md.jinja').write_text('{{ repo_name }}\n')
+        theme.joinpath('assets/broken/sub').mkdir(parents=True)
+        theme.joinpath('assets/broken/a.txt.jinja').write_text('{% if x %}\n')
+        # 配置対象外のテンプレートも検証する
+        theme.joinpath('assets/broken/sub/EXCLUDE-b.txt.jinja').write_text('{{ x }\n')
+        theme.joinpath('manifest.yaml').write_text(self.MANIFEST)
+        _ = mocker.patch.object(ManifestParser, 'THEMES', themes)
+        yield themes
+
+    @pytest.fixture
+    def spec(self, tmpdir: LocalPath) -> Path:
+        spec = Path(tmpdir.strpath).joinpath('specs.yaml')
+        spec.write_text('\n'.join([
+            '- repo_dir: repo1',
+            '  production: main',
+            '  parameters: {languages: [python]}',
+            '- repo_dir: repo2',
+            '  production: foo',
+            '  parameters: {languages: [cobol], cloudbuild: maybe, other: x}',
+            '- repo_dir: repo3',
+            '  remote_type: gsr',
+            '- repo_dir: repo4',
+            '  remote_repo_name: invalid',
+        ]))
+        yield spec
+
+    @pytest.mark.parametrize('jobs', ['1', '2'])
+    def test_ok(self, jobs: str) -> None:
+        result = self.run(['--jobs', jobs])
+
+        assert result.exit_code == 0
+        assert 'No problems found.' in result.output
+
+    def test_theme_not_found(self) -> None:
+        result = self.run(['--theme', 'not-exist'])
+
+        assert result.exit_code == 1
+        assert '[ERROR] Theme `not-exist` not found.' in result.output
+
+    @pytest.mark.parametrize('jobs', ['1', '2'])
+    def test_theme(self, theme_dir: Path, jobs: str) -> None:
+        result = self.run(['--theme', 'broken', '--jobs', jobs])
+
+        assert result.exit_code == 1
+        assert "[ERROR] input 'unknown': Parameter type `radio` is not supported." in result.output
+        assert "[ERROR] asset 'assets/missing': directory not found." in result.output
+        # 条件に依らず全てのテンプレートを検証する
+        assert '[ERROR] template assets/broken/a.txt.jinja:' in result.output
+        assert '[ERROR] template assets/broken/sub/EXCLUDE-b.txt.jinja:1:' in result.output
+        assert 'README.md.jinja' not in result.output
+        assert 'Error: 4 problems found.' in result.output
+        # リポジトリは作成しない
+        assert not theme_dir.joinpath('broken/repo1').exists()
+
+    def test_spec(self, spec: Path) -> None:
+        result = self.run(['--spec', spec.as_posix()])
+
+        assert result.exit_code == 1
+        assert 'repo1' not in result.output
+        assert "[ERROR] spec #2 (repo2): 'production': 'foo' is not one of 'master', 'main'" in result.output
+        assert "[ERROR] spec #2 (repo2): 'languages':" in result.output
+        assert "[ERROR] spec #2 (repo2): 'cloudbuild':" in result.output
+        assert "[ERROR] spec #2 (repo2): 'other': Unknown parameter." in result.output
+        assert "[ERROR] spec #3 (repo3): 'remote_repo_name' is required for gsr." in result.output
+        assert "[ERROR] spec #4 (repo4): 'remote_repo_name':" in result.output
+        assert 'Error: 6 problems found.' in result.output
+        assert not Path('repo1').exists()
+
+    def test_invalid_spec(self, tmpdir: LocalPath) -> None:
+        spec = Path(tmpdir.strpath).joinpath('specs.yaml')
+        spec.write_text('- production: main\n')
+        result = self.run(['--spec', spec.as_posix()])
+
+        assert result.exit_code == 1
+        assert "[ERROR] spec: Spec #1 has no 'repo_dir'." in result.output
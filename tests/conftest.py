@@ -1,3 +1,4 @@
+from pathlib import Path
 import sys
 from unittest.mock import MagicMock
 
@@ -7,8 +8,111 @@ from pytest_mock import MockFixture
 
 sys.path.insert(0, '../src')
 
+from create_github_project.assets.asset_index import AssetIndex  # noqa: E402
+from create_github_project.assets.blob_store import BlobStore  # noqa: E402
+from create_github_project.assets.template_cache import TemplateCache  # noqa: E402
+from create_github_project.manifest import ManifestParser  # noqa: E402
+from create_github_project.manifest.manifest_cache import ManifestCache  # noqa: E402
+from create_github_project.manifest.theme_packs import ThemePacks  # noqa: E402
+from create_github_project.manifest.theme_registry import ThemeRegistry  # noqa: E402
+from create_github_project.utils.github_users import GitHubUsers  # noqa: E402
+
 
 @pytest.fixture(autouse=True)
 def github_get_user(mocker: MockFixture) -> MagicMock:
     m = mocker.patch.object(Github, 'get_user')
     yield m
+
+
+@pytest.fixture
+def cache_dir(tmpdir_factory: pytest.TempdirFactory) -> Path:
+    # リポジトリの作成先に含まれないよう、テスト毎の一時ディレクトリとは別に作成する
+    yield Path(tmpdir_factory.mktemp('cache').strpath)
+
+
+@pytest.fixture(autouse=True)
+def template_cache(cache_dir: Path) -> Path:
+    # 上書き対象
+    directory = TemplateCache.DIRECTORY
+
+    # 上書き
+    TemplateCache.DIRECTORY = cache_dir.joinpath('templates')
+    TemplateCache.clear()
+    yield TemplateCache.DIRECTORY
+
+    # 復元
+    TemplateCache.DIRECTORY = directory
+    TemplateCache.clear()
+
+
+@pytest.fixture(autouse=True)
+def manifest_cache(cache_dir: Path) -> Path:
+    # 上書き対象
+    directory = ManifestCache.DIRECTORY
+
+    # 上書き
+    ManifestCache.DIRECTORY = cache_dir.joinpath('manifests')
+    yield ManifestCache.DIRECTORY
+
+    # 復元
+    ManifestCache.DIRECTORY = directory
+
+
+@pytest.fixture(autouse=True)
+def blob_store(cache_dir: Path) -> Path:
+    # 上書き対象
+    directory = BlobStore.DIRECTORY
+
+    # 上書き
+    BlobStore.DIRECTORY = cache_dir.joinpath('blobs')
+    yield BlobStore.DIRECTORY
+
+    # 復元
+    BlobStore.DIRECTORY = directory
+
+
+@pytest.fixture(autouse=True)
+def asset_index(cache_dir: Path) -> Path:
+    # 上書き対象
+    directory = AssetIndex.DIRECTORY
+
+    # 上書き
+    AssetIndex.DIRECTORY = cache_dir.joinpath('indexes')
+    AssetIndex.clear()
+    yield AssetIndex.DIRECTORY
+
+    # 復元
+    AssetIndex.DIRECTORY = directory
+    AssetIndex.clear()
+
+
+@pytest.fixture(autouse=True)
+def github_users(cache_dir: Path) -> Path:
+    # 上書き対象
+    path = GitHubUsers.CACHE_PATH
+
+    # 上書き
+    GitHubUsers.CACHE_PATH = cache_dir.joinpath('github_users.json')
+    yield GitHubUsers.CACHE_PATH
+
+    # 復元
+    GitHubUsers.CACHE_PATH = path
+
+
+@pytest.fixture(autouse=True)
+def themes(cache_dir: Path) -> Path:
+    # 上書き対象
+    user_themes = ManifestParser.USER_THEMES
+    index_path = ThemeRegistry.INDEX_PATH
+    packs = ThemePacks.DIRECTORY
+
+    # 上書き
+    ManifestParser.USER_THEMES = cache_dir.joinpath('user_themes')
+    ThemeRegistry.INDEX_PATH = cache_dir.joinpath('themes.json')
+    ThemePacks.DIRECTORY = cache_dir.joinpath('theme_packs')
+    yield ManifestParser.USER_THEMES
+
+    # 復元
+    ManifestParser.USER_THEMES = user_themes
+    ThemeRegistry.INDEX_PATH = index_path
+    ThemePacks.DIRECTORY = packs
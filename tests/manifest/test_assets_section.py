@@ -15,7 +15,7 @@ from create_github_project.manifest.assets_section import AssetsSection
             ],
             {},
             [
-                {'source': 'asset1', 'destination': '/'},
+                {'source': 'asset1', 'destination': '/', 'normalize_newline': False},
             ]
         ],
         # case2
@@ -26,8 +26,8 @@ from create_github_project.manifest.assets_section import AssetsSection
             ],
             {},
             [
-                {'source': 'asset1', 'destination': '/'},
-                {'source': 'asset2', 'destination': '/'},
+                {'source': 'asset1', 'destination': '/', 'normalize_newline': False},
+                {'source': 'asset2', 'destination': '/', 'normalize_newline': False},
             ]
         ],
         # case3
@@ -43,7 +43,19 @@ from create_github_project.manifest.assets_section import AssetsSection
                 }
             },
             [
-                {'source': 'asset1', 'destination': '/'},
+                {'source': 'asset1', 'destination': '/', 'normalize_newline': False},
+            ]
+        ],
+        # case4
+        [
+            [
+                {'name': 'asset1', 'to': '/', 'normalizeNewline': True},
+                {'name': 'asset2', 'to': '/', 'normalizeNewline': False},
+            ],
+            {},
+            [
+                {'source': 'asset1', 'destination': '/', 'normalize_newline': True},
+                {'source': 'asset2', 'destination': '/', 'normalize_newline': False},
             ]
         ],
     ]
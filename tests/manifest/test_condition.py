@@ -0,0 +1,45 @@
+import pickle
+from typing import Dict, Union
+
+from jinja2 import TemplateSyntaxError
+import pytest
+
+from create_github_project.manifest.condition import Condition
+
+
+class TestCondition:
+
+    @pytest.mark.parametrize(
+        ['source', 'params', 'expect'],
+        [
+            # no condition
+            [None, {}, True],
+            # expression
+            ["{{ 'python' in inputs.languages }}", {'inputs': {'languages': ['python']}}, True],
+            ["{{ 'python' in inputs.languages }}", {'inputs': {'languages': ['java']}}, False],
+            ['{{ inputs.var == "yes" }}', {'inputs': {'var': 'yes'}}, True],
+            ['{{ inputs.var == "yes" }}', {'inputs': {'var': 'no'}}, False],
+            # undefined variable
+            ['{{ inputs.var == "yes" }}', {'inputs': {}}, False],
+            # non-bool result
+            ['{{ inputs.var }}', {'inputs': {'var': 'no'}}, False],
+            ['{{ inputs.var }}', {'inputs': {'var': 'yes'}}, False],
+            ['{{ inputs.languages }}', {'inputs': {'languages': ['python']}}, False],
+            ['{{ inputs.count }}', {'inputs': {'count': 1}}, False],
+            ['{{ inputs.var }}', {'inputs': {'var': True}}, True],
+            ['{{ inputs.var }}', {'inputs': {'var': 'True'}}, True],
+            # plain template
+            ['True', {}, True],
+            ['{{ inputs.x }}{{ inputs.y }}', {'inputs': {'x': 'Tr', 'y': 'ue'}}, True],
+            ['{% if inputs.x %}True{% endif %}', {'inputs': {'x': False}}, False],
+        ]
+    )
+    def test_evaluate(self, source: Union[str, None], params: Dict[str, object], expect: bool) -> None:
+        condition = Condition(source)
+        assert condition.evaluate(**params) is expect
+        # compiled expression survives pickling
+        assert pickle.loads(pickle.dumps(condition)).evaluate(**params) is expect
+
+    def test_syntax_error(self) -> None:
+        with pytest.raises(TemplateSyntaxError):
+            Condition('{{ inputs.var == }}')
@@ -107,3 +107,10 @@ class TestInputsSection:
 
         with pytest.raises(ValueError):
             inputs.get_config(key)
+
+    def test_duplicated_name(self) -> None:
+        with pytest.raises(ValueError):
+            InputsSection([
+                {'name': 'param1', 'type': 'select'},
+                {'name': 'param1', 'type': 'checkbox'},
+            ])
@@ -3,9 +3,11 @@ from py._path.local import LocalPath
 from typing import Dict, List
 
 import pytest
+from pytest_mock import MockerFixture
 import yaml
 
 from create_github_project.manifest import ManifestParser
+from create_github_project.manifest.manifest_cache import ManifestCache
 
 
 class TestManifestParser:
@@ -198,3 +200,36 @@ class TestManifestParser:
 
         actual = mp.get_follow_up(2, 'master', ['feat', 'fix'], [], input_params)
         assert expect == actual
+
+    def test_cache(self, mocker: MockerFixture, manifest_cache: Path) -> None:
+        inputs = [{'name': 'param1', 'type': 'select'}]
+        follow_ups = [{'content': 'content1', 'if': '{{ inputs.param1 == "yes" }}'}]
+        self.create_theme_file(inputs, [], follow_ups)
+        ManifestParser(self.THEME_NAME)
+        assert len(list(manifest_cache.iterdir())) == 1
+
+        # parsed manifest is loaded from cache
+        load = mocker.spy(yaml, 'load')
+        mp = ManifestParser(self.THEME_NAME)
+        load.assert_not_called()
+        assert mp.get_parameter_names() == ['param1']
+        assert mp.get_follow_up(0, 'master', [], [], {'param1': 'yes'}) == 'content1'
+
+        # cache is invalidated on update
+        self.create_theme_file(inputs + [{'name': 'param2', 'type': 'select'}], [], follow_ups)
+        mp = ManifestParser(self.THEME_NAME)
+        load.assert_called_once()
+        assert mp.get_parameter_names() == ['param1', 'param2']
+        assert len(list(manifest_cache.iterdir())) == 2
+
+    def test_cache_format(self, mocker: MockerFixture, manifest_cache: Path) -> None:
+        self.create_theme_file([{'name': 'param1', 'type': 'select'}], [], [])
+        ManifestParser(self.THEME_NAME)
+
+        # cache written in another format is not loaded
+        _ = mocker.patch.object(ManifestCache, 'FORMAT', ManifestCache.FORMAT + 1)
+        load = mocker.spy(yaml, 'load')
+        mp = ManifestParser(self.THEME_NAME)
+        load.assert_called_once()
+        assert mp.get_parameter_names() == ['param1']
+        assert len(list(manifest_cache.iterdir())) == 2
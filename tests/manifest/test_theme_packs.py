@@ -0,0 +1,146 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+from py._path.local import LocalPath
+import shutil
+import time
+from typing import Dict
+
+import git
+import pytest
+from pytest_mock import MockerFixture
+
+from create_github_project.manifest import ManifestParser
+from create_github_project.manifest.theme_packs import ThemePacks
+
+MANIFEST = '\n'.join([
+    'inputs:',
+    '  - name: param1',
+    '    type: select',
+    '    choices: [a, b]',
+    'assets:',
+    '  - name: assets',
+    '    to: /',
+    'followUps: []',
+])
+
+
+class TestThemePacks:
+
+    @pytest.fixture
+    def remote(self, tmpdir: LocalPath) -> Path:
+        # リモートリポジトリの代わりに、ローカルの bare リポジトリを利用する
+        root = Path(tmpdir.strpath)
+        work = git.Repo.init(root.joinpath('work'))
+        work_dir = Path(work.working_tree_dir)
+        work_dir.joinpath('assets').mkdir()
+        work_dir.joinpath('manifest.yaml').write_text(MANIFEST)
+        work_dir.joinpath('assets', 'README.md.jinja').write_text('{{ repo_name }}\n')
+        work.index.add(['manifest.yaml', 'assets/README.md.jinja'])
+        work.index.commit('v1')
+        work.create_tag('v1')
+        work_dir.joinpath('assets', 'README.md.jinja').write_text('# {{ repo_name }}\n' + 'x' * 1024)
+        work.index.add(['assets/README.md.jinja'])
+        work.index.commit('v2')
+        work.create_tag('v2')
+
+        bare = root.joinpath('remote.git')
+        git.Repo.init(bare, bare=True)
+        work.git.push(bare.as_posix(), '--all')
+        work.git.push(bare.as_posix(), '--tags')
+        yield bare
+
+    def test_split(self) -> None:
+        assert ThemePacks.split('https://example.com/themes.git@v1') == ('https://example.com/themes.git', 'v1')
+        assert ThemePacks.split('git@example.com:org/themes.git@release/v1') == (
+            'git@example.com:org/themes.git', 'release/v1'
+        )
+        assert ThemePacks.split('git@example.com:org/themes.git') is None
+        assert ThemePacks.split('default') is None
+
+    def test_fetch(self, remote: Path) -> None:
+        spec = f'{remote.as_posix()}@v1'
+        sha, evicted = ThemePacks.fetch(spec)
+
+        assert sha == git.Repo(remote).commit('v1').hexsha
+        assert evicted == []
+        path = ThemePacks.DIRECTORY.joinpath(sha)
+        assert ThemePacks.resolve(spec) == path
+        assert path.joinpath('manifest.yaml').is_file()
+        assert not path.joinpath('.git').exists()
+        # 一時ディレクトリは残さない
+        assert {p.name for p in ThemePacks.DIRECTORY.iterdir()} == {sha, 'index.json', 'index.json.lock'}
+
+        # 取得後は、リモートリポジトリに接続せずに利用する
+        shutil.rmtree(remote)
+        mp = ManifestParser(spec)
+        assert mp.get_parameter_names() == ['param1']
+        assert mp.get_source('assets') == path.joinpath('assets')
+        assert spec in ManifestParser.registry().names()
+
+    def test_fetch_same_commit(self, remote: Path) -> None:
+        sha1, _ = ThemePacks.fetch(f'{remote.as_posix()}@v2')
+        sha2, _ = ThemePacks.fetch(f'{remote.as_posix()}@HEAD')
+
+        assert sha1 == sha2
+        assert list(ThemePacks.snapshots().values()) == [ThemePacks.DIRECTORY.joinpath(sha1)] * 2
+
+    def test_fetch_concurrent(self, mocker: MockerFixture, remote: Path) -> None:
+        # 名前と SHA-1 の対応の読み込みから保存までの間に、他の取得処理が割り込む状況を作る
+        load_index = ThemePacks._load_index
+
+        def slow_load_index() -> Dict[str, Dict[str, object]]:
+            index = load_index()
+            time.sleep(0.1)
+            return index
+        _ = mocker.patch.object(ThemePacks, '_load_index', side_effect=slow_load_index)
+        specs = [f'{remote.as_posix()}@{ref}' for ref in ['v1', 'v2', 'HEAD', 'refs/tags/v1']]
+
+        with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+            shas = list(executor.map(ThemePacks.fetch, specs))
+
+        # 同時に取得した場合も、全ての対応を保存する
+        assert set(ThemePacks.snapshots().keys()) == set(specs)
+        assert {spec: ThemePacks.resolve(spec) for spec in specs} == {
+            spec: ThemePacks.DIRECTORY.joinpath(sha) for spec, (sha, _) in zip(specs, shas)
+        }
+
+    def test_not_fetched(self, remote: Path) -> None:
+        assert ThemePacks.resolve(f'{remote.as_posix()}@v1') is None
+        with pytest.raises(FileNotFoundError):
+            ManifestParser(f'{remote.as_posix()}@v1')
+
+    @pytest.mark.parametrize(['spec', 'message'], [
+        ['{remote}@not-exist', 'Failed to fetch'],
+        ['{remote}', 'Theme pack must be'],
+    ])
+    def test_fetch_error(self, remote: Path, spec: str, message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            ThemePacks.fetch(spec.format(remote=remote.as_posix()))
+        assert not [p for p in ThemePacks.DIRECTORY.glob('*') if not p.name.startswith('index.json')]
+
+    def test_not_theme(self, tmpdir: LocalPath) -> None:
+        repo = git.Repo.init(Path(tmpdir.strpath).joinpath('not-theme'))
+        Path(repo.working_tree_dir).joinpath('README.md').write_text('readme\n')
+        repo.index.add(['README.md'])
+        repo.index.commit('initial commit')
+
+        with pytest.raises(ValueError, match='manifest.yaml is not found'):
+            ThemePacks.fetch(f'{repo.working_tree_dir}@HEAD')
+        assert [p.name for p in ThemePacks.DIRECTORY.glob('*')] == ['index.json.lock']
+
+    def test_evict(self, mocker: MockerFixture, remote: Path) -> None:
+        _ = mocker.patch.object(ThemePacks, 'MAX_SIZE', 1024)
+        v1 = f'{remote.as_posix()}@v1'
+        v2 = f'{remote.as_posix()}@v2'
+        sha1, _ = ThemePacks.fetch(v1)
+        # 最後に利用した日時が古いものから削除する
+        os.utime(ThemePacks.DIRECTORY.joinpath(sha1), (0, 0))
+
+        sha2, evicted = ThemePacks.fetch(v2)
+
+        assert evicted == [sha1]
+        assert not ThemePacks.DIRECTORY.joinpath(sha1).exists()
+        assert ThemePacks.resolve(v1) is None
+        # 上限を超えていても、取得したものは削除しない
+        assert ThemePacks.resolve(v2) == ThemePacks.DIRECTORY.joinpath(sha2)
@@ -0,0 +1,121 @@
+from pathlib import Path
+from py._path.local import LocalPath
+from typing import Dict
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from create_github_project.manifest import ManifestParser
+from create_github_project.manifest.theme_registry import ThemeRegistry
+
+MANIFEST = '\n'.join([
+    'inputs:',
+    '  - name: param1',
+    '    type: select',
+    '    choices: [a, b]',
+    'assets:',
+    '  - name: "@core"',
+    '    to: /',
+    'followUps: []',
+])
+
+
+class TestThemeRegistry:
+
+    @pytest.fixture
+    def dirs(self, tmpdir: LocalPath) -> Dict[str, Path]:
+        root = Path(tmpdir.strpath)
+        dirs = {
+            'package': root.joinpath('package'),
+            'user': root.joinpath('user'),
+            'ep': root.joinpath('ep'),
+        }
+        for origin, names in [('package', ['default', 'shared']), ('user', ['shared', 'custom']), ('ep', ['plugin'])]:
+            for name in names:
+                dirs[origin].joinpath(name).mkdir(parents=True)
+                dirs[origin].joinpath(name, 'manifest.yaml').write_text(MANIFEST)
+        # マニフェストファイルが無いディレクトリはテーマとみなさない
+        dirs['user'].joinpath('empty').mkdir()
+        yield dirs
+
+    @pytest.fixture
+    def entry_points(self, mocker: MockerFixture, dirs: Dict[str, Path]) -> MagicMock:
+        ep = MagicMock()
+        ep.load.return_value = dirs['ep'].joinpath('plugin').as_posix()
+        broken = MagicMock()
+        broken.load.side_effect = ImportError('broken')
+        _ = mocker.patch.object(ThemeRegistry, '_entry_points', return_value={'plugin': ep, 'broken': broken})
+        yield ep
+
+    @staticmethod
+    def registry(dirs: Dict[str, Path]) -> ThemeRegistry:
+        return ThemeRegistry([('package', dirs['package']), ('user', dirs['user'])])
+
+    def test_names(self, dirs: Dict[str, Path], entry_points: MagicMock) -> None:
+        assert self.registry(dirs).names() == ['default', 'shared', 'custom', 'broken', 'plugin']
+
+    @pytest.mark.parametrize(
+        ['name', 'origin'],
+        [
+            ['default', 'package'],
+            # 同名のテーマは、先に見つかったものを利用する
+            ['shared', 'package'],
+            ['custom', 'user'],
+        ]
+    )
+    def test_find(self, dirs: Dict[str, Path], entry_points: MagicMock, name: str, origin: str) -> None:
+        assert self.registry(dirs).find(name) == dirs[origin].joinpath(name)
+        # entry point は読み込まない
+        entry_points.load.assert_not_called()
+
+    def test_find_entry_point(self, dirs: Dict[str, Path], entry_points: MagicMock) -> None:
+        assert self.registry(dirs).find('plugin') == dirs['ep'].joinpath('plugin')
+        entry_points.load.assert_called_once()
+
+    @pytest.mark.parametrize(['name'], [['not-exist'], ['empty'], ['broken'], ['../user/custom'], ['..'], ['']])
+    def test_find_not_found(self, dirs: Dict[str, Path], entry_points: MagicMock, name: str) -> None:
+        with pytest.raises(FileNotFoundError):
+            self.registry(dirs).find(name)
+
+    def test_index(self, mocker: MockerFixture, dirs: Dict[str, Path], entry_points: MagicMock) -> None:
+        dirs['user'].joinpath('custom', 'manifest.yaml').write_text('inputs: [')
+        infos = self.registry(dirs).index()
+
+        assert [(i.name, i.origin, i.path) for i in infos] == [
+            ('default', 'package', dirs['package'].joinpath('default')),
+            ('shared', 'package', dirs['package'].joinpath('shared')),
+            ('custom', 'user', dirs['user'].joinpath('custom')),
+            ('plugin', 'entry point', dirs['ep'].joinpath('plugin')),
+        ]
+        assert (infos[0].inputs, infos[0].assets) == (['param1'], ['@core'])
+        assert (infos[2].inputs, infos[2].assets) == (None, None)
+
+    def test_index_cached(self, mocker: MockerFixture, dirs: Dict[str, Path], entry_points: MagicMock) -> None:
+        _ = self.registry(dirs).index()
+
+        # マニフェストファイルが更新されない限り、読み込まない
+        read = mocker.spy(ThemeRegistry, '_read_metadata')
+        _ = self.registry(dirs).index()
+        read.assert_not_called()
+
+        dirs['package'].joinpath('default', 'manifest.yaml').write_text(MANIFEST.replace('param1', 'param10'))
+        infos = self.registry(dirs).index()
+        assert read.call_count == 1
+        assert infos[0].inputs == ['param10']
+
+
+class TestManifestParserTheme:
+
+    def test_user_theme(self, themes: Path) -> None:
+        themes.joinpath('custom').mkdir(parents=True)
+        themes.joinpath('custom', 'manifest.yaml').write_text(MANIFEST)
+
+        mp = ManifestParser('custom')
+        assert mp.theme == 'custom'
+        assert mp.get_parameter_names() == ['param1']
+        assert mp.get_source('@core') == ManifestParser.COMPONENTS.joinpath('core')
+
+    def test_not_found(self) -> None:
+        with pytest.raises(FileNotFoundError):
+            ManifestParser('not-exist')
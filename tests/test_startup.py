@@ -0,0 +1,60 @@
+import os
+from pathlib import Path
+from py._path.local import LocalPath
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+import create_github_project
+
+#: 軽量なサブコマンドで import されるべきでないライブラリ
+HEAVY_MODULES = ['github', 'git', 'questionary', 'prompt_toolkit', 'jinja2', 'pip', 'yaml']
+
+
+def import_times(args: List[str], home: Path) -> Dict[str, int]:
+    """`python -X importtime` で CLI を実行し、import されたモジュールと累積の import 時間 (μs) を返す。
+    """
+    env = dict(os.environ,
+               HOME=home.as_posix(),
+               PYTHONPATH=Path(create_github_project.__file__).parent.parent.as_posix())
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'create_github_project'] + args,
+                            env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+
+    times = {}
+    for line in result.stderr.decode().splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    ['args'],
+    [
+        [['versions', 'current']],
+        [['accounts', 'list']],
+    ]
+)
+def test_startup(tmpdir: LocalPath, args: List[str]) -> None:
+    times = import_times(args, Path(tmpdir.strpath))
+
+    total = sum(t for name, t in times.items() if '.' not in name)
+    print(f"\n[{' '.join(args)}] import time: {total / 1000:.1f}ms")
+
+    imported = {name.split('.')[0] for name in times.keys()}
+    assert imported.isdisjoint(HEAVY_MODULES)
+
+
+def test_non_interactive(tmpdir: LocalPath) -> None:
+    # 対話的な入力を行わない場合は、prompt のライブラリを import しない
+    root = Path(tmpdir.strpath)
+    times = import_times(['init', root.joinpath('repo').as_posix(), '--non-interactive', '--output-format', 'dir',
+                          '--production', 'master', '--commit-types', 'feat', '--reviewers', '',
+                          '-p', 'languages=', '-p', 'code_reviewers=', '-p', 'cloudbuild=yes'], root)
+
+    assert root.joinpath('repo', 'README.md').exists()
+    imported = {name.split('.')[0] for name in times.keys()}
+    assert imported.isdisjoint(['questionary', 'prompt_toolkit'])
@@ -1,17 +1,25 @@
+from concurrent.futures import ProcessPoolExecutor
 from io import StringIO
 import json
+import multiprocessing
 from pathlib import Path
 from py._path.local import LocalPath
 from typing import Dict, List, Union
 from unittest.mock import MagicMock
 
-from github import NamedUser
+from github import Github, GithubException, NamedUser, UnknownObjectException
 import pytest
 from pytest import CaptureFixture
 from pytest_mock import MockerFixture
 import yaml
 
 from create_github_project.utils import Accounts
+from create_github_project.utils import account_stores
+from create_github_project.utils.github_users import GitHubUsers
+
+
+def add_account(account_id: str) -> None:
+    Accounts().add(account_id, account_id)
 
 
 class TestAccountsClass:
@@ -21,10 +29,11 @@ class TestAccountsClass:
 
     @pytest.fixture(autouse=True)
     def filepath(self, tmpdir: LocalPath):
-        old_path = Accounts.FILE_PATH
+        old_path, old_db_path = Accounts.FILE_PATH, Accounts.DB_PATH
         Accounts.FILE_PATH = Path(tmpdir.strpath).joinpath('accounts.json')
+        Accounts.DB_PATH = Path(tmpdir.strpath).joinpath('accounts.sqlite3')
         yield
-        Accounts.FILE_PATH = old_path
+        Accounts.FILE_PATH, Accounts.DB_PATH = old_path, old_db_path
 
     @staticmethod
     def create_config_file(data: Dict[str, Dict[str, str]]) -> None:
@@ -173,13 +182,58 @@ class TestAccountsClass:
         self.create_config_file({})
 
         # mocked github object
-        github_get_user.side_effect = Exception
+        github_get_user.side_effect = UnknownObjectException(404, {}, {})
 
         # execute
         homepage = Accounts().add(self.USER1, 'USER1')
 
         github_get_user.assert_called_once_with(self.USER1)
         assert homepage is None
+        assert not Accounts().exists(self.USER1)
+
+    def test_add_error(self, github_get_user: MagicMock) -> None:
+        self.create_config_file({})
+
+        # 存在しない場合以外のエラー (レート制限など) は呼び出し元に通知する
+        github_get_user.side_effect = GithubException(403, {}, {})
+        with pytest.raises(GithubException):
+            Accounts().add(self.USER1, 'USER1')
+
+    def test_add_many(self, mocker: MockerFixture, github_get_user: MagicMock) -> None:
+        self.create_config_file({
+            self.USER1: {
+                'display_name': 'USER1',
+                'homepage': 'https://github.com/' + self.USER1
+            }
+        })
+        github_init = mocker.spy(Github, '__init__')
+
+        def get_user(account_id: str) -> NamedUser:
+            if account_id == 'missing':
+                raise UnknownObjectException(404, {}, {})
+            user = mocker.Mock(spec=NamedUser)
+            user.html_url = 'https://github.com/' + account_id
+            return user
+        github_get_user.side_effect = get_user
+
+        result = Accounts().add_many({self.USER1: 'USER1', self.USER2: 'USER2', 'missing': 'missing'}, 'token')
+
+        assert result == {self.USER1: None, self.USER2: 'https://github.com/' + self.USER2, 'missing': None}
+        assert {c[0][0] for c in github_get_user.call_args_list} == {self.USER2, 'missing'}
+        assert github_init.call_args[1]['auth'].token == 'token'
+        assert set(Accounts().list()) == {self.USER1, self.USER2}
+
+    def test_add_cached(self, mocker: MockerFixture, github_get_user: MagicMock) -> None:
+        self.create_config_file({})
+        user = mocker.Mock(spec=NamedUser)
+        user.html_url = 'https://github.com/' + self.USER1
+        github_get_user.return_value = user
+
+        # 確認結果はキャッシュされ、再登録時は GitHub API を呼び出さない
+        assert Accounts().add(self.USER1, 'USER1') == user.html_url
+        Accounts().drop(self.USER1)
+        assert Accounts().add(self.USER1, 'USER1') == user.html_url
+        github_get_user.assert_called_once_with(self.USER1)
 
     def test_drop_ok(self) -> None:
         self.create_config_file({
@@ -206,3 +260,90 @@ class TestAccountsClass:
 
         result = Accounts().get_account_info('github')
         assert info == result
+
+    def test_read_cache(self, mocker: MockerFixture) -> None:
+        self.create_config_file({})
+        load = mocker.spy(account_stores.json, 'load')
+
+        # ファイルが更新されない限り、読み込みは 1 度のみ
+        Accounts()
+        Accounts()
+        assert load.call_count == 1
+
+        self.create_config_file({'github': {'display_name': 'GitHub', 'homepage': 'https://github.com/github'}})
+        assert Accounts().exists('github')
+        assert load.call_count == 2
+
+    def test_update_stale_instance(self, mocker: MockerFixture) -> None:
+        self.create_config_file({})
+        _ = mocker.patch.object(GitHubUsers, 'resolve', side_effect=lambda ids, *_: {
+            a: 'https://github.com/' + a for a in ids
+        })
+
+        # 他のインスタンスによる更新を失わない
+        first, second = Accounts(), Accounts()
+        first.add(self.USER1, 'USER1')
+        second.add(self.USER2, 'USER2')
+        assert set(Accounts().list()) == {self.USER1, self.USER2}
+
+        first.drop(self.USER1)
+        assert Accounts().list() == [self.USER2]
+
+    @pytest.mark.skipif(account_stores.fcntl is None, reason='fcntl is not available')
+    @pytest.mark.parametrize(['sqlite'], [[False], [True]])
+    def test_update_parallel(self, mocker: MockerFixture, sqlite: bool) -> None:
+        self.create_config_file({})
+        if sqlite:
+            Accounts().migrate()
+        # 子プロセスにも引き継ぐため、fork で起動する
+        _ = mocker.patch.object(GitHubUsers, 'resolve', side_effect=lambda ids, *_: {
+            a: 'https://github.com/' + a for a in ids
+        })
+        users = [f'user{i}' for i in range(32)]
+
+        with ProcessPoolExecutor(max_workers=8, mp_context=multiprocessing.get_context('fork')) as executor:
+            list(executor.map(add_account, users))
+
+        assert set(Accounts().list()) == set(users)
+        if not sqlite:
+            with open(Accounts.FILE_PATH, 'r') as f:
+                assert set(json.load(f).keys()) == set(users)
+
+    def test_migrate(self, mocker: MockerFixture) -> None:
+        accounts = {
+            account_id: {'display_name': account_id.upper(), 'homepage': 'https://github.com/' + account_id}
+            for account_id in ['bob', 'alice', 'alfred']
+        }
+        self.create_config_file(accounts)
+        _ = mocker.patch.object(GitHubUsers, 'resolve', side_effect=lambda ids, *_: {
+            a: 'https://github.com/' + a for a in ids
+        })
+
+        assert Accounts().migrate() == 3
+        with pytest.raises(FileExistsError):
+            Accounts().migrate()
+
+        # 移行後はデータベースを利用する
+        self.create_config_file({})
+        a = Accounts()
+        assert a.initialized()
+        assert a.count() == 3
+        assert a.list() == ['alfred', 'alice', 'bob']
+        assert a.exists('alice') and not a.exists('carol')
+        assert a.get_account_info('bob') == accounts['bob']
+        assert a.search('al') == ['alfred', 'alice']
+        assert a.search('') == ['alfred', 'alice', 'bob']
+
+        assert a.add('carol', 'CAROL') == 'https://github.com/carol'
+        a.drop('bob')
+        with pytest.raises(ValueError):
+            a.drop('bob')
+        assert Accounts().list() == ['alfred', 'alice', 'carol']
+
+    def test_search(self) -> None:
+        self.create_config_file({
+            account_id: {'display_name': account_id, 'homepage': 'https://github.com/' + account_id}
+            for account_id in ['bob', 'alice', 'alfred']
+        })
+        assert Accounts().search('al') == ['alfred', 'alice']
+        assert Accounts().search('x') == []
@@ -4,7 +4,7 @@ import pytest
 from pytest_mock import MockFixture
 from questionary import Question
 
-from create_github_project.utils import get_commit_types, get_languages, to_remote_urls
+from create_github_project.utils import get_commit_types, get_languages, to_option_value, to_remote_urls
 
 
 def test_get_commit_types() -> None:
@@ -27,6 +27,21 @@ def test_get_languages() -> None:
     }
 
 
+@pytest.mark.parametrize(
+    ['value', 'expect'],
+    [
+        [None, None],
+        ['main', 'main'],
+        [1, '1'],
+        [['feat', 'fix'], 'feat,fix'],
+        [[], ''],
+        [{'user1': {}, 'user2': {}}, 'user1,user2'],
+    ]
+)
+def test_to_option_value(value: object, expect: Union[str, None]) -> None:
+    assert to_option_value(value) == expect
+
+
 class TestToRemoteUrl:
 
     DEFAULT_REPO_NAME = 'owner/repo-name'